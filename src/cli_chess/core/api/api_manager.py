@@ -1,4 +1,5 @@
 from cli_chess.core.api.incoming_event_manger import IncomingEventManager
+from cli_chess.core.api.network_core import NetworkCore
 from cli_chess.utils.logging import log
 from berserk import Client, TokenSession
 from typing import Optional
@@ -7,21 +8,28 @@ required_token_scopes: set = {"board:play"}
 optional_token_scopes: set = {"challenge:write"}
 api_session: Optional[TokenSession]
 api_client: Optional[Client]
+api_network_core: Optional[NetworkCore]
 api_iem: Optional[IncomingEventManager]
 api_ready = False
 
 
 def _start_api(token: str, base_url: str):
-    """Handles creating a new API session, client, and IEM
-       when the API token has been updated. This generally
+    """Handles creating a new API session, client, network core
+       and IEM when the API token has been updated. This generally
        should only ever be called via the Token Manager on
        token verification.
     """
-    global api_session, api_client, api_iem, api_ready
+    global api_session, api_client, api_network_core, api_iem, api_ready
     try:
+        if api_ready:
+            api_iem.stop()
+            api_network_core.stop()
+
         api_session = TokenSession(token)
         api_client = Client(api_session, base_url)
-        api_iem = IncomingEventManager()
+        api_network_core = NetworkCore(token, base_url)
+        api_network_core.start()
+        api_iem = IncomingEventManager(api_network_core)
         api_iem.start()
         api_ready = True
     except Exception as e:
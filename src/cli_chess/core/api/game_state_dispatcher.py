@@ -1,8 +1,12 @@
 from cli_chess.utils import Event, EventTopics, log, retry
-from typing import Callable
-from threading import Thread
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional
 from enum import Enum, auto
 from types import MappingProxyType
+import statistics
+import time
+
+REQUEST_TIMEOUT = 10  # Seconds to wait on a board command response
 
 
 class GSDEventTopics(Enum):
@@ -18,91 +22,132 @@ gsd_type_to_event_dict = MappingProxyType({
 })
 
 
-class GameStateDispatcher(Thread):
+class GameStateDispatcher:
     """Handles streaming a game and sending game commands (make move, offer draw, etc)
        using the Board API. The game that is streamed using this class must be owned
-       by the account linked to the api token.
+       by the account linked to the api token. The stream and commands run on the
+       network core and events are handled on the network core's event delivery thread.
+       Board commands are sent over the network core's board connection pool, which is
+       kept warm while the game is streamed.
     """
     def __init__(self, game_id=""):
-        super().__init__()
         self.game_id = game_id
         self.is_game_over = False
         self.e_game_state_dispatcher_event = Event()
+        self.move_round_trips: List[float] = []  # Milliseconds from sending each move to its response
+        self.event_received_at: Optional[float] = None  # perf_counter() time the event being handled was received
+        self._stream_task: Optional[Future] = None
+        self._keep_warm_task: Optional[Future] = None
 
         try:
-            from cli_chess.core.api.api_manager import api_client
-            self.api_client = api_client
+            from cli_chess.core.api.api_manager import api_network_core
+            self.network_core = api_network_core
         except ImportError:
             # TODO: Clean this up so the error is displayed on the main screen
-            log.error("Failed to import api_client")
+            log.error("Failed to import api_network_core")
             raise ImportError("API client not setup. Do you have an API token linked?")
 
-    def run(self):
-        """This is the threads main function. It handles emitting the game state to
-           listeners (typically the OnlineGameModel).
-        """
+    def start(self) -> None:
+        """Starts streaming the game state"""
         log.info(f"Started streaming game state: {self.game_id}")
+        self._keep_warm_task = self.network_core.keep_board_connections_warm()
+        self._stream_task = self.network_core.submit(self._stream_game_state())
 
-        for event in self.api_client.board.stream_game_state(self.game_id):
-            event_topic = gsd_type_to_event_dict.get(event['type'], GSDEventTopics.NOT_IMPLEMENTED)
-            log.debug(f"GSD Stream event type received: {event['type']} // topic: {event_topic}")
+    def stop(self) -> None:
+        """Closes the game state stream and the board command connections"""
+        for task in [self._stream_task, self._keep_warm_task]:
+            if task:
+                task.cancel()
 
-            if event_topic is EventTopics.MOVE_MADE:
-                status = event.get('status', None)
-                self.is_game_over = status and status != "started" and status != "created"
+    async def _stream_game_state(self) -> None:
+        """Hands each received game state event to the event delivery thread"""
+        try:
+            async for event in self.network_core.stream("GET", f"/api/board/game/stream/{self.game_id}"):
+                self.network_core.deliver(self._handle_event, event, time.perf_counter())
+        except Exception as e:
+            log.error(f"Game state stream closed: {e}")
+        log.info(f"Completed streaming of: {self.game_id}")
 
-            elif event_topic is GSDEventTopics.OPPONENT_GONE:
-                is_gone = event.get('gone', False)
-                secs_until_claim = event.get('claimWinInSeconds', None)
+    def _handle_event(self, event: dict, received_at: Optional[float] = None) -> None:
+        """Emits the game state to listeners (typically the OnlineGameModel)"""
+        self.event_received_at = received_at
+        event_topic = gsd_type_to_event_dict.get(event['type'], GSDEventTopics.NOT_IMPLEMENTED)
+        log.debug(f"GSD Stream event type received: {event['type']} // topic: {event_topic}")
 
-                if is_gone and secs_until_claim:
-                    pass  # TODO implement call to auto-claim win when `secs_until_claim` elapses
+        if event_topic is EventTopics.MOVE_MADE:
+            status = event.get('status', None)
+            self.is_game_over = status and status != "started" and status != "created"
 
-                if not is_gone:
-                    pass  # TODO: Cancel auto-claim countdown
-            elif event_topic is EventTopics.CHAT_RECEIVED:
-                pass
+        elif event_topic is GSDEventTopics.OPPONENT_GONE:
+            is_gone = event.get('gone', False)
+            secs_until_claim = event.get('claimWinInSeconds', None)
 
-            game_end_event = EventTopics.GAME_END if self.is_game_over else None
-            self.e_game_state_dispatcher_event.notify(event_topic, game_end_event, data=event)
+            if is_gone and secs_until_claim:
+                pass  # TODO implement call to auto-claim win when `secs_until_claim` elapses
 
-            if self.is_game_over:
-                self._game_ended()
+            if not is_gone:
+                pass  # TODO: Cancel auto-claim countdown
+        elif event_topic is EventTopics.CHAT_RECEIVED:
+            pass
 
-        log.info(f"Completed streaming of: {self.game_id}")
+        game_end_event = EventTopics.GAME_END if self.is_game_over else None
+        self.e_game_state_dispatcher_event.notify(event_topic, game_end_event, data=event)
+
+        if self.is_game_over:
+            self._game_ended()
 
-    @retry(times=3, exceptions=(Exception, ))
-    def make_move(self, move: str):
-        """Sends the move to lichess. This move should have already
-           been verified as valid in the current context of the board.
-           The move must be in UCI format.
+    def _send_board_command(self, path: str, data: Optional[dict] = None) -> None:
+        """Sends the board command for this game and waits on the response. Board commands
+           are not resent, as a command which failed or timed out may have been received.
+           The network core retries commands which could not be sent on a stale connection.
+           Raises an exception if the command fails.
+        """
+        path = f"/api/board/game/{self.game_id}/{path}"
+        future = self.network_core.request("POST", path, data, pool=self.network_core.board_pool)
+        try:
+            future.result(timeout=REQUEST_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def make_move(self, move: str, callback: Optional[Callable[[Optional[Exception]], None]] = None) -> Future:
+        """Sends the move to lichess without waiting on the response. This move should
+           have already been verified as valid in the current context of the board. The
+           move must be in UCI format. The optional callback is called on the event
+           delivery thread with the exception if the move failed, otherwise with None.
         """
         log.debug(f"Sending move ({move}) to lichess")
-        self.api_client.board.make_move(self.game_id, move)
+        start = time.perf_counter()
+        future = self.network_core.request("POST", f"/api/board/game/{self.game_id}/move/{move}", pool=self.network_core.board_pool,
+                                           callback=(lambda _, error: callback(error)) if callback else None)
+        future.add_done_callback(lambda _: self._record_round_trip(move, start))
+        return future
+
+    def _record_round_trip(self, move: str, start: float) -> None:
+        """Records and logs the round trip time of a sent move"""
+        round_trip = (time.perf_counter() - start) * 1000
+        self.move_round_trips.append(round_trip)
+        log.debug(f"Move ({move}) round trip: {round_trip:.1f}ms")
 
-    @retry(times=3, exceptions=(Exception,))
     def send_takeback_request(self) -> None:
         """Sends a takeback request to our opponent"""
         log.debug("Sending takeback offer to opponent")
-        self.api_client.board.offer_takeback(self.game_id)
+        self._send_board_command("takeback/yes")
 
-    @retry(times=3, exceptions=(Exception,))
     def send_draw_offer(self) -> None:
         """Sends a draw offer to our opponent"""
         log.debug("Sending draw offer to opponent")
-        self.api_client.board.offer_draw(self.game_id)
+        self._send_board_command("draw/yes")
 
-    @retry(times=3, exceptions=(Exception,))
     def resign(self) -> None:
         """Resigns the game"""
         log.debug("Sending resignation")
-        self.api_client.board.resign_game(self.game_id)
+        self._send_board_command("resign")
 
-    @retry(times=3, exceptions=(Exception,))
     def post_message(self, text: str) -> None:
         """Send message to our opponent"""
         log.debug("Sending message to opponent")
-        self.api_client.board.post_message(self.game_id, text)
+        self._send_board_command("chat", {"room": "player", "text": text})
 
     @retry(times=3, exceptions=(Exception,))
     def claim_victory(self) -> None:
@@ -116,7 +161,16 @@ class GameStateDispatcher(Thread):
         log.info("GAME ENDED: Removing existing GSD listeners")
         self.is_game_over = True
         self.e_game_state_dispatcher_event.remove_all_listeners()
+        self.stop()
+
+        if self.move_round_trips:
+            log.info(f"Move round trips ({len(self.move_round_trips)} moves): median {statistics.median(self.move_round_trips):.1f}ms, "
+                     f"max {max(self.move_round_trips):.1f}ms")
 
     def add_event_listener(self, listener: Callable) -> None:
         """Subscribes the passed in method to GSD events"""
         self.e_game_state_dispatcher_event.add_listener(listener)
+
+    def unsubscribe_from_events(self, listener: Callable) -> None:
+        """Unsubscribes the passed in method from GSD events"""
+        self.e_game_state_dispatcher_event.remove_listener(listener)
@@ -1,9 +1,12 @@
+from __future__ import annotations
 from cli_chess.utils.event import Event, EventTopics
 from cli_chess.utils.logging import log
-from typing import Callable
+from concurrent.futures import Future
+from typing import Callable, Optional, TYPE_CHECKING
 from enum import Enum, auto
 from types import MappingProxyType
-import threading
+if TYPE_CHECKING:
+    from cli_chess.core.api.network_core import NetworkCore
 
 
 class IEMEventTopics(Enum):
@@ -22,47 +25,60 @@ iem_type_to_event_dict = MappingProxyType({
 })
 
 
-class IncomingEventManager(threading.Thread):
+class IncomingEventManager:
     """Opens a stream and keeps track of Lichess incoming
-       events (such as game start, game finish).
+       events (such as game start, game finish). The stream
+       runs on the network core and events are handled on
+       the network core's event delivery thread.
     """
 
-    def __init__(self):
-        super().__init__(daemon=True)
+    def __init__(self, network_core: NetworkCore):
+        self.network_core = network_core
         self.e_new_event_received = Event()
         self.my_games = []
+        self._stream_task: Optional[Future] = None
 
-    def run(self) -> None:
-        try:
-            from cli_chess.core.api.api_manager import api_client
-        except ImportError:
-            # TODO: Clean this up so the error is displayed on the main screen
-            log.error("Failed to import api_client")
-            raise ImportError("API client not setup. Do you have an API token linked?")
-
+    def start(self) -> None:
+        """Starts streaming the incoming events"""
         log.info("Started listening to Lichess incoming events")
-        for event in api_client.board.stream_incoming_events():
-            data = None
-            event_topic = iem_type_to_event_dict.get(event['type'], IEMEventTopics.NOT_IMPLEMENTED)
-            log.debug(f"IEM event received: {event}")
+        self._stream_task = self.network_core.submit(self._stream_events())
 
-            if event_topic is EventTopics.GAME_START:
-                data = event['game']
-                self.my_games.append(data['gameId'])
+    def stop(self) -> None:
+        """Closes the incoming events stream"""
+        if self._stream_task:
+            self._stream_task.cancel()
 
-            elif event_topic is EventTopics.GAME_END:
-                try:
-                    data = event['game']
-                    self.my_games.remove(data['gameId'])
-                except ValueError:
-                    pass
+    async def _stream_events(self) -> None:
+        """Hands each received event to the event delivery thread"""
+        try:
+            async for event in self.network_core.stream("GET", "/api/stream/event"):
+                self.network_core.deliver(self._handle_event, event)
+        except Exception as e:
+            log.error(f"Incoming events stream closed: {e}")
+
+    def _handle_event(self, event: dict) -> None:
+        """Parses the received event and notifies listeners"""
+        data = None
+        event_topic = iem_type_to_event_dict.get(event['type'], IEMEventTopics.NOT_IMPLEMENTED)
+        log.debug(f"IEM event received: {event}")
+
+        if event_topic is EventTopics.GAME_START:
+            data = event['game']
+            self.my_games.append(data['gameId'])
+
+        elif event_topic is EventTopics.GAME_END:
+            try:
+                data = event['game']
+                self.my_games.remove(data['gameId'])
+            except ValueError:
+                pass
 
-            elif (event_topic is IEMEventTopics.CHALLENGE or
-                  event_topic is IEMEventTopics.CHALLENGE_CANCELLED or
-                  event_topic is IEMEventTopics.CHALLENGE_DECLINED):
-                data = event['challenge']
+        elif (event_topic is IEMEventTopics.CHALLENGE or
+              event_topic is IEMEventTopics.CHALLENGE_CANCELLED or
+              event_topic is IEMEventTopics.CHALLENGE_DECLINED):
+            data = event['challenge']
 
-            self.e_new_event_received.notify(event_topic, data=data)
+        self.e_new_event_received.notify(event_topic, data=data)
 
     def get_active_games(self) -> list:
         """Returns a list of games in progress for this account"""
@@ -0,0 +1,384 @@
+from cli_chess.utils.logging import log
+from concurrent.futures import Future
+from contextlib import aclosing
+from importlib.metadata import version
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+import asyncio
+import json
+import queue
+import ssl
+import threading
+
+MAX_IDLE_CONNECTIONS = 4  # Keep-alive connections kept open for outgoing requests
+BOARD_POOL_SIZE = 2  # Warm connections kept open for board commands while a game is played
+KEEP_ALIVE_INTERVAL = 20  # Seconds between the keep-alive pings of the warm board connections
+KEEP_ALIVE_PATH = "/api/account"
+CONNECT_TIMEOUT = 5  # Seconds to wait on connection (TCP and TLS) setup
+READ_TIMEOUT = 8  # Seconds to wait on a request to be sent and its response read
+READ_SIZE = 64 * 1024
+
+
+class ApiResponseError(Exception):
+    """Raised when Lichess responds with an error status code"""
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"Lichess API error {status_code}: {message}")
+        self.status_code = status_code
+
+
+class StaleConnectionError(ConnectionError):
+    """Raised when a connection fails before any of the response is received,
+       either on writing the request or on the server closing the connection.
+       The server has not responded to (and in all likelihood not received) the request.
+    """
+
+
+class HttpConnection:
+    """A minimal HTTP/1.1 client connection on top of asyncio streams. Supports
+       keep-alive, and reading chunked and content-length response bodies.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    @classmethod
+    async def open(cls, host: str, port: int, use_tls: bool) -> "HttpConnection":
+        """Opens a connection to the host"""
+        ssl_context = ssl.create_default_context() if use_tls else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context, limit=READ_SIZE)
+        return cls(reader, writer)
+
+    def is_usable(self) -> bool:
+        """Returns True if the connection can be used for another request"""
+        return self.reusable and not self.writer.is_closing() and not self.reader.at_eof()
+
+    async def send_request(self, method: str, path: str, headers: Dict[str, str], body: bytes = b"") -> None:
+        """Writes the request to the connection"""
+        lines = [f"{method} {path} HTTP/1.1"] + [f"{name}: {value}" for name, value in headers.items()]
+        if body or method in ["POST", "PUT"]:
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+    async def read_response_head(self) -> Tuple[int, Dict[str, str]]:
+        """Reads the status line and headers of the response"""
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise StaleConnectionError("Connection closed by the server")
+
+        status_code = int(status_line.split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) not in [b"\r\n", b"\n", b""]:
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("connection", "").lower() == "close":
+            self.reusable = False
+        return status_code, headers
+
+    async def iter_body(self, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        """Yields the response body as it is received"""
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size_line = await self.reader.readline()
+                if not size_line:
+                    raise ConnectionError("Connection closed mid response")
+                size = int(size_line.split(b";")[0].strip(), 16)
+                if size == 0:
+                    while (await self.reader.readline()) not in [b"\r\n", b"\n", b""]:
+                        pass
+                    return
+                chunk = await self.reader.readexactly(size)
+                await self.reader.readexactly(2)
+                yield chunk
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining > 0:
+                chunk = await self.reader.read(min(remaining, READ_SIZE))
+                if not chunk:
+                    raise ConnectionError("Connection closed mid response")
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            self.reusable = False
+            while chunk := await self.reader.read(READ_SIZE):
+                yield chunk
+
+    async def read_body(self, headers: Dict[str, str]) -> bytes:
+        """Returns the full response body"""
+        return b"".join([chunk async for chunk in self.iter_body(headers)])
+
+    def close(self) -> None:
+        """Closes the connection"""
+        self.reusable = False
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Idle keep-alive connections which are reused across requests"""
+    def __init__(self, open_connection: Callable[[], Awaitable[HttpConnection]], size: int):
+        self.size = size
+        self.idle: List[HttpConnection] = []
+        self._open_connection = open_connection
+
+    def get(self) -> Optional[HttpConnection]:
+        """Returns a usable idle connection, closing any which are no longer usable"""
+        while self.idle:
+            connection = self.idle.pop()
+            if connection.is_usable():
+                return connection
+            connection.close()
+        return None
+
+    def release(self, connection: HttpConnection) -> None:
+        """Returns the connection to the pool if it can be reused"""
+        if connection.is_usable() and len(self.idle) < self.size:
+            self.idle.append(connection)
+        else:
+            connection.close()
+
+    async def warm(self) -> None:
+        """Closes the idle connections which are no longer usable and opens
+           new connections until the pool is full, so no request waits on
+           connection (TCP and TLS) setup.
+        """
+        for connection in [connection for connection in self.idle if not connection.is_usable()]:
+            self.idle.remove(connection)
+            connection.close()
+        while len(self.idle) < self.size:
+            self.idle.append(await self._open_connection())
+
+    def close(self) -> None:
+        """Closes the idle connections"""
+        while self.idle:
+            self.idle.pop().close()
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    """Yields the parsed objects of a newline delimited JSON body. Empty
+       lines (sent by Lichess to keep the stream alive) are skipped.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+class NetworkCore:
+    """Runs every Lichess stream and request on a single asyncio event loop in its own
+       thread. Each NDJSON stream holds a connection while it is open, and requests share
+       a small pool of keep-alive connections. Board commands use a separate pool which is
+       kept warm while a game is played. Received events are handed to a thread-safe
+       queue which a single delivery thread drains, so listeners never run on the event loop
+       and the thread count stays the same however many streams are open.
+    """
+    def __init__(self, token: str, base_url: str):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.use_tls = url.scheme == "https"
+        self.port = url.port or (443 if self.use_tls else 80)
+        self._headers = {
+            "Host": url.netloc,
+            "Authorization": f"Bearer {token}",
+            "User-Agent": f"cli-chess/{self._get_version()}",
+            "Connection": "keep-alive",
+        }
+        self._loop = asyncio.new_event_loop()
+        self._request_pool = ConnectionPool(self._open_connection, MAX_IDLE_CONNECTIONS)
+        self.board_pool = ConnectionPool(self._open_connection, BOARD_POOL_SIZE)
+        self._events: queue.Queue = queue.Queue()
+        self._stopped = False
+        self._loop_thread = threading.Thread(target=self._run_loop, name="lichess-network", daemon=True)
+        self._delivery_thread = threading.Thread(target=self._deliver_events, name="lichess-events", daemon=True)
+
+    def start(self) -> None:
+        """Starts the event loop and event delivery threads"""
+        self._loop_thread.start()
+        self._delivery_thread.start()
+
+    def stop(self) -> None:
+        """Stops the event loop and event delivery threads. Open streams are closed"""
+        if self._stopped:
+            return
+
+        self._stopped = True
+        if self._loop_thread.is_alive():
+            self.submit(self._shutdown())
+        elif not self._loop.is_closed():
+            self._loop.close()
+        self._events.put(None)
+
+    def submit(self, coroutine) -> Future:
+        """Schedules the coroutine on the event loop. Cancelling the returned future cancels the coroutine"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def deliver(self, callback: Callable, *args, **kwargs) -> None:
+        """Queues the callback to be called on the event delivery thread"""
+        self._events.put((callback, args, kwargs))
+
+    async def stream(self, method: str, path: str, data: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Opens an NDJSON stream and yields each received object"""
+        async with aclosing(self.stream_body(method, path, data, accept="application/x-ndjson")) as chunks:
+            async for event in iter_ndjson(chunks):
+                yield event
+
+    async def stream_body(self, method: str, path: str, data: Optional[dict] = None, accept: str = "text/plain") -> AsyncIterator[bytes]:
+        """Opens a streamed request and yields the response body as it is received. The
+           stream connection is closed once the stream ends or the caller stops iterating.
+        """
+        connection = await self._open_connection()
+        try:
+            await connection.send_request(method, path, self._get_headers(accept, data), self._encode(data))
+            status_code, headers = await connection.read_response_head()
+            if status_code >= 400:
+                raise ApiResponseError(status_code, (await connection.read_body(headers)).decode(errors="replace"))
+
+            log.debug(f"Opened stream: {method} {path}")
+            async for chunk in connection.iter_body(headers):
+                yield chunk
+        finally:
+            connection.close()
+
+    async def fetch(self, method: str, path: str, data: Optional[dict] = None, pool: Optional[ConnectionPool] = None) -> dict:
+        """Sends a request over a pooled keep-alive connection and returns the parsed
+           JSON response. The general request pool is used unless a pool is passed in.
+           A request on a reused connection which the server has since closed is retried
+           once on a new connection, but only if it failed before any of the response was
+           received. A request which fails later may have been handled, so it is not resent.
+        """
+        pool = pool or self._request_pool
+        connection = pool.get()
+        try:
+            return await self._fetch(pool, connection or await self._open_connection(), method, path, data)
+        except StaleConnectionError as e:
+            if connection is None:
+                raise
+            log.debug(f"Retrying request on a new connection: {e}")
+            return await self._fetch(pool, await self._open_connection(), method, path, data)
+
+    def request(self, method: str, path: str, data: Optional[dict] = None,
+                callback: Optional[Callable[[Optional[dict], Optional[Exception]], None]] = None,
+                pool: Optional[ConnectionPool] = None) -> Future:
+        """Sends a request from any thread. Returns a future holding the parsed response.
+           The optional callback is called on the event delivery thread with the
+           response, or the exception if the request failed.
+        """
+        future = self.submit(self.fetch(method, path, data, pool))
+        if callback:
+            future.add_done_callback(lambda f: self.deliver(callback, *self._get_result(f)))
+        return future
+
+    def keep_board_connections_warm(self) -> Future:
+        """Opens the board command connections ahead of time and keeps them alive with
+           periodic pings until the returned future is cancelled. Cancelling closes them.
+        """
+        return self.submit(self._keep_board_connections_warm())
+
+    async def _keep_board_connections_warm(self) -> None:
+        """Refills the board command pool and pings its idle connections every keep-alive interval"""
+        try:
+            while True:
+                try:
+                    await self.board_pool.warm()
+                    for connection in list(self.board_pool.idle):
+                        if connection in self.board_pool.idle:
+                            self.board_pool.idle.remove(connection)
+                            await self._fetch(self.board_pool, connection, "GET", KEEP_ALIVE_PATH, None)
+                except Exception as e:
+                    log.debug(f"Error keeping the board connections alive: {e}")
+                await asyncio.sleep(KEEP_ALIVE_INTERVAL)
+        finally:
+            self.board_pool.close()
+
+    async def _fetch(self, pool: ConnectionPool, connection: HttpConnection, method: str, path: str, data: Optional[dict]) -> dict:
+        """Sends the request over the passed in connection and reads the response.
+           The connection is returned to the pool once the response is read. The
+           connection is closed if the response is not read within the read timeout.
+        """
+        try:
+            status_code, headers, body = await asyncio.wait_for(self._send_and_read(connection, method, path, data), READ_TIMEOUT)
+        except BaseException:
+            connection.close()
+            raise
+
+        pool.release(connection)
+        if status_code >= 400:
+            raise ApiResponseError(status_code, body.decode(errors="replace"))
+        return json.loads(body) if body.strip() else {}
+
+    async def _send_and_read(self, connection: HttpConnection, method: str, path: str,
+                             data: Optional[dict]) -> Tuple[int, Dict[str, str], bytes]:
+        """Sends the request over the passed in connection and returns the response"""
+        try:
+            await connection.send_request(method, path, self._get_headers("application/json", data), self._encode(data))
+        except OSError as e:
+            raise StaleConnectionError(f"Error sending request: {e}") from e
+        status_code, headers = await connection.read_response_head()
+        return status_code, headers, await connection.read_body(headers)
+
+    async def _open_connection(self) -> HttpConnection:
+        """Opens a new connection to Lichess"""
+        return await asyncio.wait_for(HttpConnection.open(self.host, self.port, self.use_tls), CONNECT_TIMEOUT)
+
+    def _get_headers(self, accept: str, data: Optional[dict]) -> Dict[str, str]:
+        """Returns the request headers"""
+        headers = dict(self._headers, Accept=accept)
+        if data:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return headers
+
+    @staticmethod
+    def _encode(data: Optional[dict]) -> bytes:
+        """Form encodes the request data. Values which are None are left out"""
+        if not data:
+            return b""
+        values = {key: str(value).lower() if isinstance(value, bool) else value for key, value in data.items() if value is not None}
+        return urlencode(values).encode()
+
+    @staticmethod
+    def _get_result(future: Future) -> Tuple[Optional[dict], Optional[BaseException]]:
+        """Returns the response and exception of a completed request future"""
+        if future.cancelled():
+            return None, asyncio.CancelledError()
+        return (None, future.exception()) if future.exception() else (future.result(), None)
+
+    @staticmethod
+    def _get_version() -> str:
+        """Returns the installed cli-chess version"""
+        try:
+            return version("cli-chess")
+        except Exception:
+            return "unknown"
+
+    async def _shutdown(self) -> None:
+        """Cancels the running streams and requests, closes the pooled connections and stops the loop"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._request_pool.close()
+        self.board_pool.close()
+        self._loop.stop()
+
+    def _run_loop(self) -> None:
+        """Runs the event loop until stopped. This is the loop threads main function"""
+        asyncio.set_event_loop(self._loop)
+        log.info("Started the Lichess network core")
+        self._loop.run_forever()
+        self._loop.close()
+
+    def _deliver_events(self) -> None:
+        """Calls the queued callbacks in order. This is the delivery threads main function"""
+        while (event := self._events.get()) is not None:
+            callback, args, kwargs = event
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                log.exception(f"Error delivering Lichess event: {e}")
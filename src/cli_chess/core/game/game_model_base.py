@@ -2,6 +2,8 @@ from cli_chess.modules.board import BoardModel
 from cli_chess.modules.move_list import MoveListModel
 from cli_chess.modules.material_difference import MaterialDifferenceModel
 from cli_chess.modules.premove import PremoveModel
+from cli_chess.modules.analysis import AnalysisModel
+from cli_chess.modules.opening_explorer import OpeningExplorerModel
 from cli_chess.utils import EventManager, log
 from .game_metadata import GameMetadata
 from chess import Color, WHITE, COLOR_NAMES
@@ -16,13 +18,16 @@ class GameModelBase:
         self.board_model = BoardModel(orientation, variant, fen, side_confirmed)
         self.move_list_model = MoveListModel(self.board_model)
         self.material_diff_model = MaterialDifferenceModel(self.board_model)
+        self.analysis_model = AnalysisModel(self.board_model)
+        self.opening_explorer_model = OpeningExplorerModel(self.board_model)
 
         self._event_manager = EventManager()
         self.e_game_model_updated = self._event_manager.create_event()
         self.board_model.e_board_model_updated.add_listener(self.update)
 
         # Keep track of all associated models to handle bulk cleanup on exit
-        self._assoc_models = [self.board_model, self.move_list_model, self.material_diff_model]
+        self._assoc_models = [self.board_model, self.move_list_model, self.material_diff_model, self.analysis_model,
+                              self.opening_explorer_model]
 
         log.debug(f"Created {type(self).__name__} (id={id(self)})")
 
@@ -6,9 +6,12 @@ from cli_chess.modules.material_difference import MaterialDifferencePresenter
 from cli_chess.modules.player_info import PlayerInfoPresenter
 from cli_chess.modules.clock import ClockPresenter
 from cli_chess.modules.premove import PremovePresenter
-from cli_chess.utils import log, AlertType, RequestSuccessfullySent, EventTopics, save_game_pgn
+from cli_chess.modules.analysis import AnalysisPresenter
+from cli_chess.modules.opening_explorer import OpeningExplorerPresenter
+from cli_chess.modules.game_archive import g_game_archive_model
+from cli_chess.utils import log, AlertType, RequestSuccessfullySent, EventTopics, save_game_pgn, build_pgn_game
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 if TYPE_CHECKING:
     from cli_chess.core.game import GameModelBase, PlayableGameModelBase
 
@@ -21,6 +24,8 @@ class GamePresenterBase(ABC):
         self.material_diff_presenter = MaterialDifferencePresenter(model.material_diff_model)
         self.player_info_presenter = PlayerInfoPresenter(model)
         self.clock_presenter = ClockPresenter(model)
+        self.analysis_presenter = AnalysisPresenter(model.analysis_model)
+        self.opening_explorer_presenter = OpeningExplorerPresenter(model.opening_explorer_model)
         self.view = self._get_view()
 
         self.model.e_game_model_updated.add_listener(self.update)
@@ -43,6 +48,24 @@ class GamePresenterBase(ABC):
         """Flip the board orientation"""
         self.model.board_model.set_board_orientation(not self.model.board_model.get_board_orientation())
 
+    def is_analysis_allowed(self) -> bool:
+        """Returns True if engine analysis can be shown in this game. This
+           must never be allowed in live games against Lichess opponents
+        """
+        return False
+
+    def toggle_analysis(self) -> None:
+        """Toggles the engine analysis (if allowed)"""
+        if self.is_analysis_allowed():
+            self.analysis_presenter.toggle_analysis()
+
+    def toggle_opening_explorer(self) -> None:
+        """Toggles the opening explorer. Like the engine analysis, this is
+           only allowed in games where analysis can be shown
+        """
+        if self.is_analysis_allowed():
+            self.opening_explorer_presenter.toggle_opening_explorer()
+
     def exit(self) -> None:
         """Exit current presenter/view"""
         log.debug("Exiting game presenter")
@@ -107,6 +130,14 @@ class PlayableGamePresenterBase(GamePresenterBase, ABC):
         except Exception as e:
             self.view.alert.show_alert(str(e))
 
+    def get_move_completions(self, text: str) -> List[str]:
+        """Returns the legal moves starting with the passed in text (e.g. for tab completing
+           the move input). No moves are suggested when it's not the users turn.
+        """
+        if not self.model.game_in_progress or not self.model.is_my_turn():
+            return []
+        return self.model.board_model.get_move_completions(text)
+
     def make_move(self, move: str) -> None:
         """Make the passed in move on the board"""
         try:
@@ -156,6 +187,21 @@ class PlayableGamePresenterBase(GamePresenterBase, ABC):
     def is_game_in_progress(self) -> bool:
         return self.model.game_in_progress
 
+    def review_game(self) -> None:
+        """Exits the finished game and starts reviewing it"""
+        from cli_chess.core.game.game_review import start_game_review
+        if self.model.game_in_progress:
+            return
+
+        try:
+            is_online = self.model.game_metadata.game_id is not None
+            game = build_pgn_game(self.model.board_model, self.model.game_metadata, is_online=is_online)
+            self.exit()
+            start_game_review(game, self.model.my_color)
+        except Exception as e:
+            log.error(f"Error starting the game review: {e}")
+            self.view.alert.show_alert(f"Unable to review the game: {e}")
+
     @abstractmethod
     def _parse_and_present_game_over(self) -> str:
         pass
@@ -166,6 +212,7 @@ class PlayableGamePresenterBase(GamePresenterBase, ABC):
             is_online = self.model.game_metadata.game_id is not None
             path = save_game_pgn(self.model.board_model, self.model.game_metadata, is_online=is_online)
             if path:
+                g_game_archive_model.add_file(path)
                 self.view.alert.append_alert(f"Game saved: {path}")
         except Exception as e:
             log.error(f"Unexpected error saving PGN: {e}")
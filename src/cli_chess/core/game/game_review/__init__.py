@@ -0,0 +1,3 @@
+from .game_review_model import GameReviewModel
+from .game_review_view import GameReviewView
+from .game_review_presenter import GameReviewPresenter, start_game_review
@@ -0,0 +1,142 @@
+from cli_chess.core.game import GameModelBase
+from cli_chess.modules.board import BoardModel
+from cli_chess.modules.move_list import MoveListModel
+from cli_chess.utils import log
+from chess import Board, Color, Move, WHITE, BLACK, COLOR_NAMES
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import chess.pgn
+
+CHECKPOINT_INTERVAL = 8  # Plies between the stored board checkpoints
+RESULT_WINNERS = {"1-0": "white", "0-1": "black"}
+
+
+@dataclass(frozen=True)
+class ReviewPly:
+    """Cached metadata of a reviewed ply"""
+    move: Move
+    clocks: Tuple[Optional[float], Optional[float]]  # Clock times (seconds) after the move, indexed by color
+
+
+class ReviewMoveListModel(MoveListModel):
+    """Move list of a reviewed game. The move list data of every ply is
+       generated once, and the data up to the reviewed ply is shown
+    """
+    def __init__(self, board_model: BoardModel, start_board: Board, moves: List[Move]):
+        self.ply = 0
+        self._review_move_list_data = []
+        super().__init__(board_model)
+
+        self._replay_board = start_board.copy(stack=False)
+        for move in moves:
+            self._review_move_list_data.append(self._get_move_data(move))
+            self._replay_board.push(move)
+        self.update()
+
+    def update(self, *args, **kwargs) -> None:  # noqa
+        """Updates the move list data to the moves up to the reviewed ply"""
+        self.move_list_data = self._review_move_list_data[:self.ply]
+        self._notify_move_list_model_updated()
+
+
+class GameReviewModel(GameModelBase):
+    """Steps through a finished game. Board checkpoints are stored every few plies and
+       the metadata of each ply is cached, so seeking to any ply only costs restoring
+       the nearest checkpoint and replaying a bounded number of moves.
+    """
+    def __init__(self, game: chess.pgn.Game, orientation: Color = WHITE):
+        start_board = game.board()
+        variant = "chess960" if start_board.chess960 else start_board.uci_variant
+        super().__init__(orientation=orientation, variant=variant, fen=start_board.fen())
+        self.headers = game.headers
+        self.ply = 0
+        self._start_move_number = start_board.fullmove_number
+        self._start_turn = start_board.turn
+
+        self._plies: List[ReviewPly] = []
+        self._checkpoints: List[Board] = [start_board.copy(stack=False)]
+        self._initial_clocks = self._get_initial_clocks(game.headers)
+        self._cache_plies(game, start_board)
+
+        # Replace the base move list model with one using the cached move list data
+        self.board_model.e_board_model_updated.remove_listener(self.move_list_model.update)
+        self.move_list_model = ReviewMoveListModel(self.board_model, start_board, [ply.move for ply in self._plies])
+        self._assoc_models = [self.move_list_model if isinstance(model, MoveListModel) else model for model in self._assoc_models]
+
+        self._set_game_metadata()
+        self.seek(len(self._plies))
+
+    def _cache_plies(self, game: chess.pgn.Game, start_board: Board) -> None:
+        """Walks the mainline once to cache the metadata of each ply and store the board checkpoints"""
+        board = start_board.copy(stack=False)
+        clocks = list(self._initial_clocks)
+        for node in game.mainline():
+            if node.clock() is not None:
+                clocks[board.turn] = node.clock()
+            board.push(node.move)
+            self._plies.append(ReviewPly(node.move, tuple(clocks)))
+            if len(self._plies) % CHECKPOINT_INTERVAL == 0:
+                self._checkpoints.append(board.copy(stack=False))
+
+    def seek(self, ply: int) -> None:
+        """Sets the board to the position after the passed in ply (0 is the start position).
+           Nearby plies are reached by pushing or popping moves from the current board.
+           Otherwise the nearest checkpoint before the ply is restored and played forward.
+        """
+        ply = max(0, min(ply, len(self._plies)))
+        board = self.board_model.board
+        if ply < self.ply and self.ply - ply <= min(CHECKPOINT_INTERVAL, len(board.move_stack)):
+            for _ in range(self.ply - ply):
+                board.pop()
+            start = ply
+        elif self.ply <= ply < self.ply + CHECKPOINT_INTERVAL:
+            start = self.ply
+        else:
+            start = ply - ply % CHECKPOINT_INTERVAL
+            board = self._checkpoints[ply // CHECKPOINT_INTERVAL].copy(stack=False)
+
+        for review_ply in self._plies[start:ply]:
+            board.push(review_ply.move)
+
+        self.ply = ply
+        self.move_list_model.ply = ply
+        clocks = self._plies[ply - 1].clocks if ply else self._initial_clocks
+        for color in [WHITE, BLACK]:
+            self.game_metadata.clocks[color].time = clocks[color]
+        self.board_model.set_board(board, self._plies[ply - 1].move if ply else Move.null())
+
+    def step(self, plies: int) -> None:
+        """Moves the reviewed position forward (or back if negative) by the passed in plies"""
+        self.seek(self.ply + plies)
+
+    def get_ply_count(self) -> int:
+        """Returns the number of plies in the game"""
+        return len(self._plies)
+
+    def get_move_ply(self, move_number: int, color: Color) -> int:
+        """Returns the ply after the passed in move number was played by the color"""
+        ply = 2 * (move_number - self._start_move_number) + (1 if color == WHITE else 2) - (self._start_turn == BLACK)
+        return max(0, min(ply, len(self._plies)))
+
+    @staticmethod
+    def _get_initial_clocks(headers: chess.pgn.Headers) -> Tuple[Optional[float], Optional[float]]:
+        """Returns the starting clock times from the time control header (e.g. 300+3)"""
+        try:
+            base = float(headers.get("TimeControl", "-").split("+")[0])
+            return base, base
+        except ValueError:
+            return None, None
+
+    def _set_game_metadata(self) -> None:
+        """Sets the player, clock and result metadata from the game headers"""
+        for color in [WHITE, BLACK]:
+            name = COLOR_NAMES[color].capitalize()
+            player = self.game_metadata.players[color]
+            player.name = self.headers.get(name, "?")
+            player.title = self.headers.get(f"{name}Title")
+            player.rating = self.headers.get(f"{name}Elo")
+            self.game_metadata.clocks[color].units = "sec"
+
+        self.game_metadata.game_status.winner = RESULT_WINNERS.get(self.headers.get("Result", "*"))
+        self.game_metadata.game_status.status = self.headers.get("Termination")
+        log.debug(f"Reviewing game: {self.headers.get('White')} vs {self.headers.get('Black')} ({len(self._plies)} plies)")
@@ -0,0 +1,65 @@
+from cli_chess.core.game import GamePresenterBase
+from cli_chess.core.game.game_review import GameReviewModel, GameReviewView
+from cli_chess.utils.ui_common import change_views
+from cli_chess.utils import AlertType
+from chess import Color, WHITE, BLACK
+import chess.pgn
+
+
+def start_game_review(game: chess.pgn.Game, orientation: Color = WHITE) -> None:
+    """Start reviewing the passed in game"""
+    presenter = GameReviewPresenter(GameReviewModel(game, orientation))
+    change_views(presenter.view, presenter.view.input_field_container)
+
+
+class GameReviewPresenter(GamePresenterBase):
+    def __init__(self, model: GameReviewModel):
+        self.model = model
+        super().__init__(model)
+        self.update()
+
+    def _get_view(self) -> GameReviewView:
+        """Sets and returns the view to use"""
+        return GameReviewView(self)
+
+    def is_analysis_allowed(self) -> bool:
+        """Returns True as engine analysis can be shown when reviewing a finished game"""
+        return True
+
+    def update(self, *args, **kwargs) -> None:
+        """Update method called on game model updates. Overrides base."""
+        ply, ply_count = self.model.ply, self.model.get_ply_count()
+        status = f"Ply {ply} of {ply_count}"
+        if ply == ply_count:
+            status += f" • {self.model.headers.get('Result', '*')}"
+            if self.model.game_metadata.game_status.status:
+                status += f" ({self.model.game_metadata.game_status.status})"
+        self.view.alert.show_alert(status, AlertType.NEUTRAL)
+
+    def step(self, plies: int) -> None:
+        """Steps forward (or back if negative) by the passed in number of plies"""
+        self.model.step(plies)
+
+    def go_to_start(self) -> None:
+        """Shows the starting position"""
+        self.model.seek(0)
+
+    def go_to_end(self) -> None:
+        """Shows the final position"""
+        self.model.seek(self.model.get_ply_count())
+
+    def go_to_move(self, text: str) -> None:
+        """Shows the position after the passed in move number. `15` is the
+           position after whites 15th move and `15...` after blacks.
+        """
+        text = text.strip()
+        try:
+            is_black = text.endswith("...")
+            move_number = int(text.rstrip(".").strip())
+            if move_number < 0:
+                raise ValueError
+        except ValueError:
+            self.view.alert.show_alert(f"Invalid move number: {text}")
+            return
+
+        self.model.seek(self.model.get_move_ply(move_number, BLACK if is_black else WHITE) if move_number else 0)
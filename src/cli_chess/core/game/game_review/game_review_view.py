@@ -0,0 +1,104 @@
+from __future__ import annotations
+from cli_chess.core.game import GameViewBase
+from cli_chess.utils.ui_common import handle_mouse_click
+from prompt_toolkit.layout import Container, HSplit, VSplit, VerticalAlign, D
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.widgets import Box, TextArea
+from typing import Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from cli_chess.core.game.game_review import GameReviewPresenter
+
+
+class GameReviewView(GameViewBase):
+    def __init__(self, presenter: GameReviewPresenter):
+        self.presenter = presenter
+        self.input_field_container = self._create_input_field_container()
+        super().__init__(presenter)
+
+    def _create_container(self) -> Container:
+        """Creates the container for the game review view"""
+        main_content = Box(
+            HSplit([
+                VSplit([
+                    self.board_output_container,
+                    HSplit([
+                        self.clock_upper,
+                        self.player_info_upper_container,
+                        self.material_diff_upper_container,
+                        self.move_list_container,
+                        self.material_diff_lower_container,
+                        self.player_info_lower_container,
+                        self.clock_lower
+                    ]),
+                ]),
+                self.input_field_container,
+                self.analysis_container,
+                self.opening_explorer_container,
+                self.alert
+            ]),
+            padding=0
+        )
+        function_bar = HSplit([
+            self._create_function_bar()
+        ], align=VerticalAlign.BOTTOM)
+
+        return HSplit([main_content, function_bar], key_bindings=self.get_key_bindings())
+
+    def _step_fb_fragments(self) -> Tuple:
+        """Returns the function bar fragments for stepping through the game"""
+        return (
+            ("class:function-bar.key", "←", handle_mouse_click(lambda: self.presenter.step(-1))),
+            ("class:function-bar.label", f"{'Back':<11}", handle_mouse_click(lambda: self.presenter.step(-1))),
+            ("class:function-bar.spacer", " "),
+            ("class:function-bar.key", "→", handle_mouse_click(lambda: self.presenter.step(1))),
+            ("class:function-bar.label", f"{'Forward':<11}", handle_mouse_click(lambda: self.presenter.step(1))),
+            ("class:function-bar.spacer", " "),
+        )
+
+    def _base_function_bar_fragments(self) -> StyleAndTextTuples:
+        """Returns the function bar fragments for the game review"""
+        fragments = super()._base_function_bar_fragments()
+        fragments[3:3] = self._step_fb_fragments()
+        return fragments
+
+    def get_key_bindings(self) -> "_MergedKeyBindings":  # noqa: F821:
+        """Returns the key bindings for this container"""
+        bindings = KeyBindings()
+
+        @bindings.add(Keys.Left, eager=True)
+        def _(event): # noqa
+            self.presenter.step(-1)
+
+        @bindings.add(Keys.Right, eager=True)
+        def _(event): # noqa
+            self.presenter.step(1)
+
+        @bindings.add(Keys.Home, eager=True)
+        def _(event): # noqa
+            self.presenter.go_to_start()
+
+        @bindings.add(Keys.End, eager=True)
+        def _(event): # noqa
+            self.presenter.go_to_end()
+
+        return merge_key_bindings([bindings, super().get_key_bindings()])
+
+    def _create_input_field_container(self) -> TextArea:
+        """Returns a TextArea used to jump to a move number"""
+        input_field = TextArea(height=D(max=1),
+                               prompt="Go to move:",
+                               style="class:move-input",
+                               multiline=False,
+                               wrap_lines=True,
+                               focus_on_click=True)
+
+        input_field.accept_handler = self._accept_input
+        return input_field
+
+    def _accept_input(self, input: Buffer) -> None: # noqa
+        """Accept handler for the input field"""
+        self.presenter.go_to_move(input.text)
+        self.input_field_container.text = ''
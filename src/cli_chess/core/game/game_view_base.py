@@ -7,13 +7,26 @@ from prompt_toolkit.formatted_text import StyleAndTextTuples
 from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.completion import Completer, Completion, CompleteEvent
+from prompt_toolkit.document import Document
 from prompt_toolkit.filters import Condition
 from abc import ABC, abstractmethod
-from typing import Tuple, TYPE_CHECKING
+from typing import Iterable, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from cli_chess.core.game import GamePresenterBase, PlayableGamePresenterBase
 
 
+class MoveCompleter(Completer):
+    """Completes the move input with the legal moves in the current position"""
+    def __init__(self, presenter: PlayableGamePresenterBase):
+        self.presenter = presenter
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent) -> Iterable[Completion]:
+        text = document.text_before_cursor.strip()
+        for move in self.presenter.get_move_completions(text):
+            yield Completion(move, start_position=-len(document.text_before_cursor))
+
+
 class GameViewBase(ABC):
     def __init__(self, presenter: GamePresenterBase) -> None:
         self.presenter = presenter
@@ -25,6 +38,8 @@ class GameViewBase(ABC):
         self.player_info_lower_container = presenter.player_info_presenter.view_lower
         self.clock_upper = presenter.clock_presenter.view_upper
         self.clock_lower = presenter.clock_presenter.view_lower
+        self.analysis_container = presenter.analysis_presenter.view
+        self.opening_explorer_container = presenter.opening_explorer_presenter.view
         self.alert = AlertContainer()
         self._container = self._create_container()
 
@@ -38,6 +53,9 @@ class GameViewBase(ABC):
         """Return the minimum function bar fragments for a game"""
         fragments = ([])
         fragments.extend(self._flip_board_fb_fragments())
+        if self.presenter.is_analysis_allowed():
+            fragments.extend(self._analysis_fb_fragments())
+            fragments.extend(self._opening_explorer_fb_fragments())
         fragments.extend(self._exit_fb_fragments())
         return fragments
 
@@ -49,6 +67,22 @@ class GameViewBase(ABC):
             ("class:function-bar.spacer", " "),
         )
 
+    def _analysis_fb_fragments(self) -> Tuple:
+        """Returns the function bar fragments for toggling the engine analysis"""
+        return (
+            ("class:function-bar.key", "F6", handle_mouse_click(self.presenter.toggle_analysis)),
+            ("class:function-bar.label", f"{'Analysis':<11}", handle_mouse_click(self.presenter.toggle_analysis)),
+            ("class:function-bar.spacer", " "),
+        )
+
+    def _opening_explorer_fb_fragments(self) -> Tuple:
+        """Returns the function bar fragments for toggling the opening explorer"""
+        return (
+            ("class:function-bar.key", "F7", handle_mouse_click(self.presenter.toggle_opening_explorer)),
+            ("class:function-bar.label", f"{'Explorer':<11}", handle_mouse_click(self.presenter.toggle_opening_explorer)),
+            ("class:function-bar.spacer", " "),
+        )
+
     def _exit_fb_fragments(self) -> Tuple:
         """Returns the function bar fragments for exiting the game view"""
         return (
@@ -71,6 +105,14 @@ class GameViewBase(ABC):
         def _(event): # noqa
             self.presenter.flip_board()
 
+        @bindings.add(Keys.F6, filter=Condition(self.presenter.is_analysis_allowed), eager=True)
+        def _(event): # noqa
+            self.presenter.toggle_analysis()
+
+        @bindings.add(Keys.F7, filter=Condition(self.presenter.is_analysis_allowed), eager=True)
+        def _(event): # noqa
+            self.presenter.toggle_opening_explorer()
+
         @bindings.add(Keys.F8, eager=True)
         def _(event): # noqa
             self.presenter.exit()
@@ -108,6 +150,14 @@ class PlayableGameViewBase(GameViewBase, ABC):
             ("class:function-bar.spacer", " "),
         )
 
+    def _review_fb_fragments(self) -> Tuple:
+        """Returns the function bar fragments for reviewing the finished game"""
+        return (
+            ("class:function-bar.key", "F2", handle_mouse_click(self.presenter.review_game)),
+            ("class:function-bar.label", f"{'Review':<11}", handle_mouse_click(self.presenter.review_game)),
+            ("class:function-bar.spacer", " "),
+        )
+
     def _draw_fb_fragments(self) -> Tuple:
         """Returns the function bar fragments for offering a draw"""
         return (
@@ -146,6 +196,10 @@ class PlayableGameViewBase(GameViewBase, ABC):
             fragments = ([])
             fragments.extend(self._flip_board_fb_fragments())
 
+            if self.presenter.is_analysis_allowed():
+                fragments.extend(self._analysis_fb_fragments())
+                fragments.extend(self._opening_explorer_fb_fragments())
+
             if self.presenter.is_game_in_progress():
                 fragments.extend(self._takeback_fb_fragments())
 
@@ -157,6 +211,7 @@ class PlayableGameViewBase(GameViewBase, ABC):
                 if self.presenter.premove_presenter.is_premove_set():
                     fragments.extend(self._clear_premove_fb_fragments())
             else:
+                fragments.extend(self._review_fb_fragments())
                 fragments.extend(self._exit_fb_fragments())
             return fragments
 
@@ -172,6 +227,10 @@ class PlayableGameViewBase(GameViewBase, ABC):
         def _(event): # noqa
             self.presenter.propose_takeback()
 
+        @bindings.add(Keys.F2, filter=~Condition(self.presenter.is_game_in_progress), eager=True)
+        def _(event): # noqa
+            self.presenter.review_game()
+
         if not self.presenter.is_vs_ai():
             @bindings.add(Keys.F3, filter=Condition(self.presenter.is_game_in_progress), eager=True)
             def _(event):
@@ -204,7 +263,9 @@ class PlayableGameViewBase(GameViewBase, ABC):
                                style="class:move-input",
                                multiline=False,
                                wrap_lines=True,
-                               focus_on_click=True)
+                               focus_on_click=True,
+                               completer=MoveCompleter(self.presenter),
+                               complete_while_typing=False)
 
         input_field.accept_handler = self._accept_input
         return input_field
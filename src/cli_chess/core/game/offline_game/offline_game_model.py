@@ -12,7 +12,7 @@ class OfflineGameModel(PlayableGameModelBase):
         super().__init__(play_as_color=game_parameters[GameOption.COLOR],
                          variant=game_parameters[GameOption.VARIANT])
 
-        self.engine_model = EngineModel(self.board_model, game_parameters)
+        self.engine_model = EngineModel(self.board_model, game_parameters, self.game_metadata)
         self.game_in_progress = True
         self._update_game_metadata(EventTopics.GAME_PARAMS, data=game_parameters)
 
@@ -30,7 +30,7 @@ class OfflineGameModel(PlayableGameModelBase):
         """Sends the move to the board model for it to be made"""
         if self.game_in_progress:
             try:
-                if self.board_model.board.is_game_over():
+                if self.board_model.get_game_over_result() is not None:
                     self.game_in_progress = False
                     raise Warning("Game has already ended")
 
@@ -38,7 +38,6 @@ class OfflineGameModel(PlayableGameModelBase):
                     raise Warning("Not your turn")
 
                 self.board_model.make_move(move.strip())
-                self.premove_model.clear_premove()
 
             except Exception:
                 raise
@@ -47,17 +46,18 @@ class OfflineGameModel(PlayableGameModelBase):
             raise Warning("Game has already ended")
 
     def set_premove(self, move: str) -> None:
-        """Sets the premove"""
+        """Adds the move to the premove queue"""
         self.premove_model.set_premove(move)
 
     def propose_takeback(self) -> None:
         """Take back the previous move"""
         try:
-            if self.board_model.board.is_game_over():
+            if self.board_model.get_game_over_result() is not None:
                 raise Warning("Game has already ended")
 
             self.premove_model.clear_premove()
             self.board_model.takeback(self.my_color)
+            self.engine_model.stop_search()
         except Exception as e:
             log.error(f"Takeback failed - {e}")
             raise
@@ -102,6 +102,7 @@ class OfflineGameModel(PlayableGameModelBase):
            This should only ever be called if the game is confirmed to be over
         """
         self.game_in_progress = False
+        self.engine_model.stop_search()
         outcome = self.board_model.get_game_over_result()
         self.game_metadata.game_status.status = outcome.termination
         self.game_metadata.game_status.winner = COLOR_NAMES[outcome.winner]
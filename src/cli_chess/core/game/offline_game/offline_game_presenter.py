@@ -34,15 +34,21 @@ class OfflineGamePresenter(PlayableGamePresenterBase):
         try:
             if self.model.is_my_turn() and move:
                 self.model.make_move(move)
+                if is_premove:
+                    # The premove is only removed from the queue once it's on the board, so
+                    # the rest of the queue is validated against the position it created
+                    self.premove_presenter.pop_premove()
                 self.make_engine_move()
-            else:
+            elif not is_premove:
                 self.premove_presenter.set_premove(move)
         except Exception as e:
             if is_premove and isinstance(e, ValueError):
-                # Don't show an alert if move made is a premove and is invalid
-                # Just allow the user to make a new move. This matches how online games.
+                # Don't show an alert if move made is a premove and is invalid. The rest
+                # of the premove queue is cancelled and the user can make a new move.
+                # This matches how online games work.
                 log.debug("Attempted to push the premove but the premove is invalid in the new position")
-                log.debug("Waiting for user to make a new move...")
+                log.debug("Cancelling the queued premoves. Waiting for user to make a new move...")
+                self.premove_presenter.clear_premove()
             else:
                 self.view.alert.show_alert(str(e))
 
@@ -61,8 +67,10 @@ class OfflineGamePresenter(PlayableGamePresenterBase):
                 log.debug(f"Received move ({move}) from engine.")
                 self.board_presenter.make_move(move)
 
-                # After the engine moves, make the premove if set
-                self.make_move(self.premove_presenter.pop_premove(), is_premove=True)
+                # After the engine moves, make the next queued premove
+                premove = self.premove_presenter.get_premove()
+                if premove:
+                    self.make_move(premove, is_premove=True)
         except Exception as e:
             log.error(e)
             self.view.alert.show_alert(str(e))
@@ -142,6 +150,10 @@ class OfflineGamePresenter(PlayableGamePresenterBase):
         """Returns True if the game is being played against an engine"""
         return True
 
+    def is_analysis_allowed(self) -> bool:
+        """Returns True as engine analysis can be shown in offline games"""
+        return True
+
     def exit(self) -> None:
         """Exit current presenter/view"""
         try:
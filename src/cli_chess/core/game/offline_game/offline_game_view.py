@@ -27,6 +27,8 @@ class OfflineGameView(PlayableGameViewBase):
                 ]),
                 self.input_field_container,
                 self.premove_container,
+                self.analysis_container,
+                self.opening_explorer_container,
                 self.alert,
                 self.notation_help,
             ]),
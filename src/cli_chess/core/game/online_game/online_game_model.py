@@ -2,10 +2,12 @@ from cli_chess.core.game import PlayableGameModelBase
 from cli_chess.core.game.game_options import GameOption
 from cli_chess.core.api import GameStateDispatcher
 from cli_chess.core.api.incoming_event_manger import IEMEventTopics
-from cli_chess.utils import log, threaded, RequestSuccessfullySent, EventTopics
+from cli_chess.utils import log, RequestSuccessfullySent, EventTopics
 from chess import COLORS, COLOR_NAMES, WHITE, BLACK, Color
-from berserk.formats import TEXT
+from concurrent.futures import Future
+from contextlib import aclosing
 from enum import Enum, auto
+from time import perf_counter
 from typing import Optional, Dict
 from cli_chess.modules.chat import ChatModel
 
@@ -30,23 +32,24 @@ class OnlineGameModel(PlayableGameModelBase):
         self.sent_challenge_id = None
         self._update_game_metadata(EventTopics.GAME_PARAMS, sender=EventSender.LOCAL, data=game_parameters)
         self.game_state_dispatcher = Optional[GameStateDispatcher]
+        self._seek_task: Optional[Future] = None
 
         self.chat_model = ChatModel()
 
         try:
-            from cli_chess.core.api.api_manager import api_client, api_iem
+            from cli_chess.core.api.api_manager import api_network_core, api_iem
             self.api_iem = api_iem
-            self.api_client = api_client
+            self.network_core = api_network_core
         except ImportError:
             # TODO: Clean this up so the error is displayed on the main screen
-            log.error("Failed to import api_iem and api_client")
+            log.error("Failed to import api_iem and api_network_core")
             raise ImportError("API client not setup. Do you have an API token linked?")
 
-    @threaded
     def create_game(self) -> None:
         """Sends a request to lichess to start a game using the selected game parameters. Depending
            on the parameters this will either challenge the Lichess AI (stockfish), send a challenge
-           to a specific player, or create a seek against a random opponent.
+           to a specific player, or create a seek against a random opponent. The requests run on
+           the network core, so this returns without waiting on the response.
         """
         try:
             # Note: Only subscribe to IEM events right before creating challenge to lessen chance of grabbing another game
@@ -55,20 +58,21 @@ class OnlineGameModel(PlayableGameModelBase):
             self.searching = True
 
             if self.vs_ai:  # Challenge Lichess AI (stockfish)
-                self.api_client.challenges.create_ai(level=self.game_metadata.players[not self.my_color].ai_level,
-                                                     clock_limit=self.game_metadata.clocks[WHITE].time * 60,  # challenges need time in seconds
-                                                     clock_increment=self.game_metadata.clocks[WHITE].increment,
-                                                     color=COLOR_NAMES[self.my_color],
-                                                     variant=self.game_metadata.variant)
+                self.network_core.request("POST", "/api/challenge/ai", {
+                    "level": self.game_metadata.players[not self.my_color].ai_level,
+                    "clock.limit": self.game_metadata.clocks[WHITE].time * 60,  # challenges need time in seconds
+                    "clock.increment": self.game_metadata.clocks[WHITE].increment,
+                    "color": COLOR_NAMES[self.my_color],
+                    "variant": self.game_metadata.variant,
+                }, callback=self._handle_challenge_response)
             elif self.vs_opponent:  # Challenge a specific player
-                response = self.api_client.challenges.create(username=self.vs_opponent,
-                                                             rated=self.game_metadata.rated,
-                                                             clock_limit=self.game_metadata.clocks[WHITE].time * 60,
-                                                             clock_increment=self.game_metadata.clocks[WHITE].increment,
-                                                             color=self.challenge_color,
-                                                             variant=self.game_metadata.variant)
-                self.sent_challenge_id = response.get('id')
-                self._notify_game_model_updated(EventTopics.GAME_SEARCH, msg=f"Challenge sent to {self.vs_opponent}. Waiting for a response...")
+                self.network_core.request("POST", f"/api/challenge/{self.vs_opponent}", {
+                    "rated": self.game_metadata.rated,
+                    "clock.limit": self.game_metadata.clocks[WHITE].time * 60,
+                    "clock.increment": self.game_metadata.clocks[WHITE].increment,
+                    "color": self.challenge_color,
+                    "variant": self.game_metadata.variant,
+                }, callback=self._handle_challenge_response)
             else:  # Find a random opponent
                 payload = {
                     "rated": str(self.game_metadata.rated).lower(),
@@ -78,15 +82,34 @@ class OnlineGameModel(PlayableGameModelBase):
                     "color": "random",  # lila PR# 15969
                     "ratingRange": "",
                 }
-                for _ in self.api_client.board._r.post("/api/board/seek", data=payload, fmt=TEXT, stream=True):
+                self._seek_task = self.network_core.submit(self._seek(payload))
+        except Exception as e:
+            self._handle_create_game_error(e)
+
+    async def _seek(self, payload: dict) -> None:
+        """Keeps the seek open until a game starts or the search is stopped"""
+        try:
+            async with aclosing(self.network_core.stream_body("POST", "/api/board/seek", payload)) as seek_stream:
+                async for _ in seek_stream:
                     if not self.searching:
                         break
         except Exception as e:
-            # Since this exception happened in a thread, notify via the model event instead of raising
-            self.searching = False
-            msg = f"Error creating online game: {e}"
-            log.error(msg)
-            self._notify_game_model_updated(EventTopics.ERROR, msg=msg)
+            self.network_core.deliver(self._handle_create_game_error, e)
+
+    def _handle_challenge_response(self, response: Optional[Dict], error: Optional[Exception]) -> None:
+        """Handles the response of a sent challenge"""
+        if error:
+            self._handle_create_game_error(error)
+        elif self.vs_opponent and not self.vs_ai:
+            self.sent_challenge_id = response.get('id')
+            self._notify_game_model_updated(EventTopics.GAME_SEARCH, msg=f"Challenge sent to {self.vs_opponent}. Waiting for a response...")
+
+    def _handle_create_game_error(self, e: Exception) -> None:
+        """Notifies listeners that creating the game failed"""
+        self.searching = False
+        msg = f"Error creating online game: {e}"
+        log.error(msg)
+        self._notify_game_model_updated(EventTopics.ERROR, msg=msg)
 
     def _start_game(self, game_id: str) -> None:
         """Called when a game is started. Sets proper class variables
@@ -96,6 +119,7 @@ class OnlineGameModel(PlayableGameModelBase):
             self._notify_game_model_updated(EventTopics.GAME_START)
             self.game_in_progress = True
             self.searching = False
+            self._stop_seek()
             self.playing_game_id = game_id
 
             self.game_state_dispatcher = GameStateDispatcher(game_id)
@@ -106,13 +130,21 @@ class OnlineGameModel(PlayableGameModelBase):
         """The game we are playing has ended. Handle cleaning up."""
         self.game_in_progress = False
         self.searching = False
+        self._stop_seek()
         self.playing_game_id = None
         self.api_iem.unsubscribe_from_events(self._handle_iem_event)
 
+    def _stop_seek(self) -> None:
+        """Closes the seek stream if open"""
+        if self._seek_task:
+            self._seek_task.cancel()
+            self._seek_task = None
+
     def make_move(self, move: str):
-        """Sends the move to the board model for a validity check. If valid this
-           function will pass the move over to the game state dispatcher to be sent
-           Raises an exception on move or API errors.
+        """Sends the move to the board model for a validity check. If valid the move
+           is played on the board right away as a tentative move and is passed over to
+           the game state dispatcher to be sent. The move is taken back if Lichess rejects
+           it. Raises an exception on move errors.
         """
         if self.game_in_progress:
             try:
@@ -123,7 +155,8 @@ class OnlineGameModel(PlayableGameModelBase):
                     raise Warning("Null moves are not supported in online games")
 
                 move = self.board_model.verify_move(move.strip())
-                self.game_state_dispatcher.make_move(move)
+                self.board_model.make_tentative_move(move)
+                self.game_state_dispatcher.make_move(move, callback=lambda error: self._handle_move_response(move, error))
             except Exception:
                 raise
         else:
@@ -133,8 +166,16 @@ class OnlineGameModel(PlayableGameModelBase):
             else:
                 raise Warning("Game has already ended")
 
+    def _handle_move_response(self, move: str, error: Optional[Exception]) -> None:
+        """Takes back the tentative move if Lichess did not accept it"""
+        if error:
+            log.error(f"Move ({move}) was not accepted: {error}")
+            if self.board_model.rollback_tentative_move():
+                self.premove_model.clear_premove()
+                self._notify_game_model_updated(EventTopics.ERROR, msg=f"Move {move} was not accepted")
+
     def set_premove(self, move: str) -> None:
-        """Sets the premove. Raises an exception on an invalid premove"""
+        """Adds the move to the premove queue. Raises an exception on an invalid premove"""
         if self.game_in_progress and move and not self.is_my_turn():
             if move == "0000":
                 raise Warning("Null moves are not supported in online games")
@@ -259,22 +300,13 @@ class OnlineGameModel(PlayableGameModelBase):
                 self.board_model.make_moves_from_list(data.get('state', {}).get('moves', []).split())
 
             elif EventTopics.MOVE_MADE in args:
-                # TODO: Take some time measurements to see how much of an impact this approach is
-                # Resetting and replaying the moves guarantees the game between lichess
-                # and our local board are in sync (eg. takebacks, moves played on website, etc)
-                self.board_model.reset(notify=False)
-                self.board_model.make_moves_from_list(data.get('moves', []).split())
-
-                if self.is_my_turn():
-                    premove = self.premove_model.pop_premove()
-                    try:
-                        if premove:
-                            self.make_move(premove)
-                    except Exception as e:
-                        if isinstance(e, ValueError):
-                            log.debug(f"The premove set was invalid in the new context, skipping: {e}")
-                        else:
-                            log.exception(e)
+                # Syncing against the full move list guarantees the game between lichess
+                # and our local board are in sync (eg. takebacks, moves played on website, etc).
+                # The premove is sent once the moves are synced, before listeners are notified
+                sync_started_at = perf_counter()
+                sync_result = self.board_model.sync_moves_from_uci_list(data.get('moves', "").split(), before_notify=self._make_premove)
+                log.debug(f"GSD move sync took {(perf_counter() - sync_started_at) * 1000:.2f}ms "
+                          f"(applied={sync_result.applied}, popped={sync_result.popped}, full_replay={sync_result.full_replay})")
 
                 if EventTopics.GAME_END in args:
                     self._report_game_over(status=data.get('status'), winner=data.get('winner', ""))
@@ -289,6 +321,31 @@ class OnlineGameModel(PlayableGameModelBase):
             log.error(f"Error handling GameStateDispatcher event: {e}")
             raise
 
+    def _make_premove(self) -> None:
+        """Makes the next queued premove if it's our turn. This is called as soon as the
+           received moves are synced, so the premove is validated against the new position
+           and sent before the board, move list and other listeners update. If the premove
+           is no longer valid, it and the rest of the premove queue are cancelled.
+        """
+        if not self.premove_model.premove or not self.is_my_turn() or self.game_state_dispatcher.is_game_over:
+            return
+
+        premove = self.premove_model.premove
+        try:
+            move = self.board_model.verify_move(premove)
+            self.board_model.make_tentative_move(move, notify=False)
+            self.game_state_dispatcher.make_move(move, callback=lambda error: self._handle_move_response(move, error))
+            if self.game_state_dispatcher.event_received_at is not None:
+                log.debug(f"Premove ({move}) sent {(perf_counter() - self.game_state_dispatcher.event_received_at) * 1000:.2f}ms "
+                          "after the game state was received")
+            self.premove_model.pop_premove()
+        except Exception as e:
+            if isinstance(e, ValueError):
+                log.debug(f"The premove set was invalid in the new context, cancelling the premove queue: {e}")
+            else:
+                log.exception(e)
+            self.premove_model.clear_premove()
+
     def _start_clock_on_side_to_move(self) -> None:
         """Starts the clock of the side to move. Lichess does not charge either
            player until they have both made their first move.
@@ -392,7 +449,7 @@ class OnlineGameModel(PlayableGameModelBase):
         """
         if self.searching and self.sent_challenge_id:
             try:
-                self.api_client.challenges.cancel(self.sent_challenge_id)
+                self.network_core.request("POST", f"/api/challenge/{self.sent_challenge_id}/cancel")
             except Exception as e:
                 log.debug(f"Unable to cancel pending challenge: {e}")
             self.sent_challenge_id = None
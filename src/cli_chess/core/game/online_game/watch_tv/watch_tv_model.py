@@ -3,10 +3,10 @@ from cli_chess.menus.tv_channel_menu import TVChannelMenuOptions
 from cli_chess.utils.event import Event, EventTopics
 from cli_chess.utils.logging import log
 from chess import COLOR_NAMES, COLORS, Color, WHITE
-from berserk.exceptions import ResponseError
-from time import sleep
+from cli_chess.core.api.network_core import ApiResponseError
+from concurrent.futures import Future
 from typing import Optional, Dict
-import threading
+import asyncio
 
 
 class WatchTVModel(GameModelBase):
@@ -17,12 +17,12 @@ class WatchTVModel(GameModelBase):
         self._tv_stream.e_tv_stream_event.add_listener(self.stream_event_received)
 
     def start_watching(self):
-        """Notify the TV stream thread to start"""
+        """Notify the TV stream to start"""
         self._tv_stream.start()
 
     def stop_watching(self):
-        """Stop the TV stream thread"""
-        if self._tv_stream.is_alive():
+        """Stop the TV stream"""
+        if self._tv_stream.is_running():
             self._tv_stream.stop_watching()
 
     def _update_game_metadata(self, *args, data: Optional[Dict] = None) -> None:
@@ -62,7 +62,7 @@ class WatchTVModel(GameModelBase):
             raise
 
     def stream_event_received(self, *args, data: Optional[Dict] = None, **kwargs):
-        """An event was received from the TV thread. Raises exception on invalid data"""
+        """An event was received from the TV stream. Raises exception on invalid data"""
         try:
             if data:
                 if EventTopics.GAME_START in args:
@@ -84,38 +84,43 @@ class WatchTVModel(GameModelBase):
 
 
 # To restore old TV streaming logic see commit 23ca5cd
-class StreamTVChannel(threading.Thread):
+class StreamTVChannel:
+    """Streams the TV channel on the network core. Events are notified
+       on the network core's event delivery thread.
+    """
     def __init__(self, channel: TVChannelMenuOptions):
-        super().__init__(daemon=True)
         self.channel = channel
         self.max_retries = 10
         self.retries = 0
-        self._stopped = threading.Event()
         self.e_tv_stream_event = Event()
+        self.network_core = None
+        self._stream_task: Optional[Future] = None
 
         try:
-            from cli_chess.core.api.api_manager import api_client
-            self.api_client = api_client
+            from cli_chess.core.api.api_manager import api_network_core
+            self.network_core = api_network_core
         except Exception as e:
-            self.handle_exceptions(e)
-
-    def run(self):
-        """Main entrypoint for the thread"""
-        log.info(f"Started watching {self.channel.value} TV")
-        while not self._stopped.is_set():
+            log.error(e)
+            self.e_tv_stream_event.notify(EventTopics.ERROR, msg="Unable to stream TV as the API is not set up")
+
+    def start(self) -> None:
+        """Starts streaming the TV channel"""
+        if self.network_core:
+            log.info(f"Started watching {self.channel.value} TV")
+            self._stream_task = self.network_core.submit(self._stream_tv())
+
+    def is_running(self) -> bool:
+        """Returns True if the TV stream is running"""
+        return self._stream_task is not None and not self._stream_task.done()
+
+    async def _stream_tv(self) -> None:
+        """Streams the channel, moving on to the next featured game once a game
+           ends. Errors are retried with an increasing delay.
+        """
+        while True:
             try:
-                self.e_tv_stream_event.notify(EventTopics.GAME_SEARCH)
-
-                # TODO: Update to use berserk TV specific method once implemented
-                stream = self.api_client.tv._r.get(f"/api/tv/{self.channel.key}/feed", stream=True)  # noqa
-
-                for event in stream:
-                    if self._stopped.is_set():
-                        # TODO: This does close the stream, but not until the next event comes in (which can be a while
-                        #  sometimes (especially in longer time format games like Classical). Ideally there's
-                        #  a way to immediately kill the stream, without waiting for another event.
-                        break
-
+                self._notify(EventTopics.GAME_SEARCH)
+                async for event in self.network_core.stream("GET", f"/api/tv/{self.channel.key}/feed"):
                     t = event.get('t')
                     d = event.get('d')
                     if not t or not d:
@@ -123,39 +128,50 @@ class StreamTVChannel(threading.Thread):
 
                     if t == 'featured':
                         log.info(f"Started streaming TV game: {d.get('id')}")
-                        self.e_tv_stream_event.notify(EventTopics.GAME_START, data=d)
+                        self._notify(EventTopics.GAME_START, data=d)
 
                     if t == 'fen':
-                        self.e_tv_stream_event.notify(EventTopics.MOVE_MADE, data=d)
+                        self._notify(EventTopics.MOVE_MADE, data=d)
 
             except Exception as e:
-                self.handle_exceptions(e)
+                delay = self.handle_exceptions(e)
+                if delay is None:
+                    return
+                await asyncio.sleep(delay)
 
             else:
-                if not self._stopped.is_set():
-                    self.retries = 0
-                    log.debug("Sleeping 2 seconds before finding next TV game")
-                    sleep(2)
-
-    def handle_exceptions(self, e: Exception):
-        """Handles the passed in exception and responds appropriately"""
+                self.retries = 0
+                log.debug("Sleeping 2 seconds before finding next TV game")
+                await asyncio.sleep(2)
+
+    def handle_exceptions(self, e: Exception) -> Optional[float]:
+        """Handles the passed in exception and responds appropriately.
+           Returns the seconds to wait before retrying, or None if
+           the retries are exhausted.
+        """
         log.error(e)
         if self.retries <= self.max_retries:
             delay = 2 * (self.retries + 1)
 
-            if isinstance(e, ResponseError):
+            if isinstance(e, ApiResponseError):
                 if e.status_code == 429:
                     delay = 60
 
             log.info(f"Sleeping {delay} seconds before retrying ({self.max_retries - self.retries} retries left).")
-            self.e_tv_stream_event.notify(EventTopics.ERROR, msg=f"Error streaming. Retrying in {delay} seconds.")
-            sleep(delay)
+            self._notify(EventTopics.ERROR, msg=f"Error streaming. Retrying in {delay} seconds.")
             self.retries += 1
+            return delay
         else:
-            self.e_tv_stream_event.notify(EventTopics.ERROR, msg="Retries exhausted. Stopping TV.")
-            self.stop_watching()
+            self._notify(EventTopics.ERROR, msg="Retries exhausted. Stopping TV.")
+            return None
+
+    def _notify(self, *args, **kwargs) -> None:
+        """Notifies listeners on the event delivery thread"""
+        self.network_core.deliver(self.e_tv_stream_event.notify, *args, **kwargs)
 
     def stop_watching(self):
+        """Closes the TV stream at once"""
         log.info("Stopping TV stream")
-        self._stopped.set()
         self.e_tv_stream_event.remove_all_listeners()
+        if self._stream_task:
+            self._stream_task.cancel()
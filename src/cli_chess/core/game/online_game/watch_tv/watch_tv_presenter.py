@@ -21,6 +21,10 @@ class WatchTVPresenter(GamePresenterBase):
         """Sets and returns the view to use"""
         return WatchTVView(self)
 
+    def is_analysis_allowed(self) -> bool:
+        """Returns True as engine analysis can be shown when watching TV"""
+        return True
+
     def update(self, *args, **kwargs) -> None:
         """Update method called on game model updates. Overrides base."""
         super().update(*args, **kwargs)
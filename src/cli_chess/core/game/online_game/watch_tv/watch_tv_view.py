@@ -29,6 +29,8 @@ class WatchTVView(GameViewBase):
                         self.clock_lower
                     ]),
                 ]),
+                self.analysis_container,
+                self.opening_explorer_container,
                 self.alert
             ]),
             padding=0
@@ -3,6 +3,12 @@ from cli_chess.core.main.main_view import MainView
 from cli_chess.menus.main_menu import MainMenuModel, MainMenuPresenter
 from cli_chess.core.api.api_manager import required_token_scopes
 from cli_chess.modules.token_manager.token_manager_model import g_token_manager_model
+from cli_chess.modules.engine import engine_pool, opening_book, tablebase, evaluation_cache
+from cli_chess.modules.engine.engine_benchmark import print_engine_benchmark
+from cli_chess.modules.engine.self_play import SelfPlayEngine, run_self_play
+from cli_chess.modules.engine.game_analysis import DEFAULT_ANALYSIS_DEPTH, run_pgn_analysis
+from cli_chess.modules.opening_explorer import opening_explorer_index
+from cli_chess.modules.opening_explorer.opening_explorer_builder import build_opening_explorer
 from cli_chess.utils import force_recreate_configs, print_program_config
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -24,6 +30,28 @@ class MainPresenter:
             print_program_config()
             exit(0)
 
+        if args.benchmark_engine:
+            print_engine_benchmark()
+            exit(0)
+
+        if args.analyze:
+            run_pgn_analysis(args.analyze, depth=args.analyze_depth or DEFAULT_ANALYSIS_DEPTH, workers=args.analyze_workers)
+            exit(0)
+
+        if args.self_play:
+            try:
+                engine_a, engine_b = [SelfPlayEngine.from_string(engine) for engine in args.self_play_engines]
+            except ValueError as e:
+                print(e)
+                exit(1)
+            run_self_play(engine_a, engine_b, args.self_play, variant=args.self_play_variant, fen=args.self_play_fen,
+                          output_path=args.self_play_output, workers=args.self_play_workers)
+            exit(0)
+
+        if args.build_explorer is not None:
+            build_opening_explorer(opening_explorer_index, args.build_explorer, workers=args.explorer_workers)
+            exit(0)
+
         if args.reset_config:
             force_recreate_configs()
             print("Configuration successfully reset")
@@ -40,3 +68,7 @@ class MainPresenter:
     def run(self):
         """Starts the main application"""
         self.view.run()
+        engine_pool.shutdown()
+        opening_book.close()
+        tablebase.close()
+        evaluation_cache.save()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from cli_chess.utils.ui_common import handle_mouse_click, exit_app, get_custom_style
 from cli_chess.utils import is_windows_os, default, log
+from cli_chess.utils.event import event_stats
 from cli_chess.utils.config import terminal_config
 from importlib.metadata import version
 from prompt_toolkit.application import Application
@@ -38,6 +39,7 @@ class MainView:
                 style=self._get_combined_styles(),
                 refresh_interval=0.5
             )
+            self.app.after_render += lambda _: event_stats.end_frame()
 
             global main_view
             main_view = self
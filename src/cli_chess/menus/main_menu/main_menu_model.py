@@ -5,6 +5,7 @@ from enum import Enum
 class MainMenuOptions(Enum):
     OFFLINE_GAMES = "Offline Games"
     ONLINE_GAMES = "Online Games"
+    SAVED_GAMES = "Saved Games"
     SETTINGS = "Settings"
     ABOUT = "About"
 
@@ -20,6 +21,7 @@ class MainMenuModel(MenuModel):
         menu_options = [
             MenuOption(MainMenuOptions.OFFLINE_GAMES, "Play games offline"),
             MenuOption(MainMenuOptions.ONLINE_GAMES, "Play games online using Lichess.org"),
+            MenuOption(MainMenuOptions.SAVED_GAMES, "Browse and search your saved games"),
             MenuOption(MainMenuOptions.SETTINGS, "Modify cli-chess settings"),
             MenuOption(MainMenuOptions.ABOUT, ""),
         ]
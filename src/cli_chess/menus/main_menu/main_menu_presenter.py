@@ -5,6 +5,7 @@ from cli_chess.menus.online_games_menu import OnlineGamesMenuModel, OnlineGamesM
 from cli_chess.menus.offline_games_menu import OfflineGamesMenuModel, OfflineGamesMenuPresenter
 from cli_chess.menus.settings_menu import SettingsMenuModel, SettingsMenuPresenter
 from cli_chess.modules.about import AboutPresenter
+from cli_chess.modules.game_archive import GameArchivePresenter, g_game_archive_model
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from cli_chess.menus.main_menu import MainMenuModel
@@ -17,6 +18,7 @@ class MainMenuPresenter(MenuPresenter):
         self.online_games_menu_presenter = OnlineGamesMenuPresenter(OnlineGamesMenuModel())
         self.offline_games_menu_presenter = OfflineGamesMenuPresenter(OfflineGamesMenuModel())
         self.settings_menu_presenter = SettingsMenuPresenter(SettingsMenuModel())
+        self.game_archive_presenter = GameArchivePresenter(g_game_archive_model)
         self.about_presenter = AboutPresenter()
         self.view = MainMenuView(self)
         self.selection = self.model.get_menu_options()[0].option
@@ -52,6 +52,11 @@ class MainMenuView(MenuView):
                     & Condition(lambda: self.presenter.selection == MainMenuOptions.ONLINE_GAMES)
                     & Condition(api_is_ready)
                 ),
+                ConditionalContainer(
+                    Box(self.presenter.game_archive_presenter.view, padding=0, padding_right=1),
+                    filter=~is_done
+                    & Condition(lambda: self.presenter.selection == MainMenuOptions.SAVED_GAMES)
+                ),
                 ConditionalContainer(
                     Box(self.presenter.settings_menu_presenter.view, padding=0, padding_right=1),
                     filter=~is_done
@@ -84,6 +89,8 @@ class MainMenuView(MenuView):
             fragments = self.presenter.online_games_menu_presenter.view.get_function_bar_fragments()
         elif self.presenter.selection == MainMenuOptions.OFFLINE_GAMES:
             fragments = self.presenter.offline_games_menu_presenter.view.get_function_bar_fragments()
+        elif self.presenter.selection == MainMenuOptions.SAVED_GAMES:
+            fragments = self.presenter.game_archive_presenter.view.get_function_bar_fragments()
         elif self.presenter.selection == MainMenuOptions.SETTINGS:
             fragments = self.presenter.settings_menu_presenter.view.get_function_bar_fragments()
         elif self.presenter.selection == MainMenuOptions.ABOUT:
@@ -102,6 +109,11 @@ class MainMenuView(MenuView):
             filter=Condition(lambda: self.presenter.selection == MainMenuOptions.OFFLINE_GAMES)
         )
 
+        game_archive_kb = ConditionalKeyBindings(
+            self.presenter.game_archive_presenter.view.get_function_bar_key_bindings(),
+            filter=Condition(lambda: self.presenter.selection == MainMenuOptions.SAVED_GAMES)
+        )
+
         settings_kb = ConditionalKeyBindings(
             self.presenter.settings_menu_presenter.view.get_function_bar_key_bindings(),
             filter=Condition(lambda: self.presenter.selection == MainMenuOptions.SETTINGS)
@@ -111,7 +123,7 @@ class MainMenuView(MenuView):
             self.presenter.about_presenter.view.get_function_bar_key_bindings(),
             filter=Condition(lambda: self.presenter.selection == MainMenuOptions.ABOUT)
         )
-        return merge_key_bindings([online_games_kb, offline_games_kb, settings_kb, about_kb])
+        return merge_key_bindings([online_games_kb, offline_games_kb, game_archive_kb, settings_kb, about_kb])
 
     def __pt_container__(self) -> Container:
         return self.main_menu_container
@@ -0,0 +1,3 @@
+from .analysis_model import AnalysisModel, AnalysisLine
+from .analysis_view import AnalysisView
+from .analysis_presenter import AnalysisPresenter
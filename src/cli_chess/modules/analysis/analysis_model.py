@@ -0,0 +1,194 @@
+from cli_chess.modules.board import BoardModel
+from cli_chess.utils import EventManager, log, threaded
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import chess.engine
+import threading
+
+DEFAULT_MULTIPV = 3
+ANALYSIS_ENGINE_CFG = {
+    'Skill Level': 20,
+    'UCI_LimitStrength': False,
+}
+
+
+@dataclass
+class AnalysisLine:
+    multipv: int
+    depth: int
+    score: chess.engine.PovScore
+    pv: List[chess.Move] = field(default_factory=list)
+
+
+class AnalysisModel:
+    """Runs a background multi-PV engine analysis of the board position. The
+       analysis is restarted automatically each time the board position changes.
+       The best line of each analysed position is saved to the evaluation cache,
+       and cached evaluations are shown until the engine searches deeper.
+       Analysis updates are sent on a coalescing event, so a fast search sends
+       at most a single update per UI frame.
+    """
+    def __init__(self, board_model: BoardModel, multipv: int = DEFAULT_MULTIPV):
+        self.board_model = board_model
+        self.board_model.e_board_model_updated.add_listener(self.update)
+        self.multipv = multipv
+
+        self._running = False
+        self._generation = 0
+        self._lines: Dict[int, AnalysisLine] = {}
+        self._analysed_board: Optional[chess.Board] = None
+        self._analysed_outcome: Optional[chess.Outcome] = None
+        self._position: Optional[Tuple[chess.Board, Optional[chess.Outcome]]] = None
+        self._tablebase_wdl: Optional[int] = None
+        self._analysis: Optional[chess.engine.SimpleAnalysisResult] = None
+        self._position_changed = threading.Event()
+        self._lock = threading.Lock()
+
+        self._event_manager = EventManager()
+        self.e_analysis_model_updated = self._event_manager.create_event(coalesce=True)
+
+    def start(self) -> None:
+        """Starts analysing the board position in the background"""
+        if not self._running:
+            self._running = True
+            self._generation += 1
+            self._set_position()
+            self._position_changed = threading.Event()
+            self._run_analysis(self._generation, self._position_changed)
+
+    def stop(self) -> None:
+        """Stops the background analysis"""
+        if self._running:
+            self._running = False
+            self._stop_current_analysis()
+
+    def is_running(self) -> bool:
+        """Returns True if the background analysis is running"""
+        return self._running
+
+    def update(self, *args, **kwargs) -> None:  # noqa
+        """Restarts the analysis if the board position changed"""
+        if self._running:
+            with self._lock:
+                position = self._position
+            if position is None or position[0].fen() != self.board_model.board.fen():
+                self._set_position()
+                self._stop_current_analysis()
+
+    def get_lines(self) -> List[AnalysisLine]:
+        """Returns the latest analysis lines ordered by rank"""
+        with self._lock:
+            return [self._lines[multipv] for multipv in sorted(self._lines)]
+
+    def get_analysed_board(self) -> Optional[chess.Board]:
+        """Returns a copy of the board the current analysis lines are for"""
+        with self._lock:
+            return self._analysed_board.copy(stack=False) if self._analysed_board else None
+
+    def get_analysed_outcome(self) -> Optional[chess.Outcome]:
+        """Returns the outcome of the analysed board, or None if the game is not over"""
+        with self._lock:
+            return self._analysed_outcome
+
+    def get_tablebase_wdl(self) -> Optional[int]:
+        """Returns the Syzygy tablebase win/draw/loss of the analysed board from the
+           side to moves point of view, or None if the position was not found
+        """
+        with self._lock:
+            return self._tablebase_wdl
+
+    def _set_position(self) -> None:
+        """Saves a copy of the board position and its outcome for the analysis thread to
+           analyse. This is called on the thread updating the board model, so the analysis
+           thread never reads the board model while it's being changed.
+        """
+        position = (self.board_model.board.copy(), self.board_model.get_board_outcome())
+        with self._lock:
+            self._position = position
+
+    def _stop_current_analysis(self) -> None:
+        """Stops the current engine analysis so the analysis thread can restart or exit"""
+        self._position_changed.set()
+        with self._lock:
+            if self._analysis:
+                self._analysis.stop()
+
+    @threaded
+    def _run_analysis(self, generation: int, position_changed: threading.Event) -> None:
+        """Analyses the board position until stopped. Runs in its own thread. The generation
+           stops a previous analysis thread from carrying on if the analysis is restarted quickly.
+           Each generation has its own position changed event, so restarting the analysis
+           can't clear the event a previous analysis thread is waiting on to exit.
+        """
+        # Imported here as the engine module depends on the game package, which depends on this module
+        from cli_chess.modules.engine import engine_pool, tablebase, evaluation_cache
+        engine = None
+        try:
+            engine = engine_pool.checkout(ANALYSIS_ENGINE_CFG)
+            while self._running and generation == self._generation:
+                position_changed.clear()
+                with self._lock:
+                    board, outcome = self._position
+                tablebase_wdl = tablebase.probe_wdl(board)
+                cached = evaluation_cache.get(board)
+                with self._lock:
+                    self._analysed_board = board
+                    self._analysed_outcome = outcome
+                    self._tablebase_wdl = tablebase_wdl
+                    self._lines = {}
+                    if cached and cached.best_move and board.is_legal(cached.best_move):
+                        # Show the cached evaluation until the engine searches deeper
+                        self._lines[1] = AnalysisLine(1, cached.depth, cached.score, [cached.best_move])
+                self._notify_analysis_model_updated()
+
+                with engine.analysis(board, multipv=self.multipv, game=self) as analysis:
+                    with self._lock:
+                        if generation == self._generation:
+                            self._analysis = analysis
+                    if position_changed.is_set():
+                        analysis.stop()
+
+                    for info in analysis:
+                        self._handle_info(info)
+
+                with self._lock:
+                    if self._analysis is analysis:
+                        self._analysis = None
+                    best_line = self._lines.get(1)
+                if best_line:
+                    evaluation_cache.put(board, best_line.depth, best_line.score, best_line.pv[0])
+
+                # The search can end on its own (e.g. the game is over)
+                # in which case there's nothing to do until the position changes
+                position_changed.wait()
+        except Exception as e:
+            log.error(f"Engine analysis error: {e}")
+            if generation == self._generation:
+                self._running = False
+        finally:
+            if engine:
+                engine_pool.release(engine)
+
+    def _handle_info(self, info: chess.engine.InfoDict) -> None:
+        """Saves the analysis line from the engine info"""
+        if info.get("pv") and "score" in info:
+            multipv = info.get("multipv", 1)
+            depth = info.get("depth", 0)
+            with self._lock:
+                line = self._lines.get(multipv)
+                if line and line.depth > depth:
+                    # Keep deeper lines (e.g. from the evaluation cache)
+                    return
+                self._lines[multipv] = AnalysisLine(multipv, depth, info["score"], info["pv"])
+            self._notify_analysis_model_updated()
+
+    def _notify_analysis_model_updated(self) -> None:
+        """Notifies listeners of analysis model updates"""
+        self.e_analysis_model_updated.notify()
+
+    def cleanup(self) -> None:
+        """Handles model cleanup tasks. This should only ever
+           be run when this model is no longer needed.
+        """
+        self.stop()
+        self._event_manager.purge_all_events()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from cli_chess.modules.analysis import AnalysisView
+from cli_chess.utils.ui_common import repaint_ui
+from cli_chess.utils import log
+from chess.engine import Score
+import chess
+from typing import TYPE_CHECKING, List
+if TYPE_CHECKING:
+    from cli_chess.modules.analysis import AnalysisModel
+
+MAX_PV_PLIES = 8
+TABLEBASE_RESULTS = {
+    2: "White wins",
+    1: "Draw by fifty-move rule (White cursed win)",
+    0: "Draw",
+    -1: "Draw by fifty-move rule (Black cursed win)",
+    -2: "Black wins",
+}
+
+
+class AnalysisPresenter:
+    def __init__(self, model: AnalysisModel):
+        self.model = model
+        self.view = AnalysisView(self)
+        self.model.e_analysis_model_updated.add_listener(self.update)
+
+    def update(self) -> None:
+        """Updates the analysis output"""
+        self.view.update()
+
+    def toggle_analysis(self) -> None:
+        """Starts or stops the engine analysis and shows or hides the analysis view"""
+        if self.model.is_running():
+            self.model.stop()
+            self.view.visible = False
+        else:
+            self.model.start()
+            self.view.visible = True
+        repaint_ui()
+
+    def get_formatted_lines(self) -> List[str]:
+        """Returns the formatted analysis output. The first line contains the search
+           depth, and is followed by each principal variation. If the position is in
+           the Syzygy tablebase, the tablebase result is shown before the analysis.
+        """
+        lines = self.model.get_lines()
+        board = self.model.get_analysed_board()
+        if board and self.model.get_analysed_outcome():
+            return ["Game over • No moves to analyse"]
+
+        output = []
+        wdl = self.model.get_tablebase_wdl()
+        if board and wdl is not None:
+            output.append(f"Syzygy • {TABLEBASE_RESULTS[wdl if board.turn == chess.WHITE else -wdl]}")
+
+        if not lines or not board:
+            return output + ["Analysing..."]
+
+        output.append(f"Fairy-Stockfish • Depth {max(line.depth for line in lines)}")
+        for line in lines:
+            try:
+                pv = board.variation_san(line.pv[:MAX_PV_PLIES])
+            except ValueError as e:
+                log.debug(f"Skipping invalid analysis line: {e}")
+                continue
+            output.append(f"{self.format_score(line.score.white()):>6}  {pv}")
+        return output
+
+    @staticmethod
+    def format_score(score: Score) -> str:
+        """Returns the passed in score formatted for display (e.g. +0.35 or #-3)"""
+        mate = score.mate()
+        if mate is not None:
+            return f"#{mate}" if mate > 0 else f"#-{abs(mate)}"
+        return f"{score.score() / 100:+.2f}"
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from prompt_toolkit.layout import Container, ConditionalContainer, Window, FormattedTextControl, D
+from prompt_toolkit.filters import Condition
+from cli_chess.utils.ui_common import repaint_ui
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from cli_chess.modules.analysis import AnalysisPresenter
+
+
+class AnalysisView:
+    def __init__(self, presenter: AnalysisPresenter):
+        self.presenter = presenter
+        self.visible = False
+        self._analysis_output = FormattedTextControl(text=self._get_analysis_text, style="class:analysis", show_cursor=False)
+        self._container = self._create_container()
+
+    def _create_container(self) -> Container:
+        """Create the analysis container"""
+        return ConditionalContainer(
+            Window(self._analysis_output, always_hide_cursor=True, wrap_lines=False, height=D(max=4)),
+            Condition(lambda: self.visible)
+        )
+
+    def _get_analysis_text(self) -> str:
+        """Returns the analysis text to display. This is pulled when the view is
+           rendered so the analysis lines are formatted at most once per UI frame
+        """
+        return "\n".join(self.presenter.get_formatted_lines()) if self.visible else ""
+
+    def update(self) -> None:
+        """Requests the analysis display to be redrawn"""
+        if self.visible:
+            repaint_ui()
+
+    def __pt_container__(self) -> Container:
+        """Returns this views container"""
+        return self._container
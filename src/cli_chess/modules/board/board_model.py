@@ -4,8 +4,162 @@ from cli_chess.utils.event import EventManager, EventTopics
 from cli_chess.utils.logging import log
 import chess
 import chess.variant
+from collections import Counter
+from dataclasses import dataclass
 from random import randint
-from typing import List, Optional
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass
+class MoveSyncResult:
+    """Holds the amount of work done while syncing the move stack"""
+    applied: int = 0
+    popped: int = 0
+    full_replay: bool = False
+
+
+class OutcomeTracker:
+    """Tracks the outcome of a board incrementally. A repetition table keyed by the
+       position transposition key is kept per ply, which replaces the move stack replay
+       python-chess does to detect fivefold repetition. The outcome of each ply is cached
+       once computed. The tracker follows the board move stack lazily when queried.
+    """
+    _UNKNOWN = object()
+
+    def __init__(self):
+        self._moves: List[chess.Move] = []
+        self._keys: List[Hashable] = []
+        self._outcomes: list = []
+        self._repetitions: Counter = Counter()
+
+    def outcome(self, board: chess.Board) -> Optional[chess.Outcome]:
+        """Returns the outcome of the passed in board, or None if the game is not over"""
+        self._sync(board)
+        if self._outcomes[-1] is self._UNKNOWN:
+            self._outcomes[-1] = self._compute_outcome(board)
+        return self._outcomes[-1]
+
+    def _sync(self, board: chess.Board) -> None:
+        """Syncs the tracked plies with the boards move stack. Moves are compared by
+           identity from the end, as the move stack is only ever rewritten from the end.
+           Only the plies which are new since the last sync have their keys computed.
+        """
+        move_stack = board.move_stack
+        common_plies = min(len(self._moves), len(move_stack))
+        while common_plies > 0 and self._moves[common_plies - 1] is not move_stack[common_plies - 1]:
+            common_plies -= 1
+
+        if common_plies == 0:
+            # Nothing in common (e.g. new game or position set). Track from the root position
+            self._moves.clear()
+            self._keys.clear()
+            self._outcomes.clear()
+            self._repetitions.clear()
+
+        while len(self._moves) > common_plies:
+            self._moves.pop()
+            self._outcomes.pop()
+            self._repetitions[self._keys.pop()] -= 1
+
+        new_plies = len(move_stack) - common_plies
+        if new_plies or not self._keys:
+            # Walk back from the current position to collect the keys of the new plies
+            replay_board = board.copy(stack=new_plies)
+            new_keys = [replay_board._transposition_key()]  # noqa
+            for _ in range(new_plies):
+                replay_board.pop()
+                new_keys.append(replay_board._transposition_key())  # noqa
+            new_keys.reverse()
+
+            if not self._keys:
+                self._track_key(new_keys[0])
+            for move, key in zip(move_stack[common_plies:], new_keys[1:]):
+                self._moves.append(move)
+                self._track_key(key)
+
+    def _track_key(self, key: Hashable) -> None:
+        """Adds the passed in position key as the latest ply"""
+        self._keys.append(key)
+        self._outcomes.append(self._UNKNOWN)
+        self._repetitions[key] += 1
+
+    def _compute_outcome(self, board: chess.Board) -> Optional[chess.Outcome]:
+        """Computes the outcome of the board. Mirrors board.outcome() except
+           fivefold repetition is looked up from the repetition table.
+        """
+        outcome = self._outcome_without_repetition(board)
+        if outcome is None and self._repetitions[self._keys[-1]] >= 5:
+            return chess.Outcome(chess.Termination.FIVEFOLD_REPETITION, None)
+        return outcome
+
+    @staticmethod
+    def _outcome_without_repetition(board: chess.Board) -> Optional[chess.Outcome]:
+        """Returns the boards outcome excluding fivefold repetition"""
+        if board.is_variant_loss():
+            return chess.Outcome(chess.Termination.VARIANT_LOSS, not board.turn)
+        if board.is_variant_win():
+            return chess.Outcome(chess.Termination.VARIANT_WIN, board.turn)
+        if board.is_variant_draw():
+            return chess.Outcome(chess.Termination.VARIANT_DRAW, None)
+        if board.is_checkmate():
+            return chess.Outcome(chess.Termination.CHECKMATE, not board.turn)
+        if board.is_insufficient_material():
+            return chess.Outcome(chess.Termination.INSUFFICIENT_MATERIAL, None)
+        if not any(board.generate_legal_moves()):
+            return chess.Outcome(chess.Termination.STALEMATE, None)
+        if board.is_seventyfive_moves():
+            return chess.Outcome(chess.Termination.SEVENTYFIVE_MOVES, None)
+        return None
+
+
+class LegalMoveCache:
+    """Caches the legal moves of the current position keyed by their spelling. Parsed
+       move input is remembered, and the first completion request maps every legal move
+       to its SAN, UCI and common alternative spellings (e.g. without check marks, `0-0`
+       castling or long algebraic). The cache is only cleared once the position changes,
+       so repeated validation and completion of move input is a dictionary lookup.
+    """
+    def __init__(self):
+        self._key: Optional[Hashable] = None
+        self._moves: Dict[str, chess.Move] = {}
+        self._san_moves: Optional[List[str]] = None
+
+    def get_move(self, board: chess.Board, move: str) -> chess.Move:
+        """Returns the legal move matching the passed in text. Text which isn't
+           cached is parsed by the board, which raises the appropriate move error.
+        """
+        self._sync(board)
+        legal_move = self._moves.get(move)
+        if legal_move is None:
+            legal_move = self._moves[move] = board.parse_san(move)
+        return legal_move
+
+    def get_san_moves(self, board: chess.Board) -> List[str]:
+        """Returns the legal moves of the position in SAN, sorted alphabetically"""
+        self._sync(board)
+        if self._san_moves is None:
+            self._san_moves = []
+            for move in board.legal_moves:
+                san = board.san(move)
+                self._san_moves.append(san)
+                spellings = [san, san.rstrip("+#"), move.uci()]
+                if board.is_castling(move):
+                    spellings.append(san.rstrip("+#").replace("O", "0"))
+                else:
+                    lan = board.lan(move).rstrip("+#")
+                    spellings.extend([lan, lan.replace("-", "")])
+                for spelling in spellings:
+                    self._moves.setdefault(spelling, move)
+            self._san_moves.sort()
+        return self._san_moves
+
+    def _sync(self, board: chess.Board) -> None:
+        """Clears the cache if the board position has changed since the last query"""
+        key = (type(board), board.chess960, board._transposition_key())  # noqa
+        if key != self._key:
+            self._key = key
+            self._moves = {}
+            self._san_moves = None
 
 
 class BoardModel:
@@ -15,8 +169,13 @@ class BoardModel:
         self.orientation = chess.WHITE if variant.lower() == "racingkings" else orientation
         self.side_confirmed = side_confirmed  # flag to indicate if the users color is fully confirmed (e.g. online)
         self.highlight_move = chess.Move.null()
-        self.premove_highlight = chess.Move.null()
+        self.premove_highlights: List[chess.Move] = []
+        self.tentative_move: Optional[chess.Move] = None
         self._game_over_result: Optional[chess.Outcome] = None
+        self._game_end_notified = False
+        self._outcome_tracker = OutcomeTracker()
+        self._legal_move_cache = LegalMoveCache()
+        self._move_stack_uci_cache: Tuple[List[str], Optional[chess.Move]] = ([], None)
         self._log_init_info()
 
         self._event_manager = EventManager()
@@ -54,7 +213,8 @@ class BoardModel:
             self.initial_fen = self.board.fen()
             self.set_board_orientation(chess.WHITE if variant.lower() == "racingkings" else orientation, notify=False)
             self.highlight_move = chess.Move.from_uci(uci_last_move) if uci_last_move else chess.Move.null()
-            self._game_over_result = None
+            self.tentative_move = None
+            self._reset_game_over_result()
             self.side_confirmed = is_side_confirmed
 
             self._log_init_info()
@@ -69,7 +229,6 @@ class BoardModel:
         """
         self.board.reset()
         self.set_fen(self.initial_fen, notify=False)
-        self._game_over_result = None
 
         if notify:
             self._notify_board_model_updated(EventTopics.GAME_START)
@@ -83,15 +242,17 @@ class BoardModel:
                 raise Warning("The game has already ended")
 
             move = move.strip()
-            move = self.board.push_san(move)
+            move = self._legal_move_cache.get_move(self.board, move)
+            self.board.push(move)
             self.highlight_move = move
 
             if notify:
                 log.debug(f"Made move ({move})")
-                if not self.is_game_over():
-                    self._notify_board_model_updated(EventTopics.MOVE_MADE)
-                else:
+                if self._update_game_over_result() and not self._game_end_notified:
+                    self._game_end_notified = True
                     self._notify_board_model_updated(EventTopics.MOVE_MADE, EventTopics.GAME_END)
+                else:
+                    self._notify_board_model_updated(EventTopics.MOVE_MADE)
         except Exception as e:
             log.error(e)
             if isinstance(e, chess.InvalidMoveError):
@@ -105,6 +266,37 @@ class BoardModel:
 
         return move
 
+    def make_tentative_move(self, move: str, notify=True) -> chess.Move:
+        """Makes the move ahead of the server accepting it (e.g. a move sent in an online
+           game), so it's shown without waiting on the round trip. The move is confirmed
+           once a synced move list contains it, and rolled back if the synced move list
+           differs or `rollback_tentative_move` is called. Raises a ValueError on illegal moves.
+           Listeners are only notified of the move made. The game end is not notified while the
+           move is tentative, as the server decides if the move ended the game.
+           If notify is false, a model update notification will not be sent.
+        """
+        self.make_move(move, notify=False)
+        self.tentative_move = self.board.peek()
+        if notify:
+            log.debug(f"Made tentative move ({self.tentative_move})")
+            self._notify_board_model_updated(EventTopics.MOVE_MADE)
+        return self.tentative_move
+
+    def rollback_tentative_move(self) -> bool:
+        """Takes back the tentative move if it's still the last move played (e.g. the
+           server rejected it). Returns True if the move was taken back.
+        """
+        tentative_move, self.tentative_move = self.tentative_move, None
+        if tentative_move is None or not self.board.move_stack or self.board.move_stack[-1] is not tentative_move:
+            return False
+
+        self.board.pop()
+        self.highlight_move = self.board.peek() if self.board.move_stack else chess.Move.null()
+        self._reset_game_over_result()
+        log.debug(f"Rolled back tentative move ({tentative_move})")
+        self._notify_board_model_updated(EventTopics.MOVE_MADE)
+        return True
+
     def verify_move(self, move: str) -> str:
         """Verify if the passed in move is valid in the current position.
            Raises an exception on move errors (ambiguous, invalid, illegal).
@@ -114,7 +306,7 @@ class BoardModel:
             if self.is_game_over():
                 raise Warning("The game has already ended")
 
-            return str(self.board.parse_san(move))
+            return str(self._legal_move_cache.get_move(self.board, move.strip()))
         except Exception as e:
             log.error(e)
             if isinstance(e, chess.InvalidMoveError):
@@ -126,6 +318,12 @@ class BoardModel:
             else:
                 raise e
 
+    def get_move_completions(self, text: str) -> List[str]:
+        """Returns the legal moves in SAN which start with the passed in text"""
+        if self.is_game_over():
+            return []
+        return [san for san in self._legal_move_cache.get_san_moves(self.board) if san.startswith(text)]
+
     def make_moves_from_list(self, move_list: list) -> None:
         """Attempts to make all moves in the provided move list.
            Raises a ValueError on an illegal move.
@@ -141,6 +339,82 @@ class BoardModel:
             log.debug(f"Updated board with moves from list. Last move played: {move_list[-1]}")
             self._notify_board_model_updated(EventTopics.MOVE_MADE)
 
+    def sync_moves_from_uci_list(self, uci_moves: List[str], notify=True, before_notify: Optional[Callable[[], None]] = None) -> MoveSyncResult:
+        """Brings the move stack in line with the passed in list of UCI moves (e.g. the
+           full move list sent by Lichess). Only the local moves that diverge from the list
+           are popped and only the new moves are pushed. A full reset and replay is done if
+           no common prefix exists or the new moves cannot be applied on top of it. A pending
+           tentative move is kept while the list only lacks that move (i.e. the server has
+           not processed it yet). The optional before_notify callback is called once the
+           moves are synced and before listeners are notified (e.g. to send a premove without
+           waiting on the listeners). Returns the amount of plies applied and popped.
+           Raises a ValueError on an illegal move.
+        """
+        result = MoveSyncResult()
+        move_stack = self.board.move_stack
+        local_plies = len(move_stack)
+        local_uci_moves = self._get_move_stack_uci()
+
+        if self.tentative_move is not None:
+            if move_stack and move_stack[-1] is self.tentative_move and uci_moves == local_uci_moves[:-1]:
+                return result
+            self.tentative_move = None
+
+        common_plies = 0
+        max_common_plies = min(local_plies, len(uci_moves))
+        while common_plies < max_common_plies and local_uci_moves[common_plies] == uci_moves[common_plies]:
+            common_plies += 1
+
+        try:
+            if common_plies == 0 and move_stack and uci_moves:
+                raise ValueError("No common prefix with the local move stack")
+
+            while len(self.board.move_stack) > common_plies:
+                self.board.pop()
+                result.popped += 1
+
+            for move in uci_moves[common_plies:]:
+                self.board.push_uci(move)
+                result.applied += 1
+        except ValueError as e:
+            log.debug(f"Falling back to a full move replay: {e}")
+            self.reset(notify=False)
+            result = MoveSyncResult(popped=local_plies, full_replay=True)
+            try:
+                for move in uci_moves:
+                    self.board.push_uci(move)
+                    result.applied += 1
+            except ValueError:
+                log.error(f"Unable to sync moves from list: {uci_moves}")
+                raise ValueError(f"Illegal move: {uci_moves[result.applied]}")
+
+        self._move_stack_uci_cache = (list(uci_moves), self.board.move_stack[-1] if self.board.move_stack else None)
+
+        if result.popped:
+            self._reset_game_over_result()
+
+        synced_plies = len(self.board.move_stack)
+        if before_notify:
+            before_notify()
+
+        if result.applied or result.popped or len(self.board.move_stack) != synced_plies:
+            self.highlight_move = self.board.peek() if self.board.move_stack else chess.Move.null()
+            if notify:
+                log.debug(f"Synced move stack (applied={result.applied}, popped={result.popped}, full_replay={result.full_replay})")
+                self._notify_board_model_updated(EventTopics.MOVE_MADE)
+
+        return result
+
+    def _get_move_stack_uci(self) -> List[str]:
+        """Returns the move stack as a list of UCI strings. The list from the last
+           sync is reused if the move stack has not been altered since.
+        """
+        cached_uci_moves, cached_last_move = self._move_stack_uci_cache
+        move_stack = self.board.move_stack
+        if len(cached_uci_moves) == len(move_stack) and (not move_stack or move_stack[-1] is cached_last_move):
+            return cached_uci_moves
+        return [move.uci() for move in move_stack]
+
     def takeback(self, caller_color: chess.Color):
         """Issues a takeback, so it's the callers move again. Raises a Warning if the move
            stack is empty or takeback of opponents move is attempted.
@@ -222,6 +496,8 @@ class BoardModel:
         try:
             self.board.set_fen(fen)
             self.initial_fen = fen
+            self.tentative_move = None
+            self._reset_game_over_result()
 
             if notify:
                 self._notify_board_model_updated()
@@ -318,19 +594,52 @@ class BoardModel:
         except Exception as e:
             log.error(f"Error caught setting board position: {e}")
 
-    def is_game_over(self) -> bool:
-        """Returns True if the game is over"""
-        self._game_over_result = self.board.outcome() if self._game_over_result is None else self._game_over_result
+    def set_board(self, board: chess.Board, highlight_move: chess.Move = chess.Move.null(), notify=True) -> None:
+        """Replaces the board with the passed in board (e.g. a position being reviewed)
+           and sets the move to highlight. The initial FEN is kept as is.
+           If notify is false, a model update notification will not be sent.
+        """
+        self.board = board
+        self.highlight_move = highlight_move
+        self._reset_game_over_result()
 
-        is_game_over = self._game_over_result is not None
-        if is_game_over:
+        if notify:
+            self._notify_board_model_updated(EventTopics.MOVE_MADE)
+
+    def is_game_over(self) -> bool:
+        """Returns True if the game is over. Listeners are notified of the game
+           end the first time it is detected, unless the last move is tentative.
+        """
+        is_game_over = self._update_game_over_result()
+        if is_game_over and not self._game_end_notified and self.tentative_move is None:
+            self._game_end_notified = True
             self._notify_board_model_updated(EventTopics.GAME_END)
 
         return is_game_over
 
+    def _update_game_over_result(self) -> bool:
+        """Updates the game over result from the outcome tracker if the game
+           has not already ended. Returns True if the game is over.
+        """
+        if self._game_over_result is None:
+            self._game_over_result = self._outcome_tracker.outcome(self.board)
+        return self._game_over_result is not None
+
+    def _reset_game_over_result(self) -> None:
+        """Clears the game over result (e.g. the position has been reset or moves taken back)"""
+        self._game_over_result = None
+        self._game_end_notified = False
+
     def get_game_over_result(self) -> chess.Outcome:
         """Returns the reason the game ended as an Outcome object"""
-        return self._game_over_result if self._game_over_result else self.board.outcome()
+        return self._game_over_result if self._game_over_result else self.get_board_outcome()
+
+    def get_board_outcome(self) -> Optional[chess.Outcome]:
+        """Returns the outcome of the board position (e.g. checkmate), or None if the
+           game is not over. Unlike the game over result, this excludes game ends which
+           are not decided on the board, such as resignations.
+        """
+        return self._outcome_tracker.outcome(self.board)
 
     def handle_resignation(self, color_resigning: chess.Color) -> None:
         """Handle marking the game as ended by resignation. The color
@@ -338,6 +647,7 @@ class BoardModel:
            listeners that the game is over.
         """
         self._game_over_result = chess.Outcome("resignation", not color_resigning)  # noqa
+        self._game_end_notified = True
         self._notify_board_model_updated(EventTopics.GAME_END)
 
     def set_premove_highlight(self, move: chess.Move) -> None:
@@ -349,12 +659,18 @@ class BoardModel:
            (possible) move.
         """
         if bool(move):
-            self.premove_highlight = move
-            self._notify_board_model_updated()
+            self.set_premove_highlights([move])
+
+    def set_premove_highlights(self, moves: List[chess.Move]) -> None:
+        """Sets the moves that should be highlighted on the board as
+           queued premoves. Replaces any previously set premove highlights.
+        """
+        self.premove_highlights = [move for move in moves if bool(move)]
+        self._notify_board_model_updated()
 
     def clear_premove_highlight(self):
-        """Clears the set premove highlight"""
-        self.premove_highlight = chess.Move.null()
+        """Clears the set premove highlights"""
+        self.premove_highlights = []
         self._notify_board_model_updated()
 
     def cleanup(self) -> None:
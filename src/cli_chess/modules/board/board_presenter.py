@@ -2,18 +2,42 @@ from __future__ import annotations
 from cli_chess.modules.board import BoardView
 from cli_chess.modules.common import get_piece_unicode_symbol
 from cli_chess.utils.config import game_config
+from cli_chess.utils.event import Event
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from dataclasses import dataclass
+from time import perf_counter
 import chess
-from typing import List, Dict
+from typing import Dict, Optional, Tuple
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from cli_chess.modules.board import BoardModel
 
 
+@dataclass
+class BoardRenderStats:
+    render_count: int = 0
+    full_render_count: int = 0
+    squares_rendered: int = 0
+    last_render_time: float = 0.0
+    total_render_time: float = 0.0
+
+
 class BoardPresenter:
     def __init__(self, model: BoardModel) -> None:
         self.model = model
         self.game_config_values = game_config.get_all_values()
-        self.view = BoardView(self, self.get_board_display())
+
+        # Per square fragment cache along with the state it was rendered with
+        self._square_fragments: Dict[chess.Square, StyleAndTextTuples] = {}
+        self._rendered_layout: Optional[Tuple[chess.Color, bool]] = None
+        self._rendered_pieces: Tuple[int, ...] = ()
+        self._rendered_highlights: Dict[chess.Square, str] = {}
+
+        # Event called after each render (e.g. for measuring the render cost)
+        self.render_stats = BoardRenderStats()
+        self.e_board_rendered = Event()
+
+        self.view = BoardView(self, self.get_board_fragments())
 
         self.model.e_board_model_updated.add_listener(self.update)
         game_config.e_game_config_updated.add_listener(self._update_cached_config_values)
@@ -22,7 +46,7 @@ class BoardPresenter:
         """Updates the board output"""
         # TODO: Update this so the view utilizes a lambda pointing to the presenter?
         #       This would allow for this update function to be removed
-        self.view.update(self.get_board_display())
+        self.view.update(self.get_board_fragments())
 
     def _update_cached_config_values(self):
         """Updates the 'game_config_values' variable with the
@@ -31,6 +55,7 @@ class BoardPresenter:
            This function is called automatically on game config updates
         """
         self.game_config_values = game_config.get_all_values()
+        self._square_fragments.clear()
         self.update()
 
     def make_move(self, move: str) -> None:
@@ -42,28 +67,94 @@ class BoardPresenter:
         except ValueError as e:
             raise e
 
-    def get_board_display(self) -> List[Dict]:
-        """Returns a list containing the complete board display. Each item in the list
-           is a dictionary containing the display data for that square (piece at,
-           piece color, square color, square number, etc). This data is generally sent
-           to the view to output the board display.
+    def get_board_fragments(self) -> StyleAndTextTuples:
+        """Returns the complete board display as formatted text to send to the view.
+           The fragments of each square are cached and only the squares whose piece or
+           highlight changed since the last render are recomputed. All squares are
+           recomputed on orientation, side confirmation, or configuration changes.
         """
-        board_output = []
-        board_squares = self.model.get_board_squares()
-
-        # TODO: Update this implementation to use a dictionary so
-        #       the following syntax can be used: board_output[chess.D2]?
-        for square in board_squares:
-            data = {'square_number': square,
-                    'piece_str': self.get_piece_str(square),
-                    'piece_display_color': self.get_piece_display_color(self.model.board.piece_at(square)),
-                    'square_display_color': self.get_square_display_color(square),
-                    'rank_label': self.get_rank_label(square),
-                    'is_end_of_rank': self.is_square_end_of_rank(square)}
-            board_output.append(data)
-
+        started_at = perf_counter()
+        board = self.model.board
+        layout = (self.model.get_board_orientation(), self.model.is_side_confirmed())
+        pieces = (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings, board.occupied_co[chess.WHITE])
+        highlights = self._get_square_highlights()
+
+        full_render = not self._square_fragments or layout != self._rendered_layout
+        if full_render:
+            dirty_squares = chess.BB_ALL
+        else:
+            dirty_squares = 0
+            for rendered_bb, current_bb in zip(self._rendered_pieces, pieces):
+                dirty_squares |= rendered_bb ^ current_bb
+            for square in set(self._rendered_highlights).union(highlights):
+                if self._rendered_highlights.get(square) != highlights.get(square):
+                    dirty_squares |= chess.BB_SQUARES[square]
+
+        squares_rendered = 0
+        for square in chess.scan_forward(dirty_squares):
+            self._square_fragments[square] = self._get_square_fragments(square, highlights.get(square))
+            squares_rendered += 1
+
+        self._rendered_layout = layout
+        self._rendered_pieces = pieces
+        self._rendered_highlights = highlights
+
+        board_output: StyleAndTextTuples = []
+        for square in self.model.get_board_squares():
+            board_output.extend(self._square_fragments[square])
+        board_output.append(("class:file-label", " " + self.get_file_labels()))
+
+        self._update_render_stats(squares_rendered, full_render, perf_counter() - started_at)
         return board_output
 
+    def _get_square_fragments(self, square: chess.Square, highlight: Optional[str] = None) -> StyleAndTextTuples:
+        """Returns the formatted text of the passed in square. This
+           includes the rank label and line ending where applicable
+        """
+        fragments: StyleAndTextTuples = []
+        rank_label = self.get_rank_label(square)
+        if rank_label:
+            fragments.append(("class:rank-label", rank_label))
+
+        square_color = highlight if highlight else ("light-square" if self.model.is_light_square(square) else "dark-square")
+        piece_display_color = self.get_piece_display_color(self.model.board.piece_at(square))
+        piece_str = self.get_piece_str(square)
+        fragments.append((f"class:{square_color}.{piece_display_color}", piece_str + " " if piece_str else "  "))
+
+        if self.is_square_end_of_rank(square):
+            fragments.append(("", "\n"))
+
+        return fragments
+
+    def _get_square_highlights(self) -> Dict[chess.Square, str]:
+        """Returns a dictionary of the squares which are currently highlighted
+           (last move, queued premoves, check) mapped to their square display color.
+           Empty if board highlights are disabled in the configuration.
+        """
+        highlights = {}
+        if self.game_config_values[game_config.Keys.SHOW_BOARD_HIGHLIGHTS]:
+            last_move = self.model.get_highlight_move()
+            if bool(last_move):
+                highlights[last_move.from_square] = highlights[last_move.to_square] = "last-move"
+
+            for premove_highlight in self.model.premove_highlights:
+                highlights[premove_highlight.from_square] = highlights[premove_highlight.to_square] = "pre-move"
+
+            king_square = self.model.board.king(self.model.board.turn)
+            if king_square is not None and self.model.is_square_in_check(king_square):
+                highlights[king_square] = "in-check"
+
+        return highlights
+
+    def _update_render_stats(self, squares_rendered: int, full_render: bool, render_time: float) -> None:
+        """Updates the render statistics and notifies listeners of the completed render"""
+        self.render_stats.render_count += 1
+        self.render_stats.full_render_count += 1 if full_render else 0
+        self.render_stats.squares_rendered = squares_rendered
+        self.render_stats.last_render_time = render_time
+        self.render_stats.total_render_time += render_time
+        self.e_board_rendered.notify(render_stats=self.render_stats)
+
     def get_file_labels(self) -> str:
         """Returns a string containing the file labels. An empty
            string will be returned if showing the board coordinates
@@ -145,34 +236,6 @@ class BoardPresenter:
 
         return piece_color
 
-    def get_square_display_color(self, square: chess.Square) -> str:
-        """Returns a string with the color to display the
-           square based on configuration settings, last move, and check.
-        """
-        if self.model.is_light_square(square):
-            square_color = "light-square"
-        else:
-            square_color = "dark-square"
-
-        show_board_highlights = self.game_config_values[game_config.Keys.SHOW_BOARD_HIGHLIGHTS]
-        if show_board_highlights:
-            # TODO: Lighten last move square color if on light square
-            try:
-                last_move = self.model.get_highlight_move()
-                if bool(last_move) and (square == last_move.to_square or square == last_move.from_square):
-                    square_color = "last-move"
-
-                premove_highlight = self.model.premove_highlight
-                if bool(premove_highlight) and (square == premove_highlight.from_square or square == premove_highlight.to_square):
-                    square_color = "pre-move"
-            except IndexError:
-                pass
-
-            if self.model.is_square_in_check(square):
-                square_color = "in-check"
-
-        return square_color
-
     def handle_resignation(self, color_resigning: chess.Color) -> None:
         """Handle marking the game as ended by resignation. Sends the
            resignation notification over to the model to be handled.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from cli_chess.utils.ui_common import repaint_ui
 from prompt_toolkit.layout import Window, FormattedTextControl, D
-from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.formatted_text import StyleAndTextTuples
 from prompt_toolkit.widgets import Box
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -9,9 +9,9 @@ if TYPE_CHECKING:
 
 
 class BoardView:
-    def __init__(self, presenter: BoardPresenter, initial_board_output: list):
+    def __init__(self, presenter: BoardPresenter, initial_board_output: StyleAndTextTuples):
         self.presenter = presenter
-        self.board_output = FormattedTextControl(HTML(self._build_output(initial_board_output)))
+        self.board_output = FormattedTextControl(initial_board_output)
         self._container = self._create_container()
 
     def _create_container(self):
@@ -23,30 +23,9 @@ class BoardView:
             height=D(max=9, preferred=9)
         ), padding=1)
 
-    def _build_output(self, board_output_list: list) -> str:
-        """Returns a string containing the board output to be used for
-           display. The string returned will contain HTML elements"""
-        board_output_str = ""
-
-        for square in board_output_list:
-            square_style = f"{square['square_display_color']}.{square['piece_display_color']}"
-            piece_str = square['piece_str']
-            piece_str += " " if square['piece_str'] else "  "
-
-            board_output_str += f"<rank-label>{square['rank_label']}</rank-label>"
-            board_output_str += f"<{square_style}>{piece_str}</{square_style}>"
-
-            if square['is_end_of_rank']:
-                board_output_str += "\n"
-
-        file_labels = " " + self.presenter.get_file_labels()
-        board_output_str += f"<file-label>{file_labels}</file-label>"
-
-        return board_output_str
-
-    def update(self, board_output_list: list):
-        """Updates the board output with the passed in text"""
-        self.board_output.text = HTML(self._build_output(board_output_list))
+    def update(self, board_output: StyleAndTextTuples):
+        """Updates the board output with the passed in formatted text"""
+        self.board_output.text = board_output
         repaint_ui()
 
     def __pt_container__(self) -> Box:
@@ -17,7 +17,8 @@ class ClockPresenter:
         self.view_upper = ClockView(self, lambda: self.get_clock_display(not self.model.board_model.get_board_orientation()))
         self.view_lower = ClockView(self, lambda: self.get_clock_display(self.model.board_model.get_board_orientation()))
 
-        self.model.e_game_model_updated.add_listener(self.update)
+        self.model.e_game_model_updated.add_listener(self.update, topics=[EventTopics.GAME_START, EventTopics.GAME_END,
+                                                                          EventTopics.MOVE_MADE, EventTopics.BOARD_ORIENTATION_CHANGED])
 
     def update(self, *args, **kwargs) -> None:
         """Updates the view based on specific model updates"""
@@ -1,2 +1,6 @@
-from .engine_model import EngineModel
+from .engine_pool import EnginePool, EnginePoolStats
+from .opening_book import OpeningBook, OpeningBookStats
+from .tablebase import SyzygyTablebase
+from .evaluation_cache import EvaluationCache, EvaluationCacheStats, CachedEvaluation
+from .engine_model import EngineModel, engine_pool, opening_book, tablebase, evaluation_cache
 from .engine_presenter import EnginePresenter
@@ -0,0 +1,44 @@
+from cli_chess.modules.engine.engine_model import engine_pool, fairy_stockfish_mapped_skill_levels
+from cli_chess.modules.engine.engine_time_manager import EngineTimeManager
+from cli_chess.core.game.game_options import GameOption
+from typing import Dict, Iterable
+import chess
+import time
+
+BENCHMARK_POSITIONS = [
+    chess.STARTING_FEN,
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "r2q1rk1/pp2bppp/2n1pn2/3p4/3P4/2NBPN2/PP3PPP/R2Q1RK1 w - - 0 10",
+    "8/5pk1/6p1/3R4/7P/6P1/r4PK1/8 b - - 3 40",
+]
+
+
+def benchmark_engine_think_times(levels: Iterable[int] = fairy_stockfish_mapped_skill_levels,
+                                 positions: Iterable[str] = BENCHMARK_POSITIONS) -> Dict[int, float]:
+    """Plays a move from each of the passed in positions at each skill level
+       and returns the average think time (in seconds) for each level
+    """
+    results = {}
+    for level in levels:
+        game_parameters = {GameOption.COMPUTER_SKILL_LEVEL: level}
+        time_manager = EngineTimeManager(game_parameters)
+        engine = engine_pool.checkout({'Skill Level': fairy_stockfish_mapped_skill_levels[level]})
+        try:
+            think_times = []
+            for fen in positions:
+                board = chess.Board(fen)
+                start_time = time.perf_counter()
+                engine.play(board, time_manager.get_limit(board), game=object())
+                think_times.append(time.perf_counter() - start_time)
+            results[level] = sum(think_times) / len(think_times)
+        finally:
+            engine_pool.release(engine)
+    return results
+
+
+def print_engine_benchmark() -> None:
+    """Runs the engine benchmark and prints the average think time per level"""
+    print("Benchmarking engine think time per level...")
+    for level, think_time in benchmark_engine_think_times().items():
+        print(f"Level {level}: {think_time * 1000:.0f}ms")
+    engine_pool.shutdown()
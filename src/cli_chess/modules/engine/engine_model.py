@@ -1,12 +1,25 @@
+from __future__ import annotations
 from cli_chess.modules.board import BoardModel
-from cli_chess.core.game.game_options import GameOption
+from cli_chess.modules.engine.engine_pool import EnginePool
+from cli_chess.modules.engine.engine_time_manager import EngineTimeManager
+from cli_chess.modules.engine.engine_search import EngineSearch
+from cli_chess.modules.engine.opening_book import OpeningBook
+from cli_chess.modules.engine.tablebase import SyzygyTablebase
+from cli_chess.modules.engine.evaluation_cache import EvaluationCache
 from cli_chess.utils import log, is_linux_os, is_windows_os, is_mac_os
+from cli_chess.utils.config import engine_config, get_config_path
 import chess.engine
+from concurrent.futures import CancelledError
 from os import path
 import platform
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+import threading
+if TYPE_CHECKING:
+    from cli_chess.core.game.game_metadata import GameMetadata
 
 
+FULL_STRENGTH_SKILL_LEVEL = 20
+
 fairy_stockfish_mapped_skill_levels = {
     # These defaults are for the Fairy Stockfish engine
     # correlates levels 1-8 to a fairy-stockfish "equivalent"
@@ -23,20 +36,24 @@ fairy_stockfish_mapped_skill_levels = {
 
 
 class EngineModel:
-    def __init__(self, board_model: BoardModel, game_parameters: dict):
+    def __init__(self, board_model: BoardModel, game_parameters: dict, game_metadata: Optional[GameMetadata] = None, ponder: bool = True):
         self.engine: Optional[chess.engine.SimpleEngine] = None
         self.board_model = board_model
         self.game_parameters = game_parameters
+        self.game_metadata = game_metadata
+        self.time_manager = EngineTimeManager(game_parameters)
+        self.ponder = ponder
+        self.ponder_move: Optional[chess.Move] = None
+        self.ponder_hits = 0
+        self._out_of_book_ply: Optional[int] = None
+        self._search: Optional[EngineSearch] = None
+        self._search_lock = threading.Lock()
 
     def start_engine(self):
-        """Starts and configures the Fairy-Stockfish chess engine"""
+        """Checks out a Fairy-Stockfish engine from the engine pool and configures it"""
+        from cli_chess.core.game.game_options import GameOption
         try:
-            # Use SimpleEngine to allow engine assignment in initializer. Additionally,
-            # by having this as a blocking call it stops multiple engines from being
-            # able to be started if the start game button is spammed
-            self.engine = chess.engine.SimpleEngine.popen_uci(path.dirname(path.realpath(__file__)) + "/binaries/" + self._get_engine_filename())
-
-            # Engine configuration
+            # Engine configuration (reapplied on each checkout as pooled engines are shared)
             skill_level = fairy_stockfish_mapped_skill_levels.get(self.game_parameters.get(GameOption.COMPUTER_SKILL_LEVEL))
             limit_strength = self.game_parameters.get(GameOption.SPECIFY_ELO)
             uci_elo = self.game_parameters.get(GameOption.COMPUTER_ELO)
@@ -45,20 +62,65 @@ class EngineModel:
                 'UCI_LimitStrength': True if limit_strength else False,
                 'UCI_Elo': uci_elo if uci_elo else 1350
             }
-            self.engine.configure(engine_cfg)
+
+            # Use a blocking call to allow engine assignment in initializer. Additionally,
+            # by having this as a blocking call it stops multiple engines from being
+            # able to be started if the start game button is spammed
+            self.engine = engine_pool.checkout(engine_cfg)
         except Exception as e:
             msg = f"Error starting engine: {e}"
             log.error(msg)
             raise Warning(msg)
 
     def get_best_move(self) -> chess.engine.PlayResult:
-        """Query the engine to get the best move"""
+        """Query the engine to get the best move. While in the opening book (if set) the move
+           is played from the book without searching, and likewise for endgames found in the
+           Syzygy tablebase (if set). After answering, the engine ponders on the expected
+           reply during the users turn. If the user plays the expected reply the ponder
+           search is converted to the answer (ponderhit), otherwise it is stopped.
+        """
         # Keep track of the last move that was made. This allows checking
         # for if a takeback happened while the engine has been thinking
         try:
             last_move = (self.board_model.get_move_stack() or [None])[-1]
-            result = self.engine.play(self.board_model.board,
-                                      chess.engine.Limit(2))
+            board = self.board_model.board.copy()
+            clock = self.game_metadata.clocks[board.turn] if self.game_metadata else None
+
+            book_move = self._get_book_move(board)
+            if book_move:
+                self.stop_pondering()
+                return chess.engine.PlayResult(book_move, None)
+
+            tablebase_result = tablebase.get_best_move(board)
+            if tablebase_result:
+                self.stop_pondering()
+                return chess.engine.PlayResult(tablebase_result[0], None)
+
+            cached_move = self._get_cached_move(board)
+            if cached_move:
+                self.stop_pondering()
+                return chess.engine.PlayResult(cached_move, None)
+
+            if self.ponder_move is not None and last_move == self.ponder_move:
+                self.ponder_hits += 1
+                log.debug(f"Ponderhit on {self.ponder_move} (total ponderhits: {self.ponder_hits})")
+            self.ponder_move = None
+
+            # Passing this model as the game sends `ucinewgame` on the first search of each game
+            info = chess.engine.INFO_BASIC | chess.engine.INFO_SCORE if self.is_full_strength() else chess.engine.INFO_NONE
+            search = EngineSearch(self.engine, board, self.time_manager.get_limit(board, clock), game=self, ponder=self.ponder, info=info)
+            with self._search_lock:
+                self._search = search
+            try:
+                result = search.wait()
+            finally:
+                with self._search_lock:
+                    if self._search is search:
+                        self._search = None
+
+            self.ponder_move = result.ponder if result.move and self.ponder else None
+            if result.move and info:
+                self._cache_result(board, result)
 
             # Check if the move stack has been altered, if so void this move
             if last_move != (self.board_model.get_move_stack() or [None])[-1]:
@@ -67,6 +129,13 @@ class EngineModel:
             # Check to make sure the game is still in progress (opponent hasn't resigned)
             if self.board_model.get_game_over_result() is not None:
                 result.move = None
+
+            if not result.move:
+                self.stop_pondering()
+        except CancelledError:
+            # The search was stopped (e.g. takeback, resignation or exit) or cancelled by another engine command
+            log.debug("Engine search was cancelled")
+            result = chess.engine.PlayResult(None, None)
         except Exception as e:
             log.error(f"{e}")
             if not self.engine:
@@ -76,14 +145,88 @@ class EngineModel:
         log.debug(f"Returning {result}")
         return result
 
+    def _get_book_move(self, board: chess.Board) -> Optional[chess.Move]:
+        """Returns a move from the opening book for the passed in position. Once out of
+           book the book is no longer probed, unless a takeback goes back before that point
+        """
+        if self._out_of_book_ply is not None and board.ply() >= self._out_of_book_ply:
+            return None
+
+        from cli_chess.core.game.game_options import GameOption
+        skill_level = None if self.game_parameters.get(GameOption.SPECIFY_ELO) else self.game_parameters.get(GameOption.COMPUTER_SKILL_LEVEL)
+        book_move = opening_book.get_move(board, skill_level)
+        if book_move is None:
+            self._out_of_book_ply = board.ply()
+        return book_move
+
+    def is_full_strength(self) -> bool:
+        """Returns True if the engine plays at full strength. Only full strength
+           searches are evaluations of the position which can be cached.
+        """
+        from cli_chess.core.game.game_options import GameOption
+        skill_level = fairy_stockfish_mapped_skill_levels.get(self.game_parameters.get(GameOption.COMPUTER_SKILL_LEVEL))
+        return skill_level == FULL_STRENGTH_SKILL_LEVEL and not self.game_parameters.get(GameOption.SPECIFY_ELO)
+
+    def _get_cached_move(self, board: chess.Board) -> Optional[chess.Move]:
+        """Returns the cached best move for the position if the engine plays at full strength
+           and the position has been evaluated to at least the depth the engine would search to
+        """
+        if not self.is_full_strength():
+            return None
+
+        cached = evaluation_cache.get(board, min_depth=self.time_manager.search_cap.depth or 0)
+        if cached and cached.best_move and board.is_legal(cached.best_move):
+            log.debug(f"Playing cached move: {cached.best_move} (depth {cached.depth})")
+            return cached.best_move
+        return None
+
+    @staticmethod
+    def _cache_result(board: chess.Board, result: chess.engine.PlayResult) -> None:
+        """Saves the searched evaluation of the position to the evaluation cache"""
+        if "score" in result.info and "depth" in result.info:
+            evaluation_cache.put(board, result.info["depth"], result.info["score"], result.move)
+
+    def stop_search(self) -> None:
+        """Immediately stops the in-flight engine search and any ponder search. The
+           stopped search returns a result without a move. Does nothing if the engine is idle.
+        """
+        with self._search_lock:
+            search = self._search
+            self._search = None
+
+        if search and search.is_running():
+            log.debug("Stopping engine search")
+            search.stop()
+        self.stop_pondering()
+
+    def stop_pondering(self) -> None:
+        """Stops the engine if it is pondering on the expected reply (e.g. on takebacks or
+           when the game has ended). Does nothing if the engine is not pondering.
+        """
+        if self.engine and self.ponder_move is not None:
+            self.ponder_move = None
+            try:
+                # Sending a new command to the engine stops the ponder search
+                log.debug("Stopping engine ponder search")
+                self.engine.ping()
+            except Exception as e:
+                log.error(f"Error stopping engine ponder search: {e}")
+
     def quit_engine(self) -> None:
-        """Notify the engine to quit"""
+        """Releases the engine back to the engine pool"""
         try:
             if self.engine:
-                log.debug("Quitting engine")
-                self.engine.quit()
+                self.stop_search()
+                log.debug("Releasing engine to the engine pool")
+                engine_pool.release(self.engine)
+                self.engine = None
         except Exception as e:
-            log.error(f"Error quitting engine: {e}")
+            log.error(f"Error releasing engine: {e}")
+
+    @staticmethod
+    def get_engine_path() -> str:
+        """Returns the path of the engine binary to use for opening"""
+        return path.dirname(path.realpath(__file__)) + "/binaries/" + EngineModel._get_engine_filename()
 
     @staticmethod
     def _get_engine_filename() -> str:
@@ -92,3 +235,9 @@ class EngineModel:
         if is_mac_os() and platform.machine() == "arm64":
             binary_name = "fairy-stockfish_arm64_macos"
         return binary_name
+
+
+engine_pool = EnginePool(EngineModel.get_engine_path)
+opening_book = OpeningBook(lambda: engine_config.get_value(engine_config.Keys.OPENING_BOOK_PATH))
+tablebase = SyzygyTablebase(lambda: engine_config.get_value(engine_config.Keys.SYZYGY_PATH))
+evaluation_cache = EvaluationCache(lambda: path.join(get_config_path(), "evaluation_cache.bin"))
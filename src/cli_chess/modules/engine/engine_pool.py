@@ -0,0 +1,171 @@
+from cli_chess.utils import log
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+import chess.engine
+import threading
+import time
+
+DEFAULT_MAX_IDLE_ENGINES = 1
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+@dataclass
+class EnginePoolStats:
+    """Engine pool counters. The startup time saved is estimated
+       from the average startup time of the engines started by the pool
+    """
+    engines_started: int = 0
+    engines_reused: int = 0
+    engines_evicted: int = 0
+    total_startup_time: float = 0.0
+
+    @property
+    def average_startup_time(self) -> float:
+        """Returns the average time taken to start an engine"""
+        return self.total_startup_time / self.engines_started if self.engines_started else 0.0
+
+    @property
+    def startup_time_saved(self) -> float:
+        """Returns the estimated startup time saved by reusing engines"""
+        return self.engines_reused * self.average_startup_time
+
+
+class EnginePool:
+    """Process wide pool of started engines. Engines are checked out per game
+       and released back to the pool when the game ends, which saves having to
+       start a new engine process (and load the engine network) for every game.
+       Idle engines are quit once they have been idle for longer than the idle timeout.
+    """
+    def __init__(self, engine_command: Callable[[], str], max_idle_engines: int = DEFAULT_MAX_IDLE_ENGINES,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.engine_command = engine_command
+        self.max_idle_engines = max_idle_engines
+        self.idle_timeout = idle_timeout
+        self.stats = EnginePoolStats()
+
+        self._idle_engines: List[Tuple[chess.engine.SimpleEngine, float]] = []
+        self._eviction_timer: Optional[threading.Timer] = None
+        self._eviction_pending = False
+        self._lock = threading.Lock()
+
+    def checkout(self, engine_cfg: dict) -> chess.engine.SimpleEngine:
+        """Returns an idle engine from the pool, or starts a new engine if none are
+           available. The passed in configuration is applied to the engine on each checkout.
+           Callers should pass a per-game `game` object when searching so `ucinewgame` is sent.
+        """
+        self.evict_idle_engines()
+        engine = self._pop_idle_engine()
+
+        if engine:
+            self.stats.engines_reused += 1
+            log.debug(f"Reusing pooled engine (est. startup time saved: {self.stats.startup_time_saved:.2f}s)")
+        else:
+            engine = self._start_engine()
+
+        try:
+            engine.configure(engine_cfg)
+        except Exception:
+            self._quit_engine(engine)
+            raise
+        return engine
+
+    def release(self, engine: chess.engine.SimpleEngine) -> None:
+        """Returns the engine to the pool. If the pool is full the engine is quit"""
+        if engine is None:
+            return
+
+        with self._lock:
+            if len(self._idle_engines) < self.max_idle_engines:
+                self._idle_engines.append((engine, time.monotonic()))
+                engine = None
+                self._schedule_eviction()
+
+        if engine:
+            self._quit_engine(engine)
+
+    def evict_idle_engines(self, force=False) -> None:
+        """Quits engines which have been idle longer than the idle
+           timeout. If force is true, all idle engines are quit.
+        """
+        now = time.monotonic()
+        with self._lock:
+            evicted = [engine for engine, released in self._idle_engines if force or now - released >= self.idle_timeout]
+            self._idle_engines = [(engine, released) for engine, released in self._idle_engines if engine not in evicted]
+            if self._idle_engines:
+                self._schedule_eviction()
+
+        for engine in evicted:
+            self.stats.engines_evicted += 1
+            self._quit_engine(engine)
+
+    def shutdown(self) -> None:
+        """Quits all idle engines and stops the eviction timer. Engines
+           which are checked out at the time of the call are not affected.
+        """
+        with self._lock:
+            if self._eviction_timer:
+                self._eviction_timer.cancel()
+                self._eviction_timer = None
+            self._eviction_pending = False
+
+        self.evict_idle_engines(force=True)
+        log.debug(f"Engine pool shutdown: started={self.stats.engines_started} // reused={self.stats.engines_reused} // "
+                  f"est. startup time saved={self.stats.startup_time_saved:.2f}s")
+
+    def _pop_idle_engine(self) -> Optional[chess.engine.SimpleEngine]:
+        """Pops the most recently released idle engine which is still responsive"""
+        while True:
+            with self._lock:
+                if not self._idle_engines:
+                    return None
+                engine, _ = self._idle_engines.pop()
+
+            try:
+                engine.ping()
+                return engine
+            except Exception as e:
+                log.debug(f"Discarding unresponsive pooled engine: {e}")
+                self._quit_engine(engine)
+
+    def _start_engine(self) -> chess.engine.SimpleEngine:
+        """Starts a new engine process and tracks the time it took to start"""
+        start_time = time.perf_counter()
+        engine = chess.engine.SimpleEngine.popen_uci(self.engine_command())
+        startup_time = time.perf_counter() - start_time
+
+        self.stats.engines_started += 1
+        self.stats.total_startup_time += startup_time
+        log.debug(f"Started engine in {startup_time:.3f}s")
+        return engine
+
+    def _schedule_eviction(self) -> None:
+        """Schedules the idle engine eviction check for when the longest idle
+           engine reaches the idle timeout. Must be called with the lock held
+        """
+        if self._eviction_pending or not self._idle_engines:
+            return
+
+        oldest_release = min(released for _, released in self._idle_engines)
+        delay = max(0.0, oldest_release + self.idle_timeout - time.monotonic())
+        self._eviction_timer = threading.Timer(delay, self._on_eviction_timer)
+        self._eviction_timer.daemon = True
+        self._eviction_pending = True
+        self._eviction_timer.start()
+
+    def _on_eviction_timer(self) -> None:
+        """Eviction timer callback. Clears the pending flag before evicting
+           so the check is rescheduled for any engines left idle
+        """
+        with self._lock:
+            self._eviction_pending = False
+            self._eviction_timer = None
+        self.evict_idle_engines()
+
+    @staticmethod
+    def _quit_engine(engine: chess.engine.SimpleEngine) -> None:
+        """Quits the passed in engine"""
+        try:
+            log.debug("Quitting engine")
+            engine.quit()
+        except Exception as e:
+            log.error(f"Error quitting engine: {e}")
@@ -0,0 +1,24 @@
+import asyncio
+import chess.engine
+
+
+class EngineSearch:
+    """Handle to an in-flight engine search. The search is started on the engines event
+       loop on creation and can be stopped from any thread. Stopping the search sends
+       `stop` to the engine immediately, and `wait()` raises a CancelledError.
+    """
+    def __init__(self, engine: chess.engine.SimpleEngine, board: chess.Board, limit: chess.engine.Limit, **kwargs):
+        coroutine = engine.protocol.play(board, limit, **kwargs)
+        self._future = asyncio.run_coroutine_threadsafe(coroutine, engine.protocol.loop)
+
+    def wait(self) -> chess.engine.PlayResult:
+        """Blocks until the search is finished and returns the result"""
+        return self._future.result()
+
+    def stop(self) -> None:
+        """Stops the search if it is still running"""
+        self._future.cancel()
+
+    def is_running(self) -> bool:
+        """Returns True if the search is still running"""
+        return not self._future.done()
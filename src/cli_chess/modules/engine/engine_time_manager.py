@@ -0,0 +1,75 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional, Tuple, TYPE_CHECKING
+import chess.engine
+if TYPE_CHECKING:
+    from cli_chess.core.game.game_metadata import ClockMetadata
+
+DEFAULT_MOVE_TIME = 2.0   # Used when the game has no clock and no skill level (e.g. when specifying the Elo)
+MOVE_OVERHEAD = 0.05      # Time reserved for communication overhead when on the clock
+MIN_MOVE_TIME = 0.01
+DEFAULT_MOVES_TO_GO = 40
+MIN_MOVES_TO_GO = 10
+
+
+@dataclass(frozen=True)
+class LevelSearchCap:
+    depth: Optional[int]
+    move_time: float  # secs
+
+
+fairy_stockfish_level_search_caps = {
+    # Caps the depth and think time of each computer level. Lower
+    # levels answer near instantly as their moves are intentionally
+    # weakened anyway. This mapping matches Lichess' implementation
+    1: LevelSearchCap(depth=5, move_time=0.05),
+    2: LevelSearchCap(depth=5, move_time=0.1),
+    3: LevelSearchCap(depth=5, move_time=0.15),
+    4: LevelSearchCap(depth=5, move_time=0.2),
+    5: LevelSearchCap(depth=5, move_time=0.3),
+    6: LevelSearchCap(depth=8, move_time=0.4),
+    7: LevelSearchCap(depth=13, move_time=0.5),
+    8: LevelSearchCap(depth=22, move_time=1.0),
+}
+
+
+class EngineTimeManager:
+    """Builds the search limit for each engine move using the engines clock
+       (if the game is timed) and the depth and think time caps of the skill level
+    """
+    def __init__(self, game_parameters: dict):
+        from cli_chess.core.game.game_options import GameOption
+        skill_level = None if game_parameters.get(GameOption.SPECIFY_ELO) else game_parameters.get(GameOption.COMPUTER_SKILL_LEVEL)
+        self.search_cap = fairy_stockfish_level_search_caps.get(skill_level, LevelSearchCap(depth=None, move_time=DEFAULT_MOVE_TIME))
+
+    def get_limit(self, board: chess.Board, clock: Optional[ClockMetadata] = None) -> chess.engine.Limit:
+        """Returns the search limit to use for the engine move in the passed in position"""
+        move_time = self.search_cap.move_time
+        clock_time = self.get_clock_time(clock) if clock else None
+
+        if clock_time is not None:
+            remaining, increment = clock_time
+            moves_to_go = max(MIN_MOVES_TO_GO, DEFAULT_MOVES_TO_GO - board.fullmove_number)
+            budget = remaining / moves_to_go + increment * 0.8
+            budget = min(budget, remaining / 2) - MOVE_OVERHEAD
+            move_time = max(MIN_MOVE_TIME, min(move_time, budget))
+
+        return chess.engine.Limit(time=move_time, depth=self.search_cap.depth)
+
+    @staticmethod
+    def get_clock_time(clock: ClockMetadata) -> Optional[Tuple[float, float]]:
+        """Returns the remaining time and increment of the passed
+           in clock in seconds. Returns None if the clock isn't set
+        """
+        if clock.time is None:
+            return None
+
+        factor = 1000 if clock.units == "ms" else 1
+        remaining = float(clock.time) / factor
+        increment = float(clock.increment or 0) / factor
+
+        if clock.ticking and clock.tick_started_at is not None:
+            remaining -= monotonic() - clock.tick_started_at
+
+        return max(0.0, remaining), increment
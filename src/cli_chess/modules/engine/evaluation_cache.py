@@ -0,0 +1,176 @@
+from cli_chess.utils import log
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+import chess.engine
+import chess.polyglot
+import os
+import struct
+import threading
+import zlib
+
+DEFAULT_MAX_ENTRIES = 100000
+CACHE_VARIANTS = ["chess", "crazyhouse", "atomic", "antichess", "kingofthehill", "3check", "horde", "racingkings"]
+
+# Fixed width little-endian record: zobrist key, variant, depth, score type, score, best move
+RECORD = struct.Struct("<QBBBiH")
+SCORE_TYPE_CP = 0
+SCORE_TYPE_MATE = 1
+NO_MOVE = 0
+
+
+@dataclass
+class CachedEvaluation:
+    depth: int
+    score: chess.engine.PovScore
+    best_move: Optional[chess.Move] = None
+
+
+@dataclass
+class EvaluationCacheStats:
+    """Evaluation cache counters"""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio of lookups which were found in the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EvaluationCache:
+    """Persistent cache of engine evaluations keyed by the positions Zobrist hash
+       and variant. Deeper evaluations of a position replace shallower ones, and the
+       least recently used entries are evicted once the cache is full. The cache is
+       loaded from disk on first use and saved as compact fixed width records.
+    """
+    def __init__(self, filename: Callable[[], str], max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.filename = filename
+        self.max_entries = max_entries
+        self.stats = EvaluationCacheStats()
+
+        self._entries: Optional[OrderedDict] = None
+        self._modified = False
+        self._lock = threading.Lock()
+
+    def get(self, board: chess.Board, min_depth: int = 0) -> Optional[CachedEvaluation]:
+        """Returns the cached evaluation of the position if it has been
+           searched to at least the passed in depth, otherwise None
+        """
+        key = self.get_key(board)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key) if key else None
+            if entry is None or entry.depth < min_depth:
+                self.stats.misses += 1
+                return None
+
+            entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(self, board: chess.Board, depth: int, score: chess.engine.PovScore, best_move: Optional[chess.Move] = None) -> None:
+        """Caches the evaluation of the position. An existing evaluation is
+           only replaced if the new evaluation is at least as deep
+        """
+        key = self.get_key(board)
+        if not key:
+            return
+
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None or depth >= entry.depth:
+                entries[key] = CachedEvaluation(min(depth, 255), score, best_move)
+                self._modified = True
+            entries.move_to_end(key)
+
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Writes the cache to disk if it has been modified. Entries
+           are written from least to most recently used
+        """
+        with self._lock:
+            if self._entries is None or not self._modified:
+                return
+
+            filename = self.filename()
+            try:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename + ".tmp", "wb") as cache_file:
+                    cache_file.write(b"".join(self._pack(key, entry) for key, entry in self._entries.items()))
+                os.replace(filename + ".tmp", filename)
+                self._modified = False
+                log.debug(f"Saved {len(self._entries)} cached evaluations (hit rate: {self.stats.hit_rate:.0%})")
+            except Exception as e:
+                log.error(f"Error saving the evaluation cache: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    @staticmethod
+    def get_key(board: chess.Board) -> Optional[Tuple[int, int]]:
+        """Returns the cache key of the position, or None if the variant isn't supported.
+           Positions which only differ in their crazyhouse pockets or remaining 3check
+           checks have the same Zobrist hash, so these are mixed into the hash.
+        """
+        if board.uci_variant not in CACHE_VARIANTS:
+            return None
+
+        zobrist_hash = chess.polyglot.zobrist_hash(board)
+        if board.uci_variant in ["crazyhouse", "3check"]:
+            zobrist_hash ^= zlib.crc32(board.epd().encode())
+        return zobrist_hash, CACHE_VARIANTS.index(board.uci_variant)
+
+    def _load(self) -> OrderedDict:
+        """Loads the cache from disk on first use. Must be called with the lock held"""
+        if self._entries is None:
+            self._entries = OrderedDict()
+            filename = self.filename()
+            try:
+                if os.path.exists(filename):
+                    with open(filename, "rb") as cache_file:
+                        data = cache_file.read()
+                    for record in RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size]):
+                        key, entry = self._unpack(record)
+                        self._entries[key] = entry
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                    log.debug(f"Loaded {len(self._entries)} cached evaluations")
+            except Exception as e:
+                log.error(f"Error loading the evaluation cache: {e}")
+                self._entries = OrderedDict()
+        return self._entries
+
+    @staticmethod
+    def _pack(key: Tuple[int, int], entry: CachedEvaluation) -> bytes:
+        """Packs the cache entry into a fixed width record"""
+        score = entry.score.white()
+        mate = score.mate()
+        score_type, score_value = (SCORE_TYPE_MATE, mate) if mate is not None else (SCORE_TYPE_CP, score.score())
+
+        move = entry.best_move
+        raw_move = NO_MOVE
+        if move:
+            piece_type = move.drop or move.promotion or 0
+            raw_move = move.to_square | move.from_square << 6 | piece_type << 12 | bool(move.drop) << 15
+        return RECORD.pack(key[0], key[1], entry.depth, score_type, score_value, raw_move)
+
+    @staticmethod
+    def _unpack(record: tuple) -> Tuple[Tuple[int, int], CachedEvaluation]:
+        """Unpacks a fixed width record into the cache key and entry"""
+        zobrist_hash, variant, depth, score_type, score_value, raw_move = record
+        score = chess.engine.Mate(score_value) if score_type == SCORE_TYPE_MATE else chess.engine.Cp(score_value)
+
+        move = None
+        if raw_move != NO_MOVE:
+            to_square, from_square, piece_type = raw_move & 0x3f, raw_move >> 6 & 0x3f, raw_move >> 12 & 0x7
+            if raw_move >> 15:
+                move = chess.Move(to_square, to_square, drop=piece_type)
+            else:
+                move = chess.Move(from_square, to_square, promotion=piece_type or None)
+        return (zobrist_hash, variant), CachedEvaluation(depth, chess.engine.PovScore(score, chess.WHITE), move)
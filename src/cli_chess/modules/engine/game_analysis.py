@@ -0,0 +1,221 @@
+from cli_chess.modules.engine.engine_model import engine_pool, evaluation_cache, FULL_STRENGTH_SKILL_LEVEL
+from cli_chess.utils.logging import log
+from cli_chess.utils.pgn import ANNOTATED_SUFFIX
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional, Tuple
+import chess.engine
+import chess.pgn
+import chess.variant
+import glob
+import os
+
+DEFAULT_ANALYSIS_DEPTH = 16
+ANALYSIS_DEPTH_HEADER = "AnalysisDepth"
+POSITIONS_PER_TASK = 8
+ANALYSIS_ENGINE_CFG = {
+    'Skill Level': FULL_STRENGTH_SKILL_LEVEL,
+    'UCI_LimitStrength': False,
+}
+
+# Centipawn loss thresholds for move judgements. Evaluations are capped
+# at a maximum so mates don't skew the average centipawn loss
+MAX_EVAL = 1000
+MISTAKE_THRESHOLD = 100
+BLUNDER_THRESHOLD = 300
+
+# A position is identified by its variant, chess960 flag and FEN
+Position = Tuple[str, bool, str]
+Evaluation = Tuple[chess.engine.PovScore, Optional[chess.Move]]
+
+
+@dataclass
+class AnalysedGameStats:
+    """Per player centipawn loss of an analysed game"""
+    centipawn_loss: Dict[chess.Color, List[int]] = field(default_factory=lambda: {chess.WHITE: [], chess.BLACK: []})
+
+    def get_average_centipawn_loss(self, color: chess.Color) -> int:
+        """Returns the average centipawn loss of the player"""
+        losses = self.centipawn_loss[color]
+        return round(sum(losses) / len(losses)) if losses else 0
+
+
+def get_position(board: chess.Board) -> Position:
+    """Returns the position key of the board used to send positions to the analysis processes"""
+    return board.uci_variant, board.chess960, board.fen()
+
+
+def get_board(position: Position) -> chess.Board:
+    """Returns the board of the passed in position key"""
+    uci_variant, chess960, fen = position
+    return chess.variant.find_variant(uci_variant)(fen, chess960=chess960)
+
+
+def _init_analysis_worker() -> None:
+    """Analysis process initializer. Quits the pooled engine when the process exits"""
+    Finalize(None, engine_pool.shutdown, exitpriority=10)
+
+
+def _analyse_positions(positions: List[Position], depth: int) -> List[Evaluation]:
+    """Analyses the positions to the passed in depth. Runs in the analysis processes"""
+    engine = engine_pool.checkout(ANALYSIS_ENGINE_CFG)
+    try:
+        evaluations = []
+        for position in positions:
+            info = engine.analyse(get_board(position), chess.engine.Limit(depth=depth))
+            evaluations.append((info["score"], info.get("pv", [None])[0]))
+        return evaluations
+    finally:
+        engine_pool.release(engine)
+
+
+def get_terminal_evaluation(board: chess.Board) -> Optional[chess.engine.PovScore]:
+    """Returns the evaluation of the position if the game is over, otherwise None"""
+    outcome = board.outcome()
+    if outcome is None:
+        return None
+    if outcome.winner is None:
+        return chess.engine.PovScore(chess.engine.Cp(0), chess.WHITE)
+    return chess.engine.PovScore(chess.engine.MateGiven, outcome.winner)
+
+
+def get_pgn_files(path: str) -> List[str]:
+    """Returns the PGN files to analyse. If the path is a directory all of its
+       PGN files are returned, except files which are annotated game outputs
+    """
+    if os.path.isdir(path):
+        files = sorted(glob.glob(os.path.join(path, "*.pgn")))
+        return [file for file in files if not file.endswith(ANNOTATED_SUFFIX)]
+    return [path]
+
+
+def get_annotated_filename(filename: str) -> str:
+    """Returns the filename the annotated games of the passed in PGN file are written to"""
+    return os.path.splitext(filename)[0] + ANNOTATED_SUFFIX
+
+
+def is_analysed(filename: str, depth: int) -> bool:
+    """Returns True if the file has already been annotated at the passed in depth or deeper"""
+    try:
+        with open(get_annotated_filename(filename), encoding="utf-8") as annotated_file:
+            headers = chess.pgn.read_headers(annotated_file)
+        return headers is not None and int(headers.get(ANALYSIS_DEPTH_HEADER, 0)) >= depth
+    except (OSError, ValueError):
+        return False
+
+
+def annotate_game(game: chess.pgn.Game, evaluations: Dict[Position, Evaluation], depth: int) -> AnalysedGameStats:
+    """Adds evaluation comments and mistake/blunder NAGs to each move of the
+       game, and the average centipawn loss of each player to the headers
+    """
+    stats = AnalysedGameStats()
+    board = game.board()
+    eval_before, best_move = evaluations.get(get_position(board), (get_terminal_evaluation(board), None))
+
+    for node in game.mainline():
+        mover = board.turn
+        best_san = board.san(best_move) if best_move and best_move != node.move and board.is_legal(best_move) else None
+        board.push(node.move)
+        terminal_eval = get_terminal_evaluation(board)
+        eval_after, best_move = (terminal_eval, None) if terminal_eval else evaluations[get_position(board)]
+
+        loss = max(0, _get_capped_score(eval_before, mover) - _get_capped_score(eval_after, mover))
+        stats.centipawn_loss[mover].append(loss)
+
+        judgement = None
+        if loss >= BLUNDER_THRESHOLD:
+            judgement, nag = "Blunder", chess.pgn.NAG_BLUNDER
+        elif loss >= MISTAKE_THRESHOLD:
+            judgement, nag = "Mistake", chess.pgn.NAG_MISTAKE
+
+        if judgement:
+            node.nags.add(nag)
+            node.comment = f"{judgement}. {best_san} was best." if best_san else f"{judgement}."
+        if terminal_eval is None:
+            node.set_eval(eval_after, depth)
+        eval_before = eval_after
+
+    game.headers["Annotator"] = "cli-chess"
+    game.headers[ANALYSIS_DEPTH_HEADER] = str(depth)
+    game.headers["WhiteACPL"] = str(stats.get_average_centipawn_loss(chess.WHITE))
+    game.headers["BlackACPL"] = str(stats.get_average_centipawn_loss(chess.BLACK))
+    return stats
+
+
+def analyse_pgn_file(filename: str, executor: ProcessPoolExecutor, depth: int) -> List[AnalysedGameStats]:
+    """Analyses the positions of every game in the file across the analysis
+       processes, and writes the annotated games next to the original file
+    """
+    games = []
+    with open(filename, encoding="utf-8") as pgn_file:
+        while (game := chess.pgn.read_game(pgn_file)) is not None:
+            if game.errors:
+                raise ValueError(f"Invalid game in PGN: {game.errors[0]}")
+            games.append(game)
+
+    # Collect the unique positions which need analysing, checking the evaluation cache first
+    evaluations: Dict[Position, Evaluation] = {}
+    pending: Dict[Position, None] = {}  # Ordered set of the positions to analyse
+    for game in games:
+        board = game.board()
+        for move in [None] + list(game.mainline_moves()):
+            if move:
+                board.push(move)
+            position = get_position(board)
+            if position in evaluations or position in pending or board.is_game_over():
+                continue
+            cached = evaluation_cache.get(board, min_depth=depth)
+            if cached:
+                evaluations[position] = (cached.score, cached.best_move)
+            else:
+                pending[position] = None
+
+    positions = list(pending)
+    batches = [positions[i:i + POSITIONS_PER_TASK] for i in range(0, len(positions), POSITIONS_PER_TASK)]
+    for batch, batch_evaluations in zip(batches, executor.map(_analyse_positions, batches, [depth] * len(batches))):
+        for position, (score, best_move) in zip(batch, batch_evaluations):
+            evaluations[position] = (score, best_move)
+            evaluation_cache.put(get_board(position), depth, score, best_move)
+
+    stats = [annotate_game(game, evaluations, depth) for game in games]
+    annotated_filename = get_annotated_filename(filename)
+    with open(annotated_filename + ".tmp", "w", encoding="utf-8") as annotated_file:
+        for game in games:
+            annotated_file.write(str(game) + "\n\n")
+    os.replace(annotated_filename + ".tmp", annotated_filename)
+    return stats
+
+
+def run_pgn_analysis(path: str, depth: int = DEFAULT_ANALYSIS_DEPTH, workers: Optional[int] = None) -> None:
+    """Annotates the PGN file, or every PGN file in the directory, using a pool of
+       engine processes (sized to the CPU count by default). Files which have
+       already been analysed at the requested depth are skipped.
+    """
+    files = get_pgn_files(path)
+    if not files:
+        print(f"No PGN files found in {path}")
+        return
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_analysis_worker) as executor:
+        for filename in files:
+            if is_analysed(filename, depth):
+                print(f"Skipping {filename} (already analysed at depth {depth})")
+                continue
+
+            try:
+                stats = analyse_pgn_file(filename, executor, depth)
+                print(f"Analysed {filename} -> {get_annotated_filename(filename)}")
+                for game_stats in stats:
+                    print(f"  ACPL white: {game_stats.get_average_centipawn_loss(chess.WHITE)} // "
+                          f"black: {game_stats.get_average_centipawn_loss(chess.BLACK)}")
+            except Exception as e:
+                log.error(f"Error analysing {filename}: {e}")
+                print(f"Error analysing {filename}: {e}")
+
+    evaluation_cache.save()
+
+
+def _get_capped_score(score: chess.engine.PovScore, color: chess.Color) -> int:
+    """Returns the centipawn score from the colors point of view capped to the maximum evaluation"""
+    return max(-MAX_EVAL, min(MAX_EVAL, score.pov(color).score(mate_score=MAX_EVAL)))
@@ -0,0 +1,97 @@
+from cli_chess.utils import log
+from dataclasses import dataclass
+from typing import Callable, Optional
+import chess.polyglot
+import random
+import threading
+
+book_weight_exponents = {
+    # The book entry weights are raised to this exponent when picking a move.
+    # Lower levels pick from all book moves more evenly, giving more variety,
+    # while higher levels more strongly favour the books main lines
+    1: 0.0,
+    2: 0.25,
+    3: 0.5,
+    4: 0.75,
+    5: 1.0,
+    6: 1.25,
+    7: 1.5,
+    8: 2.0,
+}
+DEFAULT_WEIGHT_EXPONENT = 1.0
+
+
+@dataclass
+class OpeningBookStats:
+    """Opening book probe counters"""
+    hits: int = 0
+    misses: int = 0
+
+
+class OpeningBook:
+    """Optional Polyglot (.bin) opening book. The book is memory mapped and each
+       position is looked up using a binary search on its Zobrist key, so probing
+       the book is near instant regardless of the book size. Only standard chess
+       positions are probed as Polyglot books do not support other variants.
+    """
+    def __init__(self, book_path: Callable[[], str]):
+        self.book_path = book_path
+        self.stats = OpeningBookStats()
+
+        self._reader: Optional[chess.polyglot.MemoryMappedReader] = None
+        self._reader_path = ""
+        self._lock = threading.Lock()
+
+    def get_move(self, board: chess.Board, skill_level: Optional[int] = None) -> Optional[chess.Move]:
+        """Returns a weighted random book move for the passed in position, or None if the
+           position is not in the book (or no book is set). The randomness of the pick
+           is based on the skill level. Book hits and misses are counted.
+        """
+        if board.uci_variant != "chess":
+            return None
+
+        with self._lock:
+            reader = self._get_reader()
+            if reader is None:
+                return None
+
+            entries = list(reader.find_all(board))
+
+        if not entries:
+            self.stats.misses += 1
+            log.debug(f"Opening book miss (hits={self.stats.hits} // misses={self.stats.misses})")
+            return None
+
+        exponent = book_weight_exponents.get(skill_level, DEFAULT_WEIGHT_EXPONENT)
+        entry = random.choices(entries, weights=[entry.weight ** exponent for entry in entries])[0]
+        self.stats.hits += 1
+        log.debug(f"Opening book hit: {entry.move} (hits={self.stats.hits} // misses={self.stats.misses})")
+        return entry.move
+
+    def close(self) -> None:
+        """Closes the book file"""
+        with self._lock:
+            self._close_reader()
+
+    def _get_reader(self) -> Optional[chess.polyglot.MemoryMappedReader]:
+        """Returns the reader for the configured book path. The book is reopened if the
+           configured path changes. Must be called with the lock held.
+        """
+        book_path = (self.book_path() or "").strip()
+        if book_path != self._reader_path:
+            self._close_reader()
+            self._reader_path = book_path
+            if book_path:
+                try:
+                    self._reader = chess.polyglot.open_reader(book_path)
+                    log.debug(f"Opened opening book: {book_path}")
+                except Exception as e:
+                    log.error(f"Error opening the opening book: {e}")
+        return self._reader
+
+    def _close_reader(self) -> None:
+        """Closes the reader if open. Must be called with the lock held"""
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+        self._reader_path = ""
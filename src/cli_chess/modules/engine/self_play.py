@@ -0,0 +1,195 @@
+from cli_chess.modules.engine.engine_model import EngineModel, engine_pool
+from cli_chess.modules.board import BoardModel
+from cli_chess.utils.pgn import build_pgn_game, get_pgn_save_dir
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+from chess import COLOR_NAMES
+import chess
+import math
+import os
+import random
+
+MAX_GAME_PLIES = 600  # Games still in progress after this many plies are adjudicated as draws
+ADJUDICATED_STATUS = "adjudicated"
+
+
+@dataclass(frozen=True)
+class SelfPlayEngine:
+    """An engine configuration taking part in self-play. Either the skill level or the Elo is set"""
+    skill_level: Optional[int] = None
+    elo: Optional[int] = None
+
+    @staticmethod
+    def from_string(value: str) -> "SelfPlayEngine":
+        """Parses an engine configuration from a string such as `level:3` or `elo:1800`"""
+        kind, _, number = value.lower().partition(":")
+        try:
+            if kind == "level" and int(number) in range(1, 9):
+                return SelfPlayEngine(skill_level=int(number))
+            if kind == "elo" and int(number) > 0:
+                return SelfPlayEngine(elo=int(number))
+        except ValueError:
+            pass
+        raise ValueError(f"Invalid engine configuration ({value}). Expected level:1-8 or elo:<rating>")
+
+    @property
+    def name(self) -> str:
+        """Returns the display name of the engine configuration"""
+        return f"Fairy-Stockfish Lvl {self.skill_level}" if self.elo is None else f"Fairy-Stockfish Elo {self.elo}"
+
+    def get_game_parameters(self, variant: str) -> dict:
+        """Returns the game parameters used to configure the `EngineModel`"""
+        from cli_chess.core.game.game_options import GameOption
+        if self.elo is not None:
+            return {GameOption.VARIANT: variant, GameOption.SPECIFY_ELO: True, GameOption.COMPUTER_ELO: self.elo}
+        return {GameOption.VARIANT: variant, GameOption.COMPUTER_SKILL_LEVEL: self.skill_level}
+
+
+@dataclass(frozen=True)
+class SelfPlayGame:
+    white: SelfPlayEngine
+    black: SelfPlayEngine
+    variant: str = "standard"
+    fen: str = ""
+    engine_a_color: chess.Color = chess.WHITE
+
+
+@dataclass(frozen=True)
+class SelfPlayResult:
+    game: SelfPlayGame
+    winner: Optional[chess.Color]
+    pgn: str
+
+
+@dataclass
+class SelfPlayScore:
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        """Returns the score ratio (wins plus half of the draws per game)"""
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+
+def play_self_play_game(game: SelfPlayGame) -> SelfPlayResult:
+    """Plays a single game between the two engine configurations and returns the
+       result. Pondering is disabled so each game uses a single CPU at a time.
+    """
+    from cli_chess.core.game.game_metadata import GameMetadata
+    board_model = BoardModel(variant=game.variant, fen=game.fen)
+    metadata = GameMetadata()
+    metadata.variant = game.variant
+    engines = {}
+    for color, engine in [(chess.WHITE, game.white), (chess.BLACK, game.black)]:
+        metadata.players[color].name = engine.name
+        metadata.players[color].rating = str(engine.elo) if engine.elo is not None else None
+        engines[color] = EngineModel(board_model, engine.get_game_parameters(game.variant), ponder=False)
+
+    try:
+        for engine_model in engines.values():
+            engine_model.start_engine()
+
+        while board_model.get_game_over_result() is None and len(board_model.get_move_stack()) < MAX_GAME_PLIES:
+            result = engines[board_model.get_turn()].get_best_move()
+            if result.resigned:
+                board_model.handle_resignation(board_model.get_turn())
+            elif result.move:
+                board_model.make_move(result.move.uci())
+            else:
+                raise Warning(f"No move received from the engine ({board_model.board.fen()})")
+    finally:
+        for engine_model in engines.values():
+            engine_model.quit_engine()
+        engine_pool.shutdown()
+
+    outcome = board_model.get_game_over_result()
+    if outcome:
+        metadata.game_status.status = outcome.termination
+        metadata.game_status.winner = COLOR_NAMES[outcome.winner] if outcome.winner is not None else None
+    else:
+        metadata.game_status.status = ADJUDICATED_STATUS
+
+    pgn_game = build_pgn_game(board_model, metadata, is_online=False)
+    pgn_game.headers["Event"] = "cli-chess self-play"
+    return SelfPlayResult(game, outcome.winner if outcome else None, str(pgn_game))
+
+
+def get_self_play_games(engine_a: SelfPlayEngine, engine_b: SelfPlayEngine, games: int,
+                        variant: str = "standard", fen: str = "") -> List[SelfPlayGame]:
+    """Returns the games to play. Colors alternate each game, and each pair of games uses
+       the same start position (a random position for each pair in Chess960 without a FEN)
+    """
+    self_play_games = []
+    for i in range(games):
+        if i % 2 == 0:
+            pair_fen = fen
+            if variant.lower() == "chess960" and not fen:
+                pair_fen = chess.Board.from_chess960_pos(random.randint(0, 959)).fen()
+        engine_a_color = chess.WHITE if i % 2 == 0 else chess.BLACK
+        white, black = (engine_a, engine_b) if engine_a_color == chess.WHITE else (engine_b, engine_a)
+        self_play_games.append(SelfPlayGame(white, black, variant, pair_fen, engine_a_color))
+    return self_play_games
+
+
+def estimate_elo_difference(score: SelfPlayScore) -> Tuple[float, float]:
+    """Returns the estimated Elo difference for the score and its 95% confidence margin"""
+    if not score.games:
+        return 0.0, 0.0
+
+    def to_elo(ratio: float) -> float:
+        ratio = min(max(ratio, 1e-3), 1 - 1e-3)
+        return -400 * math.log10(1 / ratio - 1)
+
+    mean = score.score
+    variance = (score.wins * (1 - mean) ** 2 + score.draws * (0.5 - mean) ** 2 + score.losses * mean ** 2) / score.games
+    margin = 1.96 * math.sqrt(variance / score.games)
+    return to_elo(mean), (to_elo(mean + margin) - to_elo(mean - margin)) / 2
+
+
+def run_self_play(engine_a: SelfPlayEngine, engine_b: SelfPlayEngine, games: int, variant: str = "standard",
+                  fen: str = "", output_path: Optional[str] = None, workers: Optional[int] = None) -> SelfPlayScore:
+    """Plays the games across a process pool (sized to the CPU count by default), writes the
+       games to the output PGN file and prints a score table. Returns the score of engine A.
+    """
+    output_path = output_path or os.path.join(get_pgn_save_dir(), f"self-play-{datetime.now().strftime('%Y%m%d-%H%M%S')}.pgn")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    score = SelfPlayScore()
+
+    print(f"Playing {games} games: {engine_a.name} vs {engine_b.name} ({variant})")
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor, open(output_path, "w", encoding="utf-8") as pgn_file:
+        futures = [executor.submit(play_self_play_game, game) for game in get_self_play_games(engine_a, engine_b, games, variant, fen)]
+        for future in as_completed(futures):
+            result = future.result()
+            pgn_file.write(result.pgn + "\n\n")
+            pgn_file.flush()
+
+            if result.winner is None:
+                score.draws += 1
+            elif result.winner == result.game.engine_a_color:
+                score.wins += 1
+            else:
+                score.losses += 1
+            print(f"Game {score.games}/{games}: {result.game.white.name} vs {result.game.black.name} "
+                  f"{'1/2-1/2' if result.winner is None else ('1-0' if result.winner else '0-1')}")
+
+    print_self_play_score(engine_a, engine_b, score)
+    print(f"Games saved to {output_path}")
+    return score
+
+
+def print_self_play_score(engine_a: SelfPlayEngine, engine_b: SelfPlayEngine, score: SelfPlayScore) -> None:
+    """Prints the score table of engine A against engine B"""
+    elo_difference, margin = estimate_elo_difference(score)
+    print(f"\n{'Engine':<26}{'Games':>7}{'Wins':>7}{'Draws':>7}{'Losses':>8}{'Score':>8}{'Elo diff':>16}")
+    for engine, wins, losses, sign in [(engine_a, score.wins, score.losses, 1), (engine_b, score.losses, score.wins, -1)]:
+        engine_score = (wins + score.draws / 2) / score.games if score.games else 0.0
+        print(f"{engine.name:<26}{score.games:>7}{wins:>7}{score.draws:>7}{losses:>8}{engine_score:>8.1%}"
+              f"{sign * elo_difference:>+9.0f} ±{margin:<5.0f}")
@@ -0,0 +1,114 @@
+from cli_chess.utils import log
+from typing import Callable, Optional, Tuple
+import chess.syzygy
+import threading
+
+
+class SyzygyTablebase:
+    """Optional local Syzygy endgame tablebase. The tablebase is opened the first time it
+       is probed, and the individual table files are opened lazily by `chess.syzygy` as
+       they are needed and kept open for later probes. Only standard chess positions are
+       probed, as the variant tables (e.g. atomic and antichess) are not supported.
+    """
+    def __init__(self, directory: Callable[[], str]):
+        self.directory = directory
+
+        self._tablebase: Optional[chess.syzygy.Tablebase] = None
+        self._tablebase_directory = ""
+        self._max_pieces = 0
+        self._lock = threading.Lock()
+
+    def probe_wdl(self, board: chess.Board) -> Optional[int]:
+        """Returns the win/draw/loss of the position from the side to moves point of view
+           (2: win, 1: win prevented by the fifty-move rule, 0: draw, -1: loss saved by the
+           fifty-move rule, -2: loss). Returns None if the position cannot be probed.
+        """
+        with self._lock:
+            tablebase = self._get_tablebase(board)
+            if tablebase is None:
+                return None
+            try:
+                return tablebase.probe_wdl(board)
+            except KeyError:
+                return None
+
+    def get_best_move(self, board: chess.Board) -> Optional[Tuple[chess.Move, int]]:
+        """Returns the DTZ optimal move for the position and the win/draw/loss of the position.
+           Winning moves which reach a zeroing move (capture or pawn move) soonest are preferred,
+           while losing moves which delay this the longest are preferred. Returns None if the
+           position cannot be probed.
+        """
+        with self._lock:
+            tablebase = self._get_tablebase(board)
+            if tablebase is None:
+                return None
+
+            board = board.copy(stack=False)
+            try:
+                wdl = tablebase.probe_wdl(board)
+                best_move = max(board.legal_moves, key=lambda move: self._get_move_rank(tablebase, board, move))
+            except (KeyError, ValueError):
+                return None
+
+        log.debug(f"Tablebase move: {best_move} (wdl={wdl})")
+        return best_move, wdl
+
+    def close(self) -> None:
+        """Closes the tablebase and any open table files"""
+        with self._lock:
+            self._close_tablebase()
+
+    @staticmethod
+    def _get_move_rank(tablebase: chess.syzygy.Tablebase, board: chess.Board, move: chess.Move) -> Tuple[int, int]:
+        """Returns the rank of the move based on the result and the distance to zeroing (DTZ)
+           after the move. Checkmate is ranked above every other move. Wins which are
+           prevented by the fifty-move rule (cursed wins) are ranked as draws.
+        """
+        zeroing = board.is_zeroing(move)
+        board.push(move)
+        try:
+            if board.is_checkmate():
+                return 3, 0
+
+            wdl = -tablebase.probe_wdl(board)
+            if abs(wdl) < 2:
+                return 1, 0
+
+            # The DTZ is reset by a zeroing move, so only the result matters
+            dtz = -tablebase.probe_dtz(board) if not zeroing else 0
+            dtz = dtz + 1 if wdl > 0 else dtz - 1
+        finally:
+            board.pop()
+
+        return (2, -dtz) if wdl > 0 else (0, -dtz)
+
+    def _get_tablebase(self, board: chess.Board) -> Optional[chess.syzygy.Tablebase]:
+        """Returns the tablebase if the position can be probed. The tablebase is reopened
+           if the configured directory changes. Must be called with the lock held.
+        """
+        directory = (self.directory() or "").strip()
+        if directory != self._tablebase_directory:
+            self._close_tablebase()
+            self._tablebase_directory = directory
+            if directory:
+                try:
+                    self._tablebase = chess.syzygy.open_tablebase(directory)
+                    self._max_pieces = max((len(table) - 1 for table in self._tablebase.wdl), default=0)
+                    log.debug(f"Opened Syzygy tablebase: {directory} (max pieces: {self._max_pieces})")
+                except Exception as e:
+                    log.error(f"Error opening the Syzygy tablebase: {e}")
+                    self._close_tablebase()
+                    self._tablebase_directory = directory
+
+        if (self._tablebase is None or board.uci_variant != "chess" or board.castling_rights
+                or chess.popcount(board.occupied) > self._max_pieces):
+            return None
+        return self._tablebase
+
+    def _close_tablebase(self) -> None:
+        """Closes the tablebase if open. Must be called with the lock held"""
+        if self._tablebase:
+            self._tablebase.close()
+            self._tablebase = None
+        self._tablebase_directory = ""
+        self._max_pieces = 0
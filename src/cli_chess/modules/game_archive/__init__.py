@@ -0,0 +1,3 @@
+from .game_archive_model import GameArchiveModel, ArchivedGame, g_game_archive_model
+from .game_archive_view import GameArchiveView
+from .game_archive_presenter import GameArchivePresenter
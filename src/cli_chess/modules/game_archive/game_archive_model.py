@@ -0,0 +1,193 @@
+from cli_chess.utils import Event, log, threaded
+from cli_chess.utils.config import get_config_path
+from cli_chess.utils.pgn import get_pgn_save_dir, ANNOTATED_SUFFIX
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+import chess.pgn
+import glob
+import os
+import re
+import sqlite3
+import threading
+
+SCHEMA_VERSION = 1
+DEFAULT_SEARCH_LIMIT = 200
+LICHESS_GAME_ID = re.compile(r"lichess\.org/(\w{8})")
+
+# The indexed game headers. The position of the game in the file (byte offset of its
+# first header) is stored alongside so a game can be loaded without reading the others
+GAME_COLUMNS = ["white", "black", "white_elo", "black_elo", "date", "result", "variant", "time_control", "game_id", "event"]
+SEARCH_COLUMNS = ["white", "black", "date", "result", "variant", "time_control", "game_id", "event"]
+SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+    CREATE TABLE IF NOT EXISTS games (path TEXT, offset INTEGER, {", ".join(f"{column} TEXT" for column in GAME_COLUMNS)},
+                                      PRIMARY KEY (path, offset));
+    CREATE INDEX IF NOT EXISTS games_date ON games (date DESC);
+    CREATE INDEX IF NOT EXISTS games_game_id ON games (game_id);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedGame:
+    """The indexed headers of a saved game and its location on disk"""
+    path: str
+    offset: int
+    white: str = "?"
+    black: str = "?"
+    white_elo: str = ""
+    black_elo: str = ""
+    date: str = ""
+    result: str = "*"
+    variant: str = "Standard"
+    time_control: str = "-"
+    game_id: str = ""
+    event: str = ""
+
+
+class GameArchiveModel:
+    """Index of the saved PGN games backed by a SQLite database. The index stores
+       the headers of each game along with its file offset, so games can be listed
+       and searched without parsing the PGN files. Files are rescanned only when
+       their modification time or size has changed since they were last indexed.
+    """
+    def __init__(self, directory: Callable[[], str], index_filename: Callable[[], str]):
+        self.directory = directory
+        self.index_filename = index_filename
+        self._lock = threading.Lock()
+        self.e_game_archive_model_updated = Event()
+
+    @threaded
+    def update_index_async(self, rebuild: bool = False) -> None:
+        """Updates the index in the background"""
+        self.update_index(rebuild)
+
+    def update_index(self, rebuild: bool = False) -> int:
+        """Indexes new or modified PGN files in the archive directory and removes the
+           games of deleted files. If rebuild is set every file is indexed again.
+           Returns the number of files which were indexed.
+        """
+        indexed = 0
+        try:
+            with self._lock, closing(self._connect()) as connection, connection:
+                if rebuild:
+                    connection.execute("DELETE FROM games")
+                    connection.execute("DELETE FROM files")
+
+                indexed_files = {row[0]: (row[1], row[2]) for row in connection.execute("SELECT path, mtime_ns, size FROM files")}
+                pgn_files = self._get_pgn_files()
+                for filename in pgn_files:
+                    stat = os.stat(filename)
+                    if indexed_files.get(filename) != (stat.st_mtime_ns, stat.st_size):
+                        self._index_file(connection, filename)
+                        indexed += 1
+
+                for filename in indexed_files.keys() - set(pgn_files):
+                    connection.execute("DELETE FROM games WHERE path = ?", (filename,))
+                    connection.execute("DELETE FROM files WHERE path = ?", (filename,))
+            log.debug(f"Game archive: indexed {indexed} PGN files")
+        except Exception as e:
+            log.error(f"Error updating the game archive index: {e}")
+
+        self._notify_game_archive_model_updated()
+        return indexed
+
+    def add_file(self, filename: str) -> None:
+        """Indexes a single PGN file, replacing any games previously indexed from it"""
+        try:
+            with self._lock, closing(self._connect()) as connection, connection:
+                self._index_file(connection, os.path.abspath(filename))
+        except Exception as e:
+            log.error(f"Error adding {filename} to the game archive index: {e}")
+        self._notify_game_archive_model_updated()
+
+    def search(self, text: str = "", limit: int = DEFAULT_SEARCH_LIMIT) -> List[ArchivedGame]:
+        """Returns the most recent games matching every word of the search text. A
+           word matches if it is part of the player names, date, result, variant,
+           time control, Lichess game ID or event of the game.
+        """
+        where, parameters = self._get_search_clause(text)
+        query = f"SELECT path, offset, {', '.join(GAME_COLUMNS)} FROM games {where} ORDER BY date DESC, path DESC, offset DESC LIMIT ?"
+        try:
+            with self._lock, closing(self._connect()) as connection:
+                return [ArchivedGame(*row) for row in connection.execute(query, parameters + [limit])]
+        except Exception as e:
+            log.error(f"Error searching the game archive: {e}")
+            return []
+
+    def count(self, text: str = "") -> int:
+        """Returns the number of games matching the search text"""
+        where, parameters = self._get_search_clause(text)
+        try:
+            with self._lock, closing(self._connect()) as connection:
+                return connection.execute(f"SELECT COUNT(*) FROM games {where}", parameters).fetchone()[0]
+        except Exception as e:
+            log.error(f"Error counting the game archive: {e}")
+            return 0
+
+    @staticmethod
+    def read_game(archived_game: ArchivedGame) -> Optional[chess.pgn.Game]:
+        """Reads the archived game from its PGN file"""
+        with open(archived_game.path, encoding="utf-8-sig", errors="replace") as pgn_file:
+            pgn_file.seek(archived_game.offset)
+            return chess.pgn.read_game(pgn_file)
+
+    @staticmethod
+    def get_game_id(headers: chess.pgn.Headers) -> str:
+        """Returns the Lichess game ID from the game headers or an empty string"""
+        match = LICHESS_GAME_ID.search(headers.get("Site", ""))
+        return headers.get("GameId", match.group(1) if match else "")
+
+    def _get_pgn_files(self) -> List[str]:
+        """Returns the PGN files in the archive directory, excluding annotated game outputs"""
+        files = glob.glob(os.path.join(os.path.abspath(self.directory()), "*.pgn"))
+        return [file for file in files if not file.endswith(ANNOTATED_SUFFIX)]
+
+    def _index_file(self, connection: sqlite3.Connection, filename: str) -> None:
+        """Indexes the games of the file by streaming through its headers. Movetext is skipped
+           rather than parsed. Must be called with the lock held inside a transaction.
+        """
+        stat = os.stat(filename)
+        games = []
+        with open(filename, encoding="utf-8-sig", errors="replace") as pgn_file:
+            while True:
+                offset = pgn_file.tell()
+                headers = chess.pgn.read_headers(pgn_file)
+                if headers is None:
+                    break
+                games.append((filename, offset, headers.get("White", "?"), headers.get("Black", "?"), headers.get("WhiteElo", ""),
+                              headers.get("BlackElo", ""), headers.get("Date", ""), headers.get("Result", "*"),
+                              headers.get("Variant", "Standard"), headers.get("TimeControl", "-"), self.get_game_id(headers),
+                              headers.get("Event", "")))
+
+        connection.execute("DELETE FROM games WHERE path = ?", (filename,))
+        connection.executemany(f"INSERT OR REPLACE INTO games VALUES ({', '.join('?' * (len(GAME_COLUMNS) + 2))})", games)
+        connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)", (filename, stat.st_mtime_ns, stat.st_size))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the index database, recreating it if it was created by a different schema version"""
+        filename = self.index_filename()
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        connection = sqlite3.connect(filename)
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            connection.executescript("DROP TABLE IF EXISTS games; DROP TABLE IF EXISTS files;")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.executescript(SCHEMA)
+        return connection
+
+    @staticmethod
+    def _get_search_clause(text: str) -> tuple:
+        """Returns the SQL where clause and parameters matching every word of the search text"""
+        clauses, parameters = [], []
+        for word in text.split():
+            clauses.append("(" + " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in SEARCH_COLUMNS) + ")")
+            escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            parameters.extend([f"%{escaped}%"] * len(SEARCH_COLUMNS))
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", parameters
+
+    def _notify_game_archive_model_updated(self) -> None:
+        """Notifies listeners of game archive model updates"""
+        self.e_game_archive_model_updated.notify()
+
+
+g_game_archive_model = GameArchiveModel(get_pgn_save_dir, lambda: os.path.join(get_config_path(), "game_archive.db"))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from cli_chess.modules.game_archive import GameArchiveView
+from cli_chess.utils.logging import log
+from typing import List, TYPE_CHECKING
+if TYPE_CHECKING:
+    from cli_chess.modules.game_archive import GameArchiveModel, ArchivedGame
+
+
+class GameArchivePresenter:
+    def __init__(self, model: GameArchiveModel):
+        self.model = model
+        self.view = GameArchiveView(self)
+        self.filter_text = ""
+        self.games: List[ArchivedGame] = []
+        self.selected_index = 0
+        self.model.e_game_archive_model_updated.add_listener(self.update)
+        self.model.update_index_async()
+
+    def update(self) -> None:
+        """Updates the game list with the games matching the filter"""
+        self.games = self.model.search(self.filter_text)
+        self.selected_index = max(0, min(self.selected_index, len(self.games) - 1))
+        total = self.model.count(self.filter_text)
+        summary = f"Showing {len(self.games)} of {total} games" if total > len(self.games) else f"{total} game{'' if total == 1 else 's'}"
+        self.view.update([self.format_game(game) for game in self.games], summary)
+
+    def filter_games(self, text: str) -> None:
+        """Filters the game list to the games matching the text"""
+        self.filter_text = text
+        self.selected_index = 0
+        self.update()
+
+    def select(self, offset: int) -> None:
+        """Moves the game selection by the passed in offset"""
+        if self.games:
+            self.selected_index = max(0, min(self.selected_index + offset, len(self.games) - 1))
+
+    def review_selected_game(self) -> None:
+        """Starts reviewing the selected game"""
+        from cli_chess.core.game.game_review import start_game_review
+        if not self.games:
+            return
+
+        archived_game = self.games[self.selected_index]
+        try:
+            game = self.model.read_game(archived_game)
+            if game is None:
+                raise ValueError("no game found at the indexed offset")
+        except Exception as e:
+            log.error(f"Unable to read the saved game {archived_game.path}: {e}")
+            self.model.update_index_async()
+            return
+        start_game_review(game)
+
+    def rebuild_index(self) -> None:
+        """Rebuilds the game archive index from the saved PGN files"""
+        self.model.update_index_async(rebuild=True)
+
+    @staticmethod
+    def format_game(game: ArchivedGame) -> str:
+        """Returns the game formatted as a row of the game list"""
+        white = f"{game.white} ({game.white_elo})" if game.white_elo else game.white
+        black = f"{game.black} ({game.black_elo})" if game.black_elo else game.black
+        return f"{game.date:<11}{white[:19]:<20}{black[:19]:<20}{game.result:<9}{game.variant[:12]:<13}{game.time_control[:7]:<7}"
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from cli_chess.utils.ui_common import handle_mouse_click, handle_bound_key_pressed
+from prompt_toolkit.layout import Window, ConditionalContainer, VSplit, HSplit, D, FormattedTextControl, Container
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from prompt_toolkit.widgets import Label, TextArea
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.application import get_app
+from prompt_toolkit.buffer import Buffer
+from typing import TYPE_CHECKING, List
+if TYPE_CHECKING:
+    from cli_chess.modules.game_archive import GameArchivePresenter
+
+
+class GameArchiveView:
+    def __init__(self, presenter: GameArchivePresenter):
+        self.presenter = presenter
+        self.container_width = 80
+        self.game_rows: List[str] = []
+        self.summary = ""
+        self._filter_input = self._create_filter_input_area()
+        self._container = self._create_container()
+
+    def _create_filter_input_area(self) -> TextArea:
+        """Creates and returns the TextArea used to filter the games"""
+        text_area = TextArea(
+            style="class:text-area.input",
+            focus_on_click=True,
+            wrap_lines=False,
+            multiline=False,
+            width=D(max=self.container_width),
+            height=D(max=1),
+        )
+        text_area.buffer.on_text_changed += lambda buffer: self.presenter.filter_games(buffer.text)
+        text_area.accept_handler = self._accept_input
+        return text_area
+
+    def _accept_input(self, buffer: Buffer) -> bool: # noqa
+        """Reviews the selected game when enter is pressed in the filter input"""
+        self.presenter.review_selected_game()
+        return True
+
+    def _create_container(self) -> HSplit:
+        """Creates the container for the game archive view"""
+        return HSplit([
+            Label(f"{'Saved Games':<{self.container_width}}", style="class:menu.category-title", wrap_lines=False),
+            VSplit([
+                Label("Filter: ", style="bold", dont_extend_width=True),
+                ConditionalContainer(
+                    TextArea("Player, date, result, variant or game ID", style="class:text-area.input.placeholder", focus_on_click=True),
+                    filter=Condition(lambda: not self.has_focus()) & Condition(lambda: len(self._filter_input.text) == 0)
+                ),
+                ConditionalContainer(self._filter_input, Condition(lambda: self.has_focus()) | Condition(lambda: len(self._filter_input.text) > 0)),
+            ], height=D(max=1)),
+            Label(text=lambda: self.summary, style="class:label.dim", wrap_lines=False),
+            Window(FormattedTextControl(self._get_game_list_fragments), wrap_lines=False),
+        ], width=D(max=self.container_width), key_bindings=self._get_game_list_key_bindings())
+
+    def _get_game_list_key_bindings(self) -> KeyBindings:
+        """Returns the key bindings for selecting a game in the list"""
+        kb = KeyBindings()
+        kb.add(Keys.Up, eager=True)(handle_bound_key_pressed(lambda: self.presenter.select(-1)))
+        kb.add(Keys.Down, eager=True)(handle_bound_key_pressed(lambda: self.presenter.select(1)))
+        return kb
+
+    def _get_game_list_fragments(self) -> StyleAndTextTuples:
+        """Returns the formatted text fragments of the game list"""
+        header = f"{'Date':<11}{'White':<20}{'Black':<20}{'Result':<9}{'Variant':<13}{'Time':<7}"
+        fragments: StyleAndTextTuples = [("class:menu.category-title", f"{header:<{self.container_width}}\n")]
+        for index, row in enumerate(self.game_rows):
+            style = "class:focused-selected" if index == self.presenter.selected_index else "class:label"
+            fragments.append((style, f"{row:<{self.container_width}}\n"))
+        return fragments
+
+    def update(self, game_rows: List[str], summary: str) -> None:
+        """Updates the game list and the summary of the matching games"""
+        self.game_rows = game_rows
+        self.summary = summary
+
+    def get_function_bar_fragments(self) -> StyleAndTextTuples:
+        """Returns a set of function bar fragments to use if
+           this module is hooked up with a function bar
+        """
+        return [
+            ("class:function-bar.key", "F1", handle_mouse_click(self.presenter.rebuild_index)),
+            ("class:function-bar.label", f"{'Rebuild index':<15}", handle_mouse_click(self.presenter.rebuild_index)),
+            ("class:function-bar.spacer", " "),
+            ("class:function-bar.key", "F2", handle_mouse_click(self.presenter.review_selected_game)),
+            ("class:function-bar.label", f"{'Review game':<15}", handle_mouse_click(self.presenter.review_selected_game)),
+        ]
+
+    def get_function_bar_key_bindings(self) -> KeyBindings:
+        """Returns a set of key bindings to use if this
+           module is hooked up with a function bar
+        """
+        kb = KeyBindings()
+        kb.add(Keys.F1)(handle_bound_key_pressed(self.presenter.rebuild_index))
+        kb.add(Keys.F2)(handle_bound_key_pressed(self.presenter.review_selected_game))
+        return kb
+
+    def has_focus(self) -> bool:
+        """Returns true if this container has focus"""
+        has_focus = get_app().layout.has_focus(self._container)
+        if has_focus:
+            get_app().layout.focus(self._filter_input)
+        return has_focus
+
+    def __pt_container__(self) -> Container:
+        return self._container
@@ -1,8 +1,7 @@
 from cli_chess.modules.board import BoardModel
-from cli_chess.utils import EventManager
-from typing import Dict
-from chess import PIECE_SYMBOLS, PIECE_TYPES, PieceType, Color, COLORS, WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
-import re
+from cli_chess.utils import EventManager, EventTopics
+from typing import Dict, Optional, Tuple
+from chess import PIECE_TYPES, PieceType, Color, COLORS, WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, popcount
 
 PIECE_VALUE: Dict[PieceType, int] = {
     KING: 0,
@@ -21,9 +20,10 @@ class MaterialDifferenceModel:
 
         self.material_difference: Dict[Color, Dict[PieceType, int]] = self.default_material_difference()
         self.score: Dict[Color, int] = self.default_score()
+        self._material_counts: Optional[Tuple[Tuple[int, ...], ...]] = None
 
         self._event_manager = EventManager()
-        self.e_material_difference_model_updated = self._event_manager.create_event()
+        self.e_material_difference_model_updated = self._event_manager.create_event(coalesce=True)
         self.update()
 
     @staticmethod
@@ -39,78 +39,79 @@ class MaterialDifferenceModel:
         """Returns a default score dictionary"""
         return {WHITE: 0, BLACK: 0}
 
-    @staticmethod
-    def generate_pieces_fen(board_fen: str) -> str:
-        """Generates a fen containing pieces only by
-           parsing the passed in board fen
-           Example: rnbqkbnrppppppppPPPPPPPPRNBQKBNR"""
-        pieces_fen = ""
-        if board_fen:
-            regex = re.compile('[^a-zA-Z]')
-            pieces_fen = regex.sub('', board_fen)
-        return pieces_fen
-
     def _reset_all(self) -> None:
         """Reset variables to default state"""
         self.material_difference = self.default_material_difference()
         self.score = self.default_score()
+        self._material_counts = None
 
     def update(self, *args, **kwargs) -> None: # noqa
-        """Update the material difference using the latest board FEN"""
+        """Update the material difference using the latest board position. Listeners are
+           only notified if the material on the board changed, or the board orientation changed
+        """
         variant = self.board_model.get_variant_name()
 
         if variant != "horde":
-            self._reset_all()
-
-            if variant == "crazyhouse":  # Show material difference in pocket format
-                self._update_material_difference_crazyhouse(variant)
-            else:
-                pieces_fen = self.generate_pieces_fen(self.board_model.board.board_fen())
+            material_counts = self._get_material_counts(variant)
 
-                # Todo: Update to use chess.Piece()?
-                for piece in pieces_fen:
-                    color = WHITE if piece.isupper() else BLACK
-                    piece_type = PIECE_SYMBOLS.index(piece.lower())
-
-                    self._update_material_difference(color, piece_type)
-                    self._update_score(color, piece_type)
-
-                if variant == "3check":
-                    self.material_difference[WHITE][KING] = 3 - self.board_model.board.remaining_checks[WHITE]
-                    self.material_difference[BLACK][KING] = 3 - self.board_model.board.remaining_checks[BLACK]
+            if material_counts != self._material_counts:
+                self._material_counts = material_counts
+                self._update_from_material_counts(variant, material_counts)
+            elif EventTopics.BOARD_ORIENTATION_CHANGED not in args:
+                return
 
             self._notify_material_difference_model_updated()
 
-    def _update_material_difference(self, color: Color, piece_type: PieceType) -> None:
-        """Updates the material difference based on the passed in piece"""
-        if piece_type in PIECE_TYPES:
-            opponent_piece_type_count = self.material_difference[not color][piece_type]
+    def _get_material_counts(self, variant: str) -> Tuple[Tuple[int, ...], ...]:
+        """Returns the piece counts for each color indexed by piece type, followed
+           by the remaining checks for 3check. For crazyhouse the pocket counts are used.
+        """
+        board = self.board_model.board
+        if variant == "crazyhouse":
+            return tuple(tuple(board.pockets[color].count(piece_type) for piece_type in PIECE_TYPES) for color in COLORS)
 
-            if opponent_piece_type_count > 0:
-                self.material_difference[not color][piece_type] -= 1
-            else:
-                self.material_difference[color][piece_type] += 1
+        material_counts = (self._get_piece_counts(WHITE), self._get_piece_counts(BLACK))
+        if variant == "3check":
+            material_counts += (tuple(board.remaining_checks),)
+        return material_counts
 
-    def _update_material_difference_crazyhouse(self, variant: str) -> None:
-        """Updates the material difference to represent the crazyhouse pocket data.
-           This function should only ever be called on confirmed crazyhouse games.
+    def _get_piece_counts(self, color: Color) -> Tuple[int, ...]:
+        """Returns the piece counts of the passed in color indexed by piece type (pawn to king).
+           Counts are taken from the bitboard popcounts as this is called on every board update.
         """
-        if variant == "crazyhouse":
-            for color in COLORS:
-                for _, piece in enumerate(str(self.board_model.board.pockets[color])):
-                    piece_type = PIECE_SYMBOLS.index(piece.lower())
-                    self.material_difference[color][piece_type] += 1
-
-    def _update_score(self, color: Color, piece_type: PieceType) -> None:
-        """Uses the material difference to
-           calculate the score for each side"""
-        if piece_type in PIECE_TYPES:
-            self.score[color] += PIECE_VALUE[piece_type]
-
-            advantage_color = WHITE if self.score[WHITE] > self.score[BLACK] else BLACK
-            difference = abs(self.score[WHITE] - self.score[BLACK])
-            self.score[advantage_color] = difference
-            self.score[not advantage_color] = 0
+        board = self.board_model.board
+        occupied = board.occupied_co[color]
+        return (popcount(board.pawns & occupied), popcount(board.knights & occupied), popcount(board.bishops & occupied),
+                popcount(board.rooks & occupied), popcount(board.queens & occupied), popcount(board.kings & occupied))
+
+    def _update_from_material_counts(self, variant: str, material_counts: Tuple[Tuple[int, ...], ...]) -> None:
+        """Updates the material difference and score from the passed in material counts"""
+        self.material_difference = self.default_material_difference()
+        self.score = self.default_score()
+
+        if variant == "crazyhouse":  # Show material difference in pocket format
+            for color, pocket_counts in zip(COLORS, material_counts):
+                for piece_type, count in zip(PIECE_TYPES, pocket_counts):
+                    self.material_difference[color][piece_type] = count
+            return
+
+        white_counts, black_counts = material_counts[0], material_counts[1]
+        score_difference = 0
+        for piece_type, white_count, black_count in zip(PIECE_TYPES, white_counts, black_counts):
+            count_difference = white_count - black_count
+            if count_difference > 0:
+                self.material_difference[WHITE][piece_type] = count_difference
+            elif count_difference < 0:
+                self.material_difference[BLACK][piece_type] = -count_difference
+            score_difference += count_difference * PIECE_VALUE[piece_type]
+
+        advantage_color = WHITE if score_difference > 0 else BLACK
+        self.score[advantage_color] = abs(score_difference)
+
+        if variant == "3check":
+            remaining_checks = material_counts[2]
+            self.material_difference[WHITE][KING] = 3 - remaining_checks[WHITE]
+            self.material_difference[BLACK][KING] = 3 - remaining_checks[BLACK]
 
     def get_material_difference(self, color: Color) -> Dict[PieceType, int]:
         """Returns the material difference dictionary associated to the passed in color"""
@@ -1,7 +1,7 @@
 from cli_chess.modules.board import BoardModel
-from cli_chess.utils import EventManager, log
-from chess import piece_symbol
-from typing import List
+from cli_chess.utils import EventManager, EventTopics, log
+from chess import Board, Move, piece_symbol
+from typing import List, Optional
 
 
 class MoveListModel:
@@ -10,43 +10,94 @@ class MoveListModel:
         self.board_model.e_board_model_updated.add_listener(self.update)
         self.move_list_data = []
 
+        # Plies mirrored on the replay board, in sync with the move list data
+        self._synced_moves: List[Move] = []
+        self._replay_board: Optional[Board] = None
+        self._replay_board_source: Optional[Board] = None
+        self._replay_initial_fen = ""
+
         self._event_manager = EventManager()
-        self.e_move_list_model_updated = self._event_manager.create_event()
+        self.e_move_list_model_updated = self._event_manager.create_event(coalesce=True)
         self.update()
 
     def update(self, *args, **kwargs) -> None: # noqa
-        """Updates the move list data using the latest move stack"""
-        self.move_list_data.clear()
+        """Updates the move list data using the latest move stack. Only the plies
+           which changed since the last update are (re)generated. The move list
+           is only fully rebuilt once the board has been reinitialized or set.
+        """
+        rebuild_required = self._is_rebuild_required(*args)
+        if rebuild_required:
+            self._reset_replay_board()
 
-        # The move replay board is used to generate the move list output
-        # by replaying the move stack of the actual game on the replay board
-        move_replay_board = self.board_model.board.copy()
-        move_replay_board.set_fen(self.board_model.initial_fen)
+        move_stack = self.board_model.get_move_stack()
+        common_plies = self._get_common_plies(move_stack)
+        if not rebuild_required and common_plies == len(self._synced_moves) == len(move_stack):
+            return  # The move stack is unchanged (e.g. premove highlight or orientation updates)
 
-        for move in self.board_model.get_move_stack():
-            piece_type = None
-            if bool(move):
-                piece_type = move_replay_board.piece_type_at(move.from_square) if not move.drop else move.drop
+        # Truncate the plies that are no longer on the move stack (e.g. takebacks)
+        while len(self._synced_moves) > common_plies:
+            self._synced_moves.pop()
+            self.move_list_data.pop()
+            self._replay_board.pop()
 
+        for move in move_stack[common_plies:]:
             try:
-                san_move = move_replay_board.san(move)
-                self.move_list_data.append({
-                    'turn': move_replay_board.turn,
-                    'move': san_move,
-                    'piece_type': piece_type,
-                    'piece_symbol': piece_symbol(piece_type) if bool(move) else None,
-                    'is_castling': move_replay_board.is_castling(move),
-                    'is_promotion': True if move.promotion else False,
-                })
-                move_replay_board.push_san(san_move)
+                self.move_list_data.append(self._get_move_data(move))
+                self._replay_board.push(move)
+                self._synced_moves.append(move)
             except ValueError as e:
                 log.error(f"Error creating move list: {e}")
-                log.error(f"Move list data: {self.board_model.get_move_stack()}")
+                log.error(f"Move list data: {move_stack}")
                 self.move_list_data.clear()
+                self._replay_board = None
                 break
 
         self._notify_move_list_model_updated()
 
+    def _is_rebuild_required(self, *args) -> bool:
+        """Returns True if the move list has to be rebuilt from the initial position"""
+        return (self._replay_board is None or
+                EventTopics.GAME_START in args or
+                self._replay_board_source is not self.board_model.board or
+                self._replay_initial_fen != self.board_model.initial_fen)
+
+    def _reset_replay_board(self) -> None:
+        """Resets the replay board to the boards initial position and clears the move list data.
+           The replay board is used to generate the move list output by mirroring the move stack
+           of the actual game.
+        """
+        self._replay_board_source = self.board_model.board
+        self._replay_initial_fen = self.board_model.initial_fen
+        self._replay_board = self.board_model.board.copy(stack=False)
+        self._replay_board.set_fen(self._replay_initial_fen)
+        self._synced_moves.clear()
+        self.move_list_data.clear()
+
+    def _get_common_plies(self, move_stack: List[Move]) -> int:
+        """Returns the amount of plies the synced moves have in common with the passed in move
+           stack. Moves are compared by identity from the end, as the move stack is only ever
+           rewritten from the end. This keeps the comparison constant for appends and pops.
+        """
+        common_plies = min(len(self._synced_moves), len(move_stack))
+        while common_plies > 0 and self._synced_moves[common_plies - 1] is not move_stack[common_plies - 1]:
+            common_plies -= 1
+        return common_plies
+
+    def _get_move_data(self, move: Move) -> dict:
+        """Returns the move list data of the passed in move in the context of the replay board"""
+        piece_type = None
+        if bool(move):
+            piece_type = self._replay_board.piece_type_at(move.from_square) if not move.drop else move.drop
+
+        return {
+            'turn': self._replay_board.turn,
+            'move': self._replay_board.san(move),
+            'piece_type': piece_type,
+            'piece_symbol': piece_symbol(piece_type) if bool(move) else None,
+            'is_castling': self._replay_board.is_castling(move),
+            'is_promotion': True if move.promotion else False,
+        }
+
     def get_move_list_data(self) -> List[dict]:
         """Returns the move list data"""
         return self.move_list_data
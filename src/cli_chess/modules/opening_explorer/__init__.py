@@ -0,0 +1,4 @@
+from .opening_explorer_index import OpeningExplorerIndex, ExplorerMove
+from .opening_explorer_model import OpeningExplorerModel, opening_explorer_index
+from .opening_explorer_view import OpeningExplorerView
+from .opening_explorer_presenter import OpeningExplorerPresenter
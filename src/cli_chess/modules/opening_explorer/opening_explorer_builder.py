@@ -0,0 +1,148 @@
+from cli_chess.modules.opening_explorer.opening_explorer_index import OpeningExplorerIndex, RESULTS, encode_move
+from cli_chess.utils.logging import log
+from cli_chess.utils.pgn import get_pgn_save_dir, ANNOTATED_SUFFIX
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+import chess
+import chess.pgn
+import chess.polyglot
+import glob
+import io
+import os
+
+MAX_EXPLORER_PLIES = 40
+CHUNK_SIZE = 4 * 1024 * 1024  # PGN input is split into chunks of roughly this many bytes for the worker processes
+CHUNKS_PER_TASK = 16  # Batches the many small files of the saved games directory
+STANDARD_VARIANTS = ["", "standard", "from position"]
+
+# A chunk of a PGN file identified by its filename, start offset and end offset
+Chunk = Tuple[str, int, int]
+
+
+class ExplorerVisitor(chess.pgn.BaseVisitor):
+    """Streams the mainline moves of standard chess games into the game counts. Variations,
+       comments and moves past the explorer depth are skipped rather than parsed.
+    """
+    def __init__(self, counts: Counter):
+        self.counts = counts
+        self.games = 0
+        self.headers = {}
+        self.moves = []
+
+    def begin_game(self) -> None:
+        self.headers = {}
+        self.moves = []
+
+    def visit_header(self, tagname: str, tagvalue: str) -> None:
+        self.headers[tagname] = tagvalue
+
+    def end_headers(self):
+        """Skips games without a result, and games in a chess variant"""
+        if self.headers.get("Result") not in RESULTS or self.headers.get("Variant", "").lower() not in STANDARD_VARIANTS:
+            return chess.pgn.SKIP
+
+    def begin_variation(self):
+        return chess.pgn.SKIP
+
+    def begin_parse_san(self, board: chess.Board, san: str):
+        if len(self.moves) >= MAX_EXPLORER_PLIES:
+            return chess.pgn.SKIP
+
+    def visit_move(self, board: chess.Board, move: chess.Move) -> None:
+        self.moves.append((chess.polyglot.zobrist_hash(board), encode_move(move)))
+
+    def handle_error(self, error: Exception) -> None:
+        """Keeps the moves up to an illegal move rather than failing the whole input"""
+        log.debug(f"Opening explorer: skipping the rest of an invalid game ({error})")
+
+    def end_game(self) -> None:
+        if self.moves:
+            result = RESULTS.index(self.headers["Result"])
+            self.counts.update((key, raw_move, result) for key, raw_move in self.moves)
+            self.games += 1
+
+    def result(self) -> bool:
+        return True
+
+
+def count_pgn(pgn: io.TextIOBase, counts: Counter) -> int:
+    """Adds the explorer counts of every game in the PGN to the passed in counts.
+       Returns the number of games which were counted.
+    """
+    visitor = ExplorerVisitor(counts)
+    while chess.pgn.read_game(pgn, Visitor=lambda: visitor):
+        pass
+    return visitor.games
+
+
+def _count_chunk(chunk: Chunk) -> Tuple[Counter, int]:
+    """Returns the explorer counts and the number of games of the chunk. Runs in the worker processes"""
+    filename, start, end = chunk
+    with open(filename, "rb") as pgn_file:
+        pgn_file.seek(start)
+        data = pgn_file.read(end - start)
+
+    counts = Counter()
+    games = count_pgn(io.StringIO(data.decode("utf-8-sig", errors="replace")), counts)
+    return counts, games
+
+
+def get_chunks(filename: str, chunk_size: int = CHUNK_SIZE) -> List[Chunk]:
+    """Splits the PGN file into chunks of about the chunk size. Chunks
+       are split at the start of a game (a line starting with `[Event `)
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as pgn_file:
+        while boundaries[-1] + chunk_size < size:
+            pgn_file.seek(boundaries[-1] + chunk_size)
+            pgn_file.readline()
+            while (line := pgn_file.readline()) and not line.startswith(b"[Event "):
+                pass
+            if not line:
+                break
+            boundaries.append(pgn_file.tell() - len(line))
+    boundaries.append(size)
+    return [(filename, start, end) for start, end in zip(boundaries, boundaries[1:])]
+
+
+def get_explorer_pgn_files(paths: List[str]) -> List[str]:
+    """Returns the PGN files to index: the saved games and the passed in files or directories of PGN files"""
+    files = []
+    for path in [get_pgn_save_dir()] + paths:
+        if os.path.isdir(path):
+            files.extend(file for file in sorted(glob.glob(os.path.join(path, "*.pgn"))) if not file.endswith(ANNOTATED_SUFFIX))
+        elif os.path.isfile(path):
+            files.append(path)
+        elif path in paths:
+            print(f"Skipping {path} (not found)")
+    return list(dict.fromkeys(os.path.abspath(file) for file in files))
+
+
+def build_opening_explorer(index: OpeningExplorerIndex, paths: List[str], workers: Optional[int] = None) -> int:
+    """Rebuilds the opening explorer index from the saved games and the passed in PGN
+       files or directories. Large inputs are split into chunks which are parsed across a
+       process pool (sized to the CPU count by default). Returns the number of games indexed.
+    """
+    chunks = [chunk for filename in get_explorer_pgn_files(paths) for chunk in get_chunks(filename)]
+    total_size = sum(end - start for _, start, end in chunks)
+    counts = Counter()
+    games = 0
+
+    if total_size > CHUNK_SIZE and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            for chunk_counts, chunk_games in executor.map(_count_chunk, chunks, chunksize=CHUNKS_PER_TASK):
+                counts.update(chunk_counts)
+                games += chunk_games
+                print(f"Indexed {games} games", end="\r")
+    else:
+        for chunk in chunks:
+            chunk_counts, chunk_games = _count_chunk(chunk)
+            counts.update(chunk_counts)
+            games += chunk_games
+
+    index.set_counts(counts)
+    index.save()
+    print(f"\rIndexed {games} games into the opening explorer ({len(index)} moves)")
+    return games
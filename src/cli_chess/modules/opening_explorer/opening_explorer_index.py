@@ -0,0 +1,167 @@
+from cli_chess.utils import log
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+import chess
+import chess.polyglot
+import os
+import struct
+import threading
+
+# Index file header: magic, version, hash table size, move record count
+HEADER = struct.Struct("<4sIII")
+MAGIC = b"CCXP"
+VERSION = 1
+RESULTS = ["1-0", "1/2-1/2", "0-1"]
+
+
+@dataclass
+class ExplorerMove:
+    """The results of the games which played the move from a position"""
+    move: chess.Move
+    white_wins: int
+    draws: int
+    black_wins: int
+
+    @property
+    def games(self) -> int:
+        return self.white_wins + self.draws + self.black_wins
+
+
+def encode_move(move: chess.Move) -> int:
+    """Encodes a standard chess move into 16 bits"""
+    return move.to_square | move.from_square << 6 | (move.promotion or 0) << 12
+
+
+def decode_move(raw_move: int) -> chess.Move:
+    """Decodes a move encoded by `encode_move`"""
+    return chess.Move(raw_move >> 6 & 0x3f, raw_move & 0x3f, promotion=raw_move >> 12 or None)
+
+
+class OpeningExplorerIndex:
+    """Opening explorer statistics of the indexed games, stored in flat arrays. Each move played
+       from a position is a record holding its white win, draw and black win counts. Records of
+       the same position are stored next to each other, and are found through an open addressing
+       hash table keyed by the positions Zobrist hash so a position is looked up in constant time.
+       The index is loaded from disk on first use.
+    """
+    def __init__(self, filename: Callable[[], str]):
+        self.filename = filename
+        self._slot_keys = array("Q")
+        self._slot_starts = array("I")
+        self._slot_counts = array("H")
+        self._moves = array("H")
+        self._results = array("I")
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get_moves(self, board: chess.Board) -> List[ExplorerMove]:
+        """Returns the indexed moves of the position ordered by popularity"""
+        if board.uci_variant != "chess" or board.chess960:
+            return []
+
+        with self._lock:
+            self._load()
+            slot = self._find_slot(chess.polyglot.zobrist_hash(board))
+            if slot is None:
+                return []
+
+            start = self._slot_starts[slot]
+            moves = [ExplorerMove(decode_move(self._moves[i]), *self._results[i * 3:i * 3 + 3])
+                     for i in range(start, start + self._slot_counts[slot])]
+        return sorted(moves, key=lambda explorer_move: explorer_move.games, reverse=True)
+
+    def set_counts(self, counts: Counter) -> None:
+        """Replaces the index with the passed in game counts, which are keyed
+           by the Zobrist hash, encoded move and result index of each move
+        """
+        records = {}
+        for (key, raw_move, result), count in counts.items():
+            records.setdefault((key, raw_move), [0, 0, 0])[result] += count
+
+        positions = Counter(key for key, _ in records)
+        table_size = 1
+        while table_size < len(positions) * 2:
+            table_size *= 2
+
+        slot_keys = array("Q", bytes(8 * table_size))
+        slot_starts = array("I", bytes(4 * table_size))
+        slot_counts = array("H", bytes(2 * table_size))
+        moves, results = array("H"), array("I")
+        mask = table_size - 1
+        for (key, raw_move), result_counts in sorted(records.items()):
+            slot = key & mask
+            while slot_counts[slot] and slot_keys[slot] != key:
+                slot = (slot + 1) & mask
+            if not slot_counts[slot]:
+                slot_keys[slot], slot_starts[slot] = key, len(moves)
+            slot_counts[slot] += 1
+            moves.append(raw_move)
+            results.extend(result_counts)
+
+        with self._lock:
+            self._slot_keys, self._slot_starts, self._slot_counts = slot_keys, slot_starts, slot_counts
+            self._moves, self._results = moves, results
+            self._loaded = True
+
+    def save(self) -> None:
+        """Writes the index to disk"""
+        with self._lock:
+            filename = self.filename()
+            try:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename + ".tmp", "wb") as index_file:
+                    index_file.write(HEADER.pack(MAGIC, VERSION, len(self._slot_keys), len(self._moves)))
+                    for table in [self._slot_keys, self._slot_starts, self._slot_counts, self._moves, self._results]:
+                        table.tofile(index_file)
+                os.replace(filename + ".tmp", filename)
+                log.debug(f"Saved the opening explorer index ({len(self._moves)} moves)")
+            except Exception as e:
+                log.error(f"Error saving the opening explorer index: {e}")
+
+    def reload(self) -> None:
+        """Reloads the index from disk on next use"""
+        with self._lock:
+            self._loaded = False
+
+    def __len__(self) -> int:
+        """Returns the number of indexed moves"""
+        with self._lock:
+            self._load()
+            return len(self._moves)
+
+    def _find_slot(self, key: int) -> Optional[int]:
+        """Returns the hash table slot of the position, or None if it isn't indexed"""
+        if not self._slot_keys:
+            return None
+
+        mask = len(self._slot_keys) - 1
+        slot = key & mask
+        while self._slot_counts[slot]:
+            if self._slot_keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+        return None
+
+    def _load(self) -> None:
+        """Loads the index from disk on first use. Must be called with the lock held"""
+        if self._loaded:
+            return
+
+        self._loaded = True
+        tables = [array("Q"), array("I"), array("H"), array("H"), array("I")]
+        filename = self.filename()
+        try:
+            if os.path.exists(filename):
+                with open(filename, "rb") as index_file:
+                    magic, version, table_size, record_count = HEADER.unpack(index_file.read(HEADER.size))
+                    if magic != MAGIC or version != VERSION:
+                        raise ValueError("Unsupported index file")
+                    for table, length in zip(tables, [table_size, table_size, table_size, record_count, record_count * 3]):
+                        table.fromfile(index_file, length)
+                log.debug(f"Loaded the opening explorer index ({record_count} moves)")
+        except Exception as e:
+            log.error(f"Error loading the opening explorer index: {e}")
+            tables = [array("Q"), array("I"), array("H"), array("H"), array("I")]
+        self._slot_keys, self._slot_starts, self._slot_counts, self._moves, self._results = tables
@@ -0,0 +1,65 @@
+from cli_chess.modules.board import BoardModel
+from cli_chess.modules.opening_explorer.opening_explorer_index import OpeningExplorerIndex, ExplorerMove
+from cli_chess.utils import EventManager
+from cli_chess.utils.config import get_config_path
+from typing import List, Optional
+import chess
+import os
+
+
+class OpeningExplorerModel:
+    """Shows the opening explorer statistics of the board position. While enabled,
+       the position is looked up in the opening explorer index on each board update
+    """
+    def __init__(self, board_model: BoardModel):
+        self.board_model = board_model
+        self.board_model.e_board_model_updated.add_listener(self.update)
+
+        self._enabled = False
+        self._board: Optional[chess.Board] = None
+        self._moves: List[ExplorerMove] = []
+
+        self._event_manager = EventManager()
+        self.e_opening_explorer_model_updated = self._event_manager.create_event()
+
+    def enable(self) -> None:
+        """Enables the opening explorer and looks up the board position"""
+        self._enabled = True
+        self.update()
+
+    def disable(self) -> None:
+        """Disables the opening explorer"""
+        self._enabled = False
+
+    def is_enabled(self) -> bool:
+        """Returns True if the opening explorer is enabled"""
+        return self._enabled
+
+    def update(self, *args, **kwargs) -> None:  # noqa
+        """Looks up the board position in the opening explorer index"""
+        if self._enabled:
+            self._board = self.board_model.board.copy(stack=False)
+            self._moves = opening_explorer_index.get_moves(self._board)
+            self._notify_opening_explorer_model_updated()
+
+    def get_moves(self) -> List[ExplorerMove]:
+        """Returns the explorer moves of the position ordered by popularity"""
+        return self._moves
+
+    def get_board(self) -> Optional[chess.Board]:
+        """Returns the board the explorer moves are for"""
+        return self._board
+
+    def _notify_opening_explorer_model_updated(self) -> None:
+        """Notifies listeners of opening explorer model updates"""
+        self.e_opening_explorer_model_updated.notify()
+
+    def cleanup(self) -> None:
+        """Handles model cleanup tasks. This should only ever
+           be run when this model is no longer needed.
+        """
+        self.disable()
+        self._event_manager.purge_all_events()
+
+
+opening_explorer_index = OpeningExplorerIndex(lambda: os.path.join(get_config_path(), "opening_explorer.bin"))
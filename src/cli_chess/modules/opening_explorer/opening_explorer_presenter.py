@@ -0,0 +1,48 @@
+from __future__ import annotations
+from cli_chess.modules.opening_explorer import OpeningExplorerView
+from cli_chess.utils.ui_common import repaint_ui
+from typing import TYPE_CHECKING, List
+if TYPE_CHECKING:
+    from cli_chess.modules.opening_explorer import OpeningExplorerModel
+
+MAX_EXPLORER_MOVES = 5
+
+
+class OpeningExplorerPresenter:
+    def __init__(self, model: OpeningExplorerModel):
+        self.model = model
+        self.view = OpeningExplorerView(self)
+        self.model.e_opening_explorer_model_updated.add_listener(self.update)
+
+    def update(self) -> None:
+        """Updates the opening explorer output"""
+        self.view.update()
+
+    def toggle_opening_explorer(self) -> None:
+        """Enables or disables the opening explorer and shows or hides the explorer view"""
+        if self.model.is_enabled():
+            self.model.disable()
+            self.view.visible = False
+        else:
+            self.model.enable()
+            self.view.visible = True
+        repaint_ui()
+
+    def get_formatted_lines(self) -> List[str]:
+        """Returns the formatted opening explorer output. The first line contains the
+           number of games in the position, and is followed by the most popular moves
+           with their share of the games and the white win, draw and black win rates.
+        """
+        board = self.model.get_board()
+        moves = self.model.get_moves()
+        if not board or not moves:
+            return ["Opening explorer • No games in this position"]
+
+        total = sum(explorer_move.games for explorer_move in moves)
+        output = [f"Opening explorer • {total:,} games"]
+        for explorer_move in moves[:MAX_EXPLORER_MOVES]:
+            games = explorer_move.games
+            san = board.san(explorer_move.move) if board.is_legal(explorer_move.move) else explorer_move.move.uci()
+            output.append(f"{san:<8}{games:>9,} {games / total:>5.0%}   "
+                          f"{explorer_move.white_wins / games:.0%} / {explorer_move.draws / games:.0%} / {explorer_move.black_wins / games:.0%}")
+        return output
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from prompt_toolkit.layout import Container, ConditionalContainer, Window, FormattedTextControl, D
+from prompt_toolkit.filters import Condition
+from cli_chess.utils.ui_common import repaint_ui
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from cli_chess.modules.opening_explorer import OpeningExplorerPresenter
+
+
+class OpeningExplorerView:
+    def __init__(self, presenter: OpeningExplorerPresenter):
+        self.presenter = presenter
+        self.visible = False
+        self._explorer_output = FormattedTextControl(text=self._get_explorer_text, style="class:analysis", show_cursor=False)
+        self._container = self._create_container()
+
+    def _create_container(self) -> Container:
+        """Create the opening explorer container"""
+        return ConditionalContainer(
+            Window(self._explorer_output, always_hide_cursor=True, wrap_lines=False, height=D(max=6)),
+            Condition(lambda: self.visible)
+        )
+
+    def _get_explorer_text(self) -> str:
+        """Returns the opening explorer text to display"""
+        return "\n".join(self.presenter.get_formatted_lines()) if self.visible else ""
+
+    def update(self) -> None:
+        """Requests the opening explorer display to be redrawn"""
+        if self.visible:
+            repaint_ui()
+
+    def __pt_container__(self) -> Container:
+        """Returns this views container"""
+        return self._container
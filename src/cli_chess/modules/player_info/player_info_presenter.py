@@ -16,7 +16,8 @@ class PlayerInfoPresenter:
         self.view_upper = PlayerInfoView(self, self.model.game_metadata.players[not orientation])
         self.view_lower = PlayerInfoView(self, self.model.game_metadata.players[orientation])
 
-        self.model.e_game_model_updated.add_listener(self.update)
+        self.model.e_game_model_updated.add_listener(self.update, topics=[EventTopics.GAME_START, EventTopics.GAME_END,
+                                                                          EventTopics.BOARD_ORIENTATION_CHANGED])
 
     def update(self, *args, **kwargs) -> None:
         """Updates the view based on specific model updates"""
@@ -1,78 +1,108 @@
 from cli_chess.modules.board import BoardModel
 from cli_chess.utils import EventManager, EventTopics, log
-from chess import Move, InvalidMoveError, IllegalMoveError, AmbiguousMoveError
+from chess import Board, Move, InvalidMoveError, IllegalMoveError, AmbiguousMoveError
+from typing import List, Optional
+
+MAX_PREMOVES = 10
 
 
 class PremoveModel:
+    """Holds the queue of premoves to make. Each queued premove is validated
+       against the hypothetical position reached by the premoves before it.
+    """
     def __init__(self, board_model: BoardModel) -> None:
         self.board_model = board_model
-        self.board_model.e_board_model_updated.add_listener(self.update)
-        self.premove = ""
+        self.board_model.e_board_model_updated.add_listener(self.update, topics=[EventTopics.GAME_END])
+        self.premoves: List[str] = []
 
         self._event_manager = EventManager()
         self.e_premove_model_updated = self._event_manager.create_event()
 
+    @property
+    def premove(self) -> str:
+        """Returns the next premove to make"""
+        return self.premoves[0] if self.premoves else ""
+
     def update(self, *args, **kwargs) -> None: # noqa
         """Updates the premove model based on board updates"""
         if EventTopics.GAME_END in args:
             self.clear_premove()
 
     def pop_premove(self) -> str:
-        """Returns the set premove, but also clears it after"""
+        """Returns the next premove, and removes it from the queue. This must be called
+           once the premove has been played, as the premoves left in the queue are validated
+           against the new position. If one is no longer valid, it and the premoves after it
+           are cancelled.
+        """
         premove = self.premove
         if premove:
-            log.debug(f"Popping premove: {self.premove}")
-            self.clear_premove()
+            log.debug(f"Popping premove: {premove}")
+            self.premoves.pop(0)
+            try:
+                self._set_premove_highlights(self.premoves)
+            except ValueError as e:
+                log.debug(f"Cancelling the queued premoves: {e}")
+                self.premoves.clear()
+                self.board_model.clear_premove_highlight()
+            self._notify_premove_model_updated()
         return premove
 
     def clear_premove(self) -> None:
-        """Clears the set premove"""
-        self.premove = ""
+        """Clears all queued premoves"""
+        self.premoves.clear()
         self.board_model.clear_premove_highlight()
         self._notify_premove_model_updated()
 
     def set_premove(self, move: str = None) -> None:
-        """Sets the passed in move as the premove to make.
+        """Adds the passed in move to the end of the premove queue.
            Raises an exception if the premove is invalid.
         """
-        try:
-            premove = self._validate_premove(move)
-            self.premove = move
-            log.debug(f"Premove set to ({move})")
-            self.board_model.set_premove_highlight(premove)
-        except Exception as e:
-            raise e
+        if not move:
+            raise Warning("No move specified")
+
+        if len(self.premoves) >= MAX_PREMOVES:
+            raise Warning(f"You can only queue {MAX_PREMOVES} premoves")
 
+        move = move.strip()
+        self._set_premove_highlights(self.premoves + [move])
+        self.premoves.append(move)
+        log.debug(f"Premove queue set to ({' '.join(self.premoves)})")
         self._notify_premove_model_updated()
 
-    def _validate_premove(self, move: str = None) -> Move:
-        """Checks if the premove passed in is valid in the context of game.
-           Raises an exception if the premove is invalid. Returns the move
-           in the format of chess.Move
+    def _set_premove_highlights(self, premoves: List[str]) -> None:
+        """Validates the premoves and highlights them on the board.
+           Raises a ValueError if a premove is invalid.
         """
-        try:
-            if not move:
-                raise Warning("No move specified")
+        self.board_model.set_premove_highlights([move for move in self._validate_premoves(premoves) if move])
 
-            if self.premove:
-                raise Warning("You already have a premove set")
+    def _validate_premoves(self, premoves: List[str]) -> List[Optional[Move]]:
+        """Checks if the premoves are valid in the context of the game. Each premove is
+           played on a copy of the board (skipping the opponents replies) to validate the
+           premove after it. Premoves which are not legal in their hypothetical position
+           are allowed, as the opponents reply may make them legal. The positions after
+           such a premove are unknown, so the premoves after it are not validated.
+           Raises a ValueError if a premove is invalid. Returns the premoves in the format
+           of chess.Move, or None for premoves which could not be validated.
+        """
+        premove_board: Optional[Board] = self.board_model.board.copy(stack=False)
+        premove_color = not premove_board.turn
+        moves = []
+        for move in premoves:
+            if premove_board is None:
+                moves.append(None)
+                continue
 
-            tmp_premove_board = self.board_model.board.copy(stack=False)
-            tmp_premove_board.turn = not tmp_premove_board.turn
+            premove_board.turn = premove_color
             try:
-                return tmp_premove_board.push_san(move.strip())
-
-            except Exception as e:
-                if isinstance(e, InvalidMoveError):
-                    raise ValueError(f"Invalid premove: {move}")
-                elif isinstance(e, IllegalMoveError):
-                    return
-                elif isinstance(e, AmbiguousMoveError):
-                    raise ValueError(f"Ambiguous premove: {move}")
-                else:
-                    raise e
-        except Exception:
-            raise
+                moves.append(premove_board.push_san(move))
+            except InvalidMoveError:
+                raise ValueError(f"Invalid premove: {move}")
+            except AmbiguousMoveError:
+                raise ValueError(f"Ambiguous premove: {move}")
+            except IllegalMoveError:
+                moves.append(None)
+                premove_board = None
+        return moves
 
     def _notify_premove_model_updated(self) -> None:
         """Notifies listeners of premove model updates"""
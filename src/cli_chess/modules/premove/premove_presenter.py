@@ -13,19 +13,23 @@ class PremovePresenter:
 
     def update(self, *args, **kwargs) -> None:
         """Updates the view based on specific model updates"""
-        self.view.update(self.model.premove)
+        self.view.update(" ".join(self.model.premoves))
 
     def set_premove(self, move: str) -> None:
         if move:
             return self.model.set_premove(move)
 
+    def get_premove(self) -> str:
+        """Returns the next queued premove without removing it from the queue"""
+        return self.model.premove
+
     def pop_premove(self) -> str:
-        """Returns the set premove, but also clears it after"""
+        """Returns the next queued premove, and removes it from the queue"""
         return self.model.pop_premove()
 
     def clear_premove(self) -> None:
         self.model.clear_premove()
 
     def is_premove_set(self) -> bool:
-        """Returns True if a premove is set"""
+        """Returns True if a premove is queued"""
         return bool(self.model.premove)
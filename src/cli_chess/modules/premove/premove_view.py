@@ -26,7 +26,7 @@ class PremoveView:
         )
 
     def update(self, premove: str) -> None:
-        """Updates the pre-move text display with the pre-move passed in"""
+        """Updates the pre-move text display with the pre-moves passed in"""
         self.premove = premove if premove else ""
 
     def __pt_container__(self) -> Container:
@@ -0,0 +1,302 @@
+from cli_chess.utils import EventTopics
+from cli_chess.core.api import network_core, GameStateDispatcher, IncomingEventManager
+from cli_chess.core.api.network_core import NetworkCore, HttpConnection, ConnectionPool, ApiResponseError, iter_ndjson
+from unittest.mock import Mock
+import asyncio
+import contextlib
+import threading
+import pytest
+
+
+def create_connection(response: bytes) -> HttpConnection:
+    """Returns a connection which reads the passed in raw response. Must be called on a running loop"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(response)
+    writer = Mock()
+    writer.is_closing.return_value = False
+    writer.drain = Mock(side_effect=lambda: asyncio.sleep(0))
+    return HttpConnection(reader, writer)
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+@pytest.fixture
+def core():
+    core = NetworkCore("lip_token", "https://lichess.org")
+    yield core
+    core.stop()
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Patches new connections to read the responses appended to the returned list"""
+    responses = []
+    opened = []
+
+    async def open_connection(*args):
+        opened.append(create_connection(responses.pop(0)))
+        return opened[-1]
+
+    monkeypatch.setattr(HttpConnection, "open", open_connection)
+    return responses, opened
+
+
+def test_iter_ndjson():
+    async def chunks():
+        for chunk in [b'{"type": "gameFull"', b', "id": 1}\n\n', b'\n{"type": "gameState"}\n{"type": "chatLine"}']:
+            yield chunk
+
+    events = asyncio.run(collect(iter_ndjson(chunks())))
+    assert events == [{"type": "gameFull", "id": 1}, {"type": "gameState"}, {"type": "chatLine"}]
+
+
+def test_http_connection_chunked_response():
+    async def read():
+        connection = create_connection(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nContent-Type: application/x-ndjson\r\n\r\n"
+                                       b"5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\n\r\n")
+        await connection.send_request("POST", "/api/board/seek", {"Host": "lichess.org"}, b"time=1")
+        status_code, headers = await connection.read_response_head()
+        return connection, status_code, headers, await connection.read_body(headers)
+
+    connection, status_code, headers, body = asyncio.run(read())
+    assert (status_code, headers["content-type"], body) == (200, "application/x-ndjson", b"hello world")
+    request = connection.writer.write.call_args.args[0]
+    assert request == b"POST /api/board/seek HTTP/1.1\r\nHost: lichess.org\r\nContent-Length: 6\r\n\r\ntime=1"
+    assert connection.is_usable()
+
+
+def test_http_connection_close():
+    async def read():
+        connection = create_connection(b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 2\r\n\r\n{}")
+        _, headers = await connection.read_response_head()
+        return connection, await connection.read_body(headers)
+
+    connection, body = asyncio.run(read())
+    assert body == b"{}"
+    assert not connection.is_usable()
+
+
+def test_fetch_reuses_connections(core: NetworkCore, connections):
+    responses, opened = connections
+    responses.append(b"HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n{\"ok\":true}" * 2)
+
+    async def fetch_twice():
+        return [await core.fetch("POST", "/api/board/game/abc/move/e2e4"), await core.fetch("POST", "/api/board/game/abc/resign")]
+
+    assert asyncio.run(fetch_twice()) == [{"ok": True}, {"ok": True}]
+    assert len(opened) == 1
+    assert b"Authorization: Bearer lip_token" in opened[0].writer.write.call_args.args[0]
+
+
+def test_fetch_retries_stale_connection(core: NetworkCore, connections):
+    responses, opened = connections
+    responses.append(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+
+    async def fetch():
+        # A pooled connection which the server closed without it being noticed yet
+        stale_connection = create_connection(b"")
+        stale_connection.reader.feed_eof()
+        stale_connection.is_usable = Mock(return_value=True)
+        core._request_pool.idle.append(stale_connection)
+        return stale_connection, await core.fetch("GET", "/api/account")
+
+    stale_connection, response = asyncio.run(fetch())
+    assert response == {}
+    stale_connection.writer.close.assert_called()
+    assert len(opened) == 1
+    assert core._request_pool.idle == opened
+
+
+def test_fetch_does_not_resend_received_request(core: NetworkCore, connections):
+    _, opened = connections
+
+    async def fetch():
+        # The connection closes mid response, so the move may have been played
+        connection = create_connection(b"HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n{")
+        connection.reader.feed_eof()
+        core.board_pool.idle.append(connection)
+        await core.fetch("POST", "/api/board/game/abc/move/e2e4", pool=core.board_pool)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(fetch())
+    assert not opened
+
+
+def test_fetch_retries_failed_write(core: NetworkCore, connections):
+    responses, opened = connections
+    responses.append(b"HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n{\"ok\":true}")
+
+    async def fetch():
+        stale_connection = create_connection(b"")
+        stale_connection.writer.drain.side_effect = ConnectionResetError("Connection reset by peer")
+        core._request_pool.idle.append(stale_connection)
+        return await core.fetch("POST", "/api/board/game/abc/move/e2e4")
+
+    assert asyncio.run(fetch()) == {"ok": True}
+    assert len(opened) == 1
+
+
+def test_fetch_timeout(core: NetworkCore, connections, monkeypatch):
+    responses, opened = connections
+    responses.append(b"")
+    monkeypatch.setattr(network_core, "READ_TIMEOUT", 0.05)
+
+    # A half open connection which never responds is closed once the read timeout passes
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(core.fetch("GET", "/api/account"))
+    opened[0].writer.close.assert_called()
+
+
+def test_fetch_error_response(core: NetworkCore, connections):
+    responses, _ = connections
+    responses.append(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 17\r\n\r\n{"error":"Nope"}\n')
+    with pytest.raises(ApiResponseError) as e:
+        asyncio.run(core.fetch("POST", "/api/board/game/abc/move/e2e5"))
+    assert e.value.status_code == 400
+
+
+def test_stream(core: NetworkCore, connections):
+    responses, opened = connections
+    responses.append(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                     b"F\r\n{\"type\":\"a\"}\n\n\n\r\n1\r\n\n\r\nC\r\n{\"type\":\"b\"}\r\n0\r\n\r\n")
+    assert asyncio.run(collect(core.stream("GET", "/api/stream/event"))) == [{"type": "a"}, {"type": "b"}]
+    opened[0].writer.close.assert_called()
+
+
+def test_request_delivers_on_delivery_thread(core: NetworkCore, monkeypatch):
+    async def fetch(method, path, data=None, pool=None):
+        return {"path": path, "thread": threading.current_thread().name}
+
+    monkeypatch.setattr(core, "fetch", fetch)
+    core.start()
+    delivered = threading.Event()
+    received = {}
+
+    def callback(response, error):
+        received.update(response=response, error=error, thread=threading.current_thread().name)
+        delivered.set()
+
+    assert core.request("GET", "/api/account").result(timeout=5)["thread"] == "lichess-network"
+    core.request("GET", "/api/account", callback=callback)
+    assert delivered.wait(timeout=5)
+    assert received == {"response": {"path": "/api/account", "thread": "lichess-network"}, "error": None, "thread": "lichess-events"}
+
+
+def test_stop_cancels_streams(core: NetworkCore):
+    core.start()
+    stream_task = core.submit(asyncio.sleep(60))
+    core.stop()
+    with pytest.raises(Exception):
+        stream_task.result(timeout=5)
+    assert stream_task.cancelled()
+
+
+def test_encode():
+    assert NetworkCore._encode({"rated": False, "clock.limit": 600, "days": None, "text": "gg wp"}) == b"rated=false&clock.limit=600&text=gg+wp"
+    assert NetworkCore._encode(None) == b""
+    assert network_core.MAX_IDLE_CONNECTIONS > 0
+
+
+def test_streams_deliver_events(core: NetworkCore, monkeypatch):
+    from cli_chess.core.api import api_manager
+    monkeypatch.setattr(api_manager, "api_network_core", core, raising=False)
+
+    async def stream(method, path, data=None):
+        for event in events[path]:
+            yield event
+
+    events = {
+        "/api/board/game/stream/abc": [{"type": "gameState", "moves": "e2e4", "status": "started"},
+                                       {"type": "gameState", "moves": "e2e4 e7e5", "status": "resign"}],
+        "/api/stream/event": [{"type": "gameStart", "game": {"gameId": "abc"}}],
+    }
+    monkeypatch.setattr(core, "stream", stream)
+    core.start()
+
+    # Verify the streams run on the network core and events are handled on the delivery thread
+    received = []
+    game_over = threading.Event()
+    gsd = GameStateDispatcher("abc")
+    gsd.add_event_listener(lambda *args, data: received.append((args, threading.current_thread().name)))
+    gsd.add_event_listener(lambda *args, data: game_over.set() if EventTopics.GAME_END in args else None)
+    iem = IncomingEventManager(core)
+    iem.add_event_listener(lambda *args, data: received.append((args, threading.current_thread().name)))
+    gsd.start()
+    iem.start()
+
+    assert game_over.wait(timeout=5)
+    core.stop()
+    assert ((EventTopics.MOVE_MADE, None), "lichess-events") in received
+    assert ((EventTopics.MOVE_MADE, EventTopics.GAME_END), "lichess-events") in received
+    assert gsd.is_game_over
+
+
+def test_board_commands(monkeypatch):
+    from cli_chess.core.api import api_manager
+    core = Mock()
+    core.submit.side_effect = lambda coroutine: coroutine.close()
+    monkeypatch.setattr(api_manager, "api_network_core", core, raising=False)
+    gsd = GameStateDispatcher("abc")
+    gsd.make_move("e2e4")
+    gsd.post_message("gg")
+    assert core.request.call_args_list[0].args == ("POST", "/api/board/game/abc/move/e2e4")
+    assert core.request.call_args_list[1].args == ("POST", "/api/board/game/abc/chat", {"room": "player", "text": "gg"})
+    assert all(call.kwargs["pool"] is core.board_pool for call in core.request.call_args_list)
+
+    # Moves are sent without waiting on the response. The round trip is recorded once it completes
+    assert not gsd.move_round_trips
+    done_callback = core.request.return_value.add_done_callback.call_args.args[0]
+    done_callback(core.request.return_value)
+    assert len(gsd.move_round_trips) == 1
+
+    gsd.start()
+    core.keep_board_connections_warm.assert_called_once()
+    gsd.stop()
+    core.keep_board_connections_warm.return_value.cancel.assert_called_once()
+
+
+def test_board_commands_not_resent(monkeypatch):
+    from cli_chess.core.api import api_manager
+    core = Mock()
+    core.request.return_value.result.side_effect = TimeoutError()
+    monkeypatch.setattr(api_manager, "api_network_core", core, raising=False)
+
+    # A command which timed out may have been received, so it's cancelled rather than sent again
+    gsd = GameStateDispatcher("abc")
+    with pytest.raises(TimeoutError):
+        gsd.post_message("gg")
+    core.request.assert_called_once()
+    core.request.return_value.cancel.assert_called_once()
+
+
+def test_keep_board_connections_warm(core: NetworkCore, connections):
+    responses, opened = connections
+    responses.extend([b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}"] * network_core.BOARD_POOL_SIZE)
+
+    async def keep_warm():
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(core._keep_board_connections_warm(), timeout=0.2)
+
+    # The pool is filled and each connection is pinged. Stopping closes the connections
+    asyncio.run(keep_warm())
+    assert len(opened) == network_core.BOARD_POOL_SIZE
+    for connection in opened:
+        assert connection.writer.write.call_args.args[0].startswith(f"GET {network_core.KEEP_ALIVE_PATH} HTTP/1.1".encode())
+        connection.writer.close.assert_called()
+    assert not core.board_pool.idle
+
+
+def test_connection_pool_warm():
+    async def warm():
+        pool = ConnectionPool(lambda: asyncio.sleep(0, create_connection(b"")), 2)
+        closed_connection = create_connection(b"")
+        closed_connection.reader.feed_eof()
+        pool.idle.append(closed_connection)
+        await pool.warm()
+        return pool, closed_connection
+
+    pool, closed_connection = asyncio.run(warm())
+    assert len(pool.idle) == 2 and closed_connection not in pool.idle
+    closed_connection.writer.close.assert_called()
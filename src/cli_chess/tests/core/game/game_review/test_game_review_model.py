@@ -0,0 +1,114 @@
+from cli_chess.core.game.game_review import GameReviewModel
+from cli_chess.core.game.game_review import game_review_model
+from cli_chess.utils import EventTopics
+from chess import WHITE, BLACK
+from unittest.mock import Mock
+import chess
+import chess.pgn
+import io
+import pytest
+
+PGN = ('[Event "cli-chess online"]\n[White "alice"]\n[Black "bob"]\n[Result "0-1"]\n[WhiteElo "1850"]\n[BlackTitle "GM"]\n'
+       '[TimeControl "300+3"]\n[Termination "Normal"]\n\n'
+       '1. e4 { [%clk 0:05:00] } e5 { [%clk 0:04:58] } 2. Nf3 { [%clk 0:04:55] } Nc6 3. Bb5 { [%clk 0:04:50] } a6 4. Ba4 Nf6 '
+       '5. O-O Be7 6. Re1 b5 7. Bb3 d6 8. c3 O-O 9. h3 Nb8 10. d4 Nbd7 11. c4 c6 12. cxb5 axb5 13. Nc3 Bb7 0-1\n')
+
+
+@pytest.fixture
+def game():
+    return chess.pgn.read_game(io.StringIO(PGN))
+
+
+@pytest.fixture
+def model(game):
+    return GameReviewModel(game)
+
+
+@pytest.fixture
+def model_listener(model: GameReviewModel):
+    listener = Mock()
+    model.e_game_model_updated.add_listener(listener)
+    return listener
+
+
+def test_init(model: GameReviewModel, game):
+    # Verify the review starts on the final position
+    assert model.get_ply_count() == 26
+    assert model.ply == 26
+    assert model.board_model.board.fen() == game.end().board().fen()
+    assert model.board_model.highlight_move == chess.Move.from_uci("c8b7")
+    assert len(model.move_list_model.get_move_list_data()) == 26
+
+    # Verify the metadata is set from the headers
+    assert model.game_metadata.players[WHITE].name == "alice"
+    assert model.game_metadata.players[WHITE].rating == "1850"
+    assert model.game_metadata.players[BLACK].title == "GM"
+    assert model.game_metadata.game_status.winner == "black"
+    assert model.game_metadata.game_status.status == "Normal"
+
+
+def test_seek(model: GameReviewModel, game, model_listener: Mock):
+    # Verify every ply matches the replayed game, seeking in and out of order
+    move_list_data = list(model.move_list_model.get_move_list_data())
+    boards = [game.board()]
+    for move in game.mainline_moves():
+        boards.append(boards[-1].copy())
+        boards[-1].push(move)
+
+    for ply in [0, 1, 2, 25, 24, 10, 9, 17, 3, 26, 18, 0] + list(range(27)) + list(reversed(range(27))):
+        model.seek(ply)
+        assert model.ply == ply
+        assert model.board_model.board.fen() == boards[ply].fen()
+        move_stack = model.board_model.board.move_stack
+        assert move_stack == boards[ply].move_stack[ply - len(move_stack):]
+        assert model.move_list_model.get_move_list_data() == move_list_data[:ply]
+    model_listener.assert_called_with(EventTopics.MOVE_MADE)
+
+    # Verify seeking is clamped to the game
+    model.seek(-5)
+    assert model.ply == 0
+    model.seek(100)
+    assert model.ply == 26
+
+
+def test_seek_uses_checkpoints(model: GameReviewModel, monkeypatch):
+    # Verify a far seek restores a checkpoint and replays at most a checkpoint interval of moves
+    model.seek(0)
+    push = Mock(wraps=chess.Board.push)
+    monkeypatch.setattr(chess.Board, "push", lambda board, move: push(board, move))
+    model.seek(23)
+    assert push.call_count == 23 % game_review_model.CHECKPOINT_INTERVAL
+
+    # Verify nearby plies are reached from the current board
+    board = model.board_model.board
+    model.step(-2)
+    model.step(1)
+    assert model.board_model.board is board
+    assert push.call_count == 23 % game_review_model.CHECKPOINT_INTERVAL + 1
+
+
+def test_clocks(model: GameReviewModel):
+    clocks = model.game_metadata.clocks
+    model.seek(0)
+    assert (clocks[WHITE].time, clocks[BLACK].time, clocks[WHITE].units) == (300, 300, "sec")
+    model.seek(2)
+    assert (clocks[WHITE].time, clocks[BLACK].time) == (300, 298)
+    model.seek(4)
+    assert (clocks[WHITE].time, clocks[BLACK].time) == (295, 298)
+
+    # Verify the last known clock is kept for moves without a clock comment
+    model.seek(26)
+    assert (clocks[WHITE].time, clocks[BLACK].time) == (290, 298)
+
+
+def test_get_move_ply(model: GameReviewModel):
+    assert model.get_move_ply(1, WHITE) == 1
+    assert model.get_move_ply(15, WHITE) == 26
+    assert model.get_move_ply(5, BLACK) == 10
+
+    # Verify games starting with black to move
+    game = chess.pgn.Game.from_board(chess.Board("4k3/8/8/8/8/8/8/4K2R b K - 0 12"))
+    game.add_line([chess.Move.from_uci("e8d7"), chess.Move.from_uci("h1h7")])
+    model = GameReviewModel(game)
+    assert model.get_move_ply(12, BLACK) == 1
+    assert model.get_move_ply(13, WHITE) == 2
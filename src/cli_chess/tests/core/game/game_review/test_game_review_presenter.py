@@ -0,0 +1,46 @@
+from cli_chess.core.game.game_review import GameReviewModel, GameReviewPresenter
+import chess.pgn
+import io
+import pytest
+
+PGN = '[White "alice"]\n[Black "bob"]\n[Result "1-0"]\n[Termination "Normal"]\n\n1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0\n'
+
+
+@pytest.fixture
+def presenter():
+    return GameReviewPresenter(GameReviewModel(chess.pgn.read_game(io.StringIO(PGN))))
+
+
+def test_update(presenter: GameReviewPresenter):
+    assert presenter.view.alert._alert_label.text == "Ply 7 of 7 • 1-0 (Normal)"
+    presenter.step(-2)
+    assert presenter.view.alert._alert_label.text == "Ply 5 of 7"
+
+
+def test_navigation(presenter: GameReviewPresenter):
+    presenter.go_to_start()
+    assert presenter.model.ply == 0
+    presenter.step(3)
+    assert presenter.model.ply == 3
+    presenter.go_to_end()
+    assert presenter.model.ply == 7
+
+
+def test_go_to_move(presenter: GameReviewPresenter):
+    presenter.go_to_move("2")
+    assert presenter.model.ply == 3
+    presenter.go_to_move(" 3... ")
+    assert presenter.model.ply == 6
+    presenter.go_to_move("0")
+    assert presenter.model.ply == 0
+    presenter.go_to_move("40")
+    assert presenter.model.ply == 7
+
+    # Verify invalid input is reported without moving
+    presenter.go_to_move("e4")
+    assert presenter.model.ply == 7
+    assert presenter.view.alert._alert_label.text == "Invalid move number: e4"
+
+
+def test_is_analysis_allowed(presenter: GameReviewPresenter):
+    assert presenter.is_analysis_allowed()
@@ -0,0 +1,77 @@
+from cli_chess.core.game.game_options import GameOption
+from cli_chess.core.game.offline_game import OfflineGameModel
+from chess.engine import PlayResult
+from chess import Move
+from concurrent.futures import CancelledError
+from unittest.mock import Mock, patch
+import threading
+import pytest
+
+
+class BlockingEngineSearch:
+    """Engine search which runs until stopped"""
+    searches = []
+
+    def __init__(self, *args, **kwargs):
+        self._stopped = threading.Event()
+        BlockingEngineSearch.searches.append(self)
+
+    def wait(self):
+        if not self._stopped.wait(timeout=5):
+            return PlayResult(Move.from_uci("e7e5"), None)
+        raise CancelledError()
+
+    def stop(self):
+        self._stopped.set()
+
+    def is_running(self):
+        return not self._stopped.is_set()
+
+
+@pytest.fixture
+def model():
+    game_parameters = {
+        GameOption.COLOR: "white",
+        GameOption.VARIANT: "standard",
+        GameOption.COMPUTER_SKILL_LEVEL: 1,
+    }
+    BlockingEngineSearch.searches.clear()
+    with patch("cli_chess.modules.engine.engine_model.EngineSearch", BlockingEngineSearch):
+        model = OfflineGameModel(game_parameters)
+        model.engine_model.engine = Mock()
+        yield model
+
+
+def start_engine_search(model: OfflineGameModel, results: list) -> threading.Thread:
+    """Starts an engine search in a separate thread and waits for it to be running"""
+    search_count = len(BlockingEngineSearch.searches)
+    thread = threading.Thread(target=lambda: results.append(model.engine_model.get_best_move()), daemon=True)
+    thread.start()
+    while len(BlockingEngineSearch.searches) == search_count:
+        thread.join(timeout=0.001)
+    return thread
+
+
+def test_takeback_spam_stops_engine_search(model: OfflineGameModel):
+    results = []
+    for _ in range(50):
+        model.make_move("e4")
+        thread = start_engine_search(model, results)
+        model.propose_takeback()
+        thread.join(timeout=0.5)
+        assert not thread.is_alive()
+
+    assert len(results) == 50
+    assert all(result.move is None for result in results)
+    assert not any(search.is_running() for search in BlockingEngineSearch.searches)
+    assert model.board_model.get_move_stack() == []
+
+
+def test_resign_stops_engine_search(model: OfflineGameModel):
+    results = []
+    model.make_move("e4")
+    thread = start_engine_search(model, results)
+    model.resign()
+    thread.join(timeout=0.5)
+    assert not thread.is_alive()
+    assert results[0].move is None
@@ -3,14 +3,13 @@ from cli_chess.core.game.online_game import OnlineGameModel
 from cli_chess.core.api.incoming_event_manger import IEMEventTopics
 from cli_chess.utils import EventTopics
 from unittest.mock import Mock
-import threading
 import pytest
 
 
 @pytest.fixture
 def model(monkeypatch):
     from cli_chess.core.api import api_manager
-    monkeypatch.setattr(api_manager, "api_client", Mock(), raising=False)
+    monkeypatch.setattr(api_manager, "api_network_core", Mock(), raising=False)
     monkeypatch.setattr(api_manager, "api_iem", Mock(), raising=False)
 
     game_parameters = {
@@ -24,30 +23,42 @@ def model(monkeypatch):
 
 
 def test_create_game_sends_direct_challenge(model):
-    model.api_client.challenges.create.return_value = {'id': 'abc123'}
-    challenge_sent = threading.Event()
     received = {}
 
     def listener(*args, **kwargs):
         if kwargs.get('msg'):
             received.update(args=args, msg=kwargs.get('msg'))
-            challenge_sent.set()
 
     model.e_game_model_updated.add_listener(listener)
     model.create_game()
 
-    assert challenge_sent.wait(timeout=5)
-    model.api_client.challenges.create.assert_called_once_with(username="testOpponent",
-                                                               rated=False,
-                                                               clock_limit=600,
-                                                               clock_increment=5,
-                                                               color="random",
-                                                               variant="standard")
+    model.network_core.request.assert_called_once_with("POST", "/api/challenge/testOpponent", {
+        "rated": False,
+        "clock.limit": 600,
+        "clock.increment": 5,
+        "color": "random",
+        "variant": "standard",
+    }, callback=model._handle_challenge_response)
+    assert model.searching
+
+    # The response is handed back on the network cores event delivery thread
+    model._handle_challenge_response({'id': 'abc123'}, None)
     assert model.sent_challenge_id == 'abc123'
     assert EventTopics.GAME_SEARCH in received['args']
     assert received['msg'] == "Challenge sent to testOpponent. Waiting for a response..."
 
 
+def test_create_game_error_stops_search(model):
+    received = {}
+    model.e_game_model_updated.add_listener(lambda *args, **kwargs: received.update(args=args, msg=kwargs.get('msg')))
+    model.create_game()
+    model._handle_challenge_response(None, ValueError("Lichess API error 400: bad request"))
+
+    assert not model.searching
+    assert EventTopics.ERROR in received['args']
+    assert received['msg'] == "Error creating online game: Lichess API error 400: bad request"
+
+
 def test_iem_challenge_declined_stops_search(model):
     received = {}
 
@@ -123,7 +134,7 @@ def test_exit_cancels_pending_challenge(model):
     model.sent_challenge_id = 'abc123'
     model.exit()
 
-    model.api_client.challenges.cancel.assert_called_once_with('abc123')
+    model.network_core.request.assert_called_once_with("POST", "/api/challenge/abc123/cancel")
     assert not model.game_in_progress
     assert model.sent_challenge_id is None
 
@@ -131,5 +142,145 @@ def test_exit_cancels_pending_challenge(model):
 def test_exit_without_pending_challenge(model):
     model.exit()
 
-    model.api_client.challenges.cancel.assert_not_called()
+    model.network_core.request.assert_not_called()
     assert not model.game_in_progress
+
+
+def test_gsd_move_made_syncs_board(model):
+    model.game_in_progress = True
+    model.board_model.reinitialize_board("standard", model.my_color)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5 g1f3", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3"
+
+    # Test a takeback followed by a new move
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5 f1c4", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4 e7e5 f1c4"
+
+
+def test_make_move_is_tentative_until_confirmed(model):
+    model.game_in_progress = True
+    model.my_color = True
+    model.game_state_dispatcher = Mock()
+    model.board_model.reinitialize_board("standard", model.my_color)
+
+    # The move is played on the board before lichess responds
+    model.make_move("e4")
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4"
+    assert model.game_state_dispatcher.make_move.call_args.args == ("e2e4",)
+
+    # A game state sent before lichess processed the move keeps it
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4"
+    assert model.board_model.tentative_move
+
+    # The echoed move confirms it without replaying the game
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4"
+    assert model.board_model.tentative_move is None
+
+
+def test_make_move_rolled_back_on_rejection(model):
+    received = {}
+    model.e_game_model_updated.add_listener(lambda *args, **kwargs: received.update(args=args, msg=kwargs.get('msg')))
+    model.game_in_progress = True
+    model.my_color = True
+    model.game_state_dispatcher = Mock()
+    model.board_model.reinitialize_board("standard", model.my_color)
+
+    model.make_move("d4")
+    callback = model.game_state_dispatcher.make_move.call_args.kwargs['callback']
+    callback(Exception("Not your turn, or game already over"))
+    assert model.board_model.get_move_stack(as_string=True) == ""
+    assert received == {'args': (EventTopics.ERROR,), 'msg': "Move d2d4 was not accepted"}
+
+    # A different server state replaces the tentative move
+    model.make_move("d4")
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.get_move_stack(as_string=True) == "e2e4"
+    assert model.board_model.tentative_move is None
+
+
+def test_tentative_checkmate(model):
+    received = []
+    model.board_model.e_board_model_updated.add_listener(lambda *args, **kwargs: received.append(args))
+    model.game_in_progress = True
+    model.my_color = False
+    model.game_state_dispatcher = Mock()
+    model.board_model.reinitialize_board("standard", model.my_color)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "f2f3 e7e5 g2g4", 'wtime': 600000, 'btime': 600000})
+    received.clear()
+
+    # The game end is left for lichess to confirm
+    model.make_move("Qh4#")
+    model.board_model.get_move_completions("")
+    assert received == [(EventTopics.MOVE_MADE,)]
+    assert model.game_in_progress
+
+    # A rejected mate is taken back, and the game can carry on
+    callback = model.game_state_dispatcher.make_move.call_args.kwargs['callback']
+    callback(Exception("Not your turn, or game already over"))
+    assert model.board_model.get_move_stack(as_string=True) == "f2f3 e7e5 g2g4"
+    assert not model.board_model.is_game_over()
+    assert EventTopics.GAME_END not in [topic for args in received for topic in args]
+
+    # Once confirmed the board reports the game end
+    model.make_move("Qh4#")
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "f2f3 e7e5 g2g4 d8h4", 'wtime': 600000, 'btime': 600000})
+    assert model.board_model.tentative_move is None
+    assert model.board_model.is_game_over()
+
+
+def test_premove_sent_before_listeners_notified(model):
+    model.game_in_progress = True
+    model.my_color = True
+    model.game_state_dispatcher = Mock(is_game_over=False, event_received_at=None)
+    model.board_model.reinitialize_board("standard", model.my_color)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4", 'wtime': 600000, 'btime': 600000})
+    model.premove_model.set_premove("Nf3")
+
+    # The premove must already be sent and played when the board listeners are notified
+    board_states = []
+    model.board_model.e_board_model_updated.add_listener(
+        lambda *args, **kwargs: board_states.append((model.game_state_dispatcher.make_move.called, model.board_model.get_move_stack(as_string=True))))
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5", 'wtime': 600000, 'btime': 600000})
+    assert model.game_state_dispatcher.make_move.call_args.args == ("g1f3",)
+    assert board_states and all(state == (True, "e2e4 e7e5 g1f3") for state in board_states)
+    assert not model.premove_model.premove
+
+    # An invalid premove is cleared without being sent
+    model.game_state_dispatcher.make_move.reset_mock()
+    model.board_model.reinitialize_board("standard", model.my_color)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4", 'wtime': 600000, 'btime': 600000})
+    model.premove_model.set_premove("e5")
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5", 'wtime': 600000, 'btime': 600000})
+    model.game_state_dispatcher.make_move.assert_not_called()
+    assert not model.premove_model.premove
+
+
+def test_premove_queue(model):
+    model.game_in_progress = True
+    model.my_color = True
+    model.game_state_dispatcher = Mock(is_game_over=False, event_received_at=None)
+    model.board_model.reinitialize_board("standard", model.my_color)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4", 'wtime': 600000, 'btime': 600000})
+    for premove in ["Nf3", "Bc4", "O-O"]:
+        model.set_premove(premove)
+
+    # Each queued premove is sent as soon as it's our turn
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5", 'wtime': 600000, 'btime': 600000})
+    assert model.game_state_dispatcher.make_move.call_args.args == ("g1f3",)
+    assert model.premove_model.premoves == ["Bc4", "O-O"]
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5 g1f3 b8c6", 'wtime': 600000, 'btime': 600000})
+    assert model.game_state_dispatcher.make_move.call_args.args == ("f1c4",)
+    assert model.premove_model.premoves == ["O-O"]
+    assert model.board_model.premove_highlights
+
+    # A reply which makes the next premove invalid cancels the queue
+    model.premove_model.set_premove("Bxf7")
+    model.game_state_dispatcher.make_move.reset_mock()
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5 g1f3 b8c6 f1c4 f8c5", 'wtime': 600000, 'btime': 600000})
+    assert model.game_state_dispatcher.make_move.call_args.args == ("e1g1",)
+    model._handle_gsd_event(EventTopics.MOVE_MADE, None, data={'moves': "e2e4 e7e5 g1f3 b8c6 f1c4 f8c5 e1g1 d7d5", 'wtime': 600000, 'btime': 600000})
+    assert model.game_state_dispatcher.make_move.call_count == 1
+    assert model.premove_model.premoves == []
+    assert model.board_model.premove_highlights == []
@@ -1,15 +1,25 @@
 from cli_chess.core.game import game_presenter_base
 from cli_chess.core.game.game_options import GameOption
 from cli_chess.core.game.offline_game import OfflineGameModel, OfflineGamePresenter
+from cli_chess.modules.game_archive import GameArchiveModel
 from cli_chess.utils import EventTopics
 from cli_chess.utils.pgn import save_game_pgn
-from chess import WHITE
+from chess import WHITE, Move
 from unittest.mock import Mock
 import pytest
+import time
 
 
 @pytest.fixture
-def save_spy(monkeypatch, tmp_path):
+def game_archive(monkeypatch, tmp_path, tmp_path_factory):
+    index_filename = str(tmp_path_factory.mktemp("archive") / "game_archive.db")
+    game_archive = GameArchiveModel(lambda: str(tmp_path), lambda: index_filename)
+    monkeypatch.setattr(game_presenter_base, "g_game_archive_model", game_archive)
+    return game_archive
+
+
+@pytest.fixture
+def save_spy(monkeypatch, tmp_path, game_archive):
     from cli_chess.utils import pgn
     monkeypatch.setattr(pgn, "get_pgn_save_dir", lambda: str(tmp_path))
     spy = Mock(wraps=save_game_pgn)
@@ -36,7 +46,7 @@ def saved_lines(presenter) -> list:
     return [line for line in presenter.view.alert._alert_label.text.split("\n") if line.startswith("Game saved:")]
 
 
-def test_resignation_saves_pgn_once(presenter, save_spy, tmp_path):
+def test_resignation_saves_pgn_once(presenter, save_spy, tmp_path, game_archive):
     presenter.model.board_model.make_move("e4")
     presenter.model.board_model.handle_resignation(WHITE)
 
@@ -44,6 +54,9 @@ def test_resignation_saves_pgn_once(presenter, save_spy, tmp_path):
     assert len(saved_lines(presenter)) == 1
     assert len(list(tmp_path.iterdir())) == 1
 
+    # Verify the saved game is added to the game archive index
+    assert [game.result for game in game_archive.search()] == ["0-1"]
+
 
 def test_checkmate_saves_pgn_once_and_keeps_result(presenter, save_spy, tmp_path):
     for move in ("f3", "e5", "g4", "Qh4"):
@@ -65,3 +78,59 @@ def test_game_start_allows_the_next_game_to_save(presenter, save_spy):
 
     assert save_spy.call_count == 1
     assert len(saved_lines(presenter)) == 1
+
+
+def test_review_game(presenter, monkeypatch):
+    from cli_chess.core.game import game_review
+    start_game_review = Mock()
+    monkeypatch.setattr(game_review, "start_game_review", start_game_review)
+    monkeypatch.setattr(presenter.view, "exit", Mock())
+
+    # Verify a game in progress cannot be reviewed
+    presenter.model.board_model.make_move("e4")
+    presenter.review_game()
+    start_game_review.assert_not_called()
+
+    presenter.model.board_model.handle_resignation(WHITE)
+    presenter.review_game()
+    presenter.view.exit.assert_called_once()
+    game, orientation = start_game_review.call_args.args
+    assert [move.uci() for move in game.mainline_moves()] == ["e2e4"]
+    assert game.headers["Result"] == "0-1"
+    assert orientation == WHITE
+
+
+def test_get_move_completions(presenter):
+    from cli_chess.core.game.game_view_base import MoveCompleter
+    from prompt_toolkit.document import Document
+    completions = MoveCompleter(presenter).get_completions(Document("N"), Mock())
+    assert [completion.text for completion in completions] == ["Na3", "Nc3", "Nf3", "Nh3"]
+
+    # Verify moves are only suggested on the users turn
+    presenter.model.board_model.make_move("e4")
+    assert presenter.get_move_completions("") == []
+
+
+def test_offline_premove_queue(presenter):
+    board_model = presenter.model.board_model
+    board_model.make_move("e4")
+    presenter.user_input_received("d4")
+    presenter.user_input_received("Nc3")
+    assert presenter.model.premove_model.premoves == ["d4", "Nc3"]
+    assert board_model.premove_highlights == [Move.from_uci("d2d4"), Move.from_uci("b1c3")]
+
+    # Record the premove highlights after each move the engine and the premoves make
+    highlights = {}
+    board_model.e_board_model_updated.add_listener(
+        lambda *args, **kwargs: highlights.update({len(board_model.board.move_stack): list(board_model.premove_highlights)}))
+    engine_moves = [Mock(resigned=False, move=Move.from_uci(move)) for move in ["e7e5", "d7d5", "g8f6"]]
+    presenter.engine_presenter.get_best_move = Mock(side_effect=engine_moves)
+    presenter.make_engine_move()
+
+    deadline = time.monotonic() + 5
+    while len(board_model.board.move_stack) < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert board_model.get_move_stack(as_string=True) == "e2e4 e7e5 d2d4 d7d5 b1c3 g8f6"
+    assert highlights[3] == [Move.from_uci("b1c3")]
+    assert presenter.model.premove_model.premoves == []
+    assert board_model.premove_highlights == []
@@ -0,0 +1,212 @@
+from cli_chess.core.game import GameModelBase
+from cli_chess.modules.analysis import AnalysisModel
+from cli_chess.modules.engine import EvaluationCache
+from chess.engine import PovScore, Cp
+from chess import Move, WHITE
+from unittest.mock import Mock, patch
+import threading
+import pytest
+
+
+class MockAnalysis:
+    """Yields the passed in infos and then blocks until stopped"""
+    def __init__(self, board, infos):
+        self.board = board
+        self.infos = infos
+        self.stopped = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __iter__(self):
+        yield from self.infos
+        self.stopped.wait(timeout=5)
+
+    def stop(self):
+        self.stopped.set()
+
+
+@pytest.fixture
+def engine():
+    engine = Mock()
+    engine.analyses = []
+    analysis_started = threading.Semaphore(0)
+
+    def analysis(board, **kwargs):
+        score = PovScore(Cp(len(board.move_stack)), WHITE)
+        analysis = MockAnalysis(board, [{"multipv": 2, "depth": 5, "score": score, "pv": [Move.from_uci("a2a3")]},
+                                        {"multipv": 1, "depth": 5, "score": score, "pv": [Move.from_uci("e2e4")]},
+                                        {"multipv": 1, "depth": 6, "score": score, "pv": [Move.from_uci("d2d4")]},
+                                        {"depth": 6, "nodes": 100}])
+        engine.analyses.append(analysis)
+        analysis_started.release()
+        return analysis
+
+    engine.analysis.side_effect = analysis
+    engine.analysis_started = analysis_started
+    return engine
+
+
+@pytest.fixture
+def engine_pool(engine: Mock):
+    with patch("cli_chess.modules.engine.engine_pool") as engine_pool:
+        engine_pool.checkout.return_value = engine
+        yield engine_pool
+
+
+@pytest.fixture
+def tablebase():
+    with patch("cli_chess.modules.engine.tablebase") as tablebase:
+        tablebase.probe_wdl.return_value = None
+        yield tablebase
+
+
+@pytest.fixture
+def evaluation_cache(tmp_path):
+    with patch("cli_chess.modules.engine.evaluation_cache", EvaluationCache(lambda: str(tmp_path / "cache.bin"))) as evaluation_cache:
+        yield evaluation_cache
+
+
+@pytest.fixture
+def model(engine_pool: Mock, tablebase: Mock, evaluation_cache: EvaluationCache):
+    game_model = GameModelBase()
+    yield game_model.analysis_model
+    game_model.cleanup()
+
+
+def wait_for_lines(model: AnalysisModel, engine: Mock, count: int) -> None:
+    """Waits for the analysis to be (re)started and for the lines to be received"""
+    assert engine.analysis_started.acquire(timeout=5)
+    for _ in range(500):
+        if len(model.get_lines()) == count and model.get_lines()[0].depth == 6:
+            return
+        threading.Event().wait(0.01)
+
+
+def test_start(model: AnalysisModel, engine: Mock, engine_pool: Mock):
+    listener = Mock()
+    model.e_analysis_model_updated.add_listener(listener)
+    model.start()
+    wait_for_lines(model, engine, 2)
+
+    assert model.is_running()
+    assert engine.analysis.call_args.kwargs == {"multipv": 3, "game": model}
+    assert [(line.multipv, line.depth, line.pv) for line in model.get_lines()] == [(1, 6, [Move.from_uci("d2d4")]),
+                                                                                   (2, 5, [Move.from_uci("a2a3")])]
+    assert model.get_analysed_board() == model.board_model.board
+    assert model.get_tablebase_wdl() is None
+    listener.assert_called()
+
+
+def test_evaluation_cache(model: AnalysisModel, engine: Mock, evaluation_cache: EvaluationCache):
+    # Verify the best line is cached once the position has been analysed
+    model.start()
+    wait_for_lines(model, engine, 2)
+    model.board_model.make_move("e4")
+    wait_for_lines(model, engine, 2)
+    cached = evaluation_cache.get(engine.analyses[0].board)
+    assert (cached.depth, cached.best_move) == (6, Move.from_uci("d2d4"))
+
+    # Verify deeper cached evaluations are shown instead of shallower engine lines
+    model.stop()
+    evaluation_cache.put(model.board_model.board, 30, PovScore(Cp(-40), WHITE), Move.from_uci("c7c5"))
+    model.start()
+    assert engine.analysis_started.acquire(timeout=5)
+    for _ in range(500):
+        if len(model.get_lines()) == 2:
+            break
+        threading.Event().wait(0.01)
+    assert [(line.multipv, line.depth, line.pv) for line in model.get_lines()] == [(1, 30, [Move.from_uci("c7c5")]),
+                                                                                   (2, 5, [Move.from_uci("a2a3")])]
+
+
+def test_tablebase_wdl(model: AnalysisModel, engine: Mock, tablebase: Mock):
+    tablebase.probe_wdl.return_value = 2
+    model.start()
+    wait_for_lines(model, engine, 2)
+    assert model.get_tablebase_wdl() == 2
+    assert tablebase.probe_wdl.call_args.args[0] == model.board_model.board
+
+
+def test_update_restarts_analysis(model: AnalysisModel, engine: Mock):
+    model.start()
+    wait_for_lines(model, engine, 2)
+
+    # Verify updates which don't change the position don't restart the analysis
+    model.board_model.set_board_orientation(not model.board_model.get_board_orientation())
+    assert not engine.analyses[0].stopped.is_set()
+
+    model.board_model.make_move("e4")
+    wait_for_lines(model, engine, 2)
+    assert engine.analyses[0].stopped.is_set()
+    assert engine.analyses[1].board.move_stack == [Move.from_uci("e2e4")]
+    assert model.get_lines()[0].score.white() == Cp(1)
+
+
+def test_stop(model: AnalysisModel, engine: Mock, engine_pool: Mock):
+    model.start()
+    wait_for_lines(model, engine, 2)
+    model.stop()
+    assert not model.is_running()
+    assert engine.analyses[0].stopped.is_set()
+
+    for _ in range(500):
+        if engine_pool.release.called:
+            break
+        threading.Event().wait(0.01)
+    engine_pool.release.assert_called_once_with(engine)
+
+    # Verify analysis can be restarted
+    model.start()
+    wait_for_lines(model, engine, 2)
+    assert len(engine.analyses) == 2
+
+
+def test_stop_start_toggle(model: AnalysisModel, engine: Mock, engine_pool: Mock):
+    model.start()
+    wait_for_lines(model, engine, 2)
+
+    # Verify the previous analysis thread exits when the analysis is restarted straight away
+    model.stop()
+    model.start()
+    wait_for_lines(model, engine, 2)
+    for _ in range(500):
+        if engine_pool.release.called:
+            break
+        threading.Event().wait(0.01)
+    engine_pool.release.assert_called_once_with(engine)
+    assert not engine.analyses[1].stopped.is_set()
+
+
+def test_analysed_outcome(model: AnalysisModel, engine: Mock):
+    model.board_model.set_fen("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1")
+    model.start()
+    assert engine.analysis_started.acquire(timeout=5)
+    assert model.get_analysed_outcome().winner == WHITE
+
+
+def test_board_model_read_on_updating_thread(model: AnalysisModel, engine: Mock):
+    threads = set()
+    get_board_outcome = model.board_model.get_board_outcome
+    model.board_model.get_board_outcome = lambda: threads.add(threading.current_thread()) or get_board_outcome()
+
+    # The position is saved on the thread updating the board, not on the analysis thread
+    model.start()
+    wait_for_lines(model, engine, 2)
+    model.board_model.make_move("e4")
+    wait_for_lines(model, engine, 2)
+    assert threads == {threading.current_thread()}
+    assert model.get_analysed_board().fen() == model.board_model.board.fen()
+
+
+def test_engine_error_stops_analysis(model: AnalysisModel, engine_pool: Mock):
+    engine_pool.checkout.side_effect = Exception("Engine failed to start")
+    model.start()
+    for _ in range(500):
+        if not model.is_running():
+            break
+        threading.Event().wait(0.01)
+    assert not model.is_running()
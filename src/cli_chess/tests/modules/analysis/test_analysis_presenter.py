@@ -0,0 +1,83 @@
+from cli_chess.modules.analysis import AnalysisPresenter, AnalysisLine
+from cli_chess.modules.board import BoardModel
+from chess.engine import PovScore, Cp, Mate
+from chess import Move, Outcome, Termination, WHITE, BLACK
+from unittest.mock import Mock
+import pytest
+
+
+@pytest.fixture
+def model():
+    model = Mock()
+    model.board_model = BoardModel()
+    model.is_running.return_value = False
+    model.get_lines.return_value = []
+    model.get_analysed_board.return_value = None
+    model.get_analysed_outcome.return_value = None
+    model.get_tablebase_wdl.return_value = None
+    return model
+
+
+@pytest.fixture
+def presenter(model: Mock):
+    return AnalysisPresenter(model)
+
+
+def test_toggle_analysis(presenter: AnalysisPresenter, model: Mock):
+    presenter.toggle_analysis()
+    model.start.assert_called_once()
+    assert presenter.view.visible
+
+    model.is_running.return_value = True
+    presenter.toggle_analysis()
+    model.stop.assert_called_once()
+    assert not presenter.view.visible
+
+
+def test_get_formatted_lines(presenter: AnalysisPresenter, model: Mock):
+    assert presenter.get_formatted_lines() == ["Analysing..."]
+
+    board = model.board_model.board.copy()
+    board.push_san("e4")
+    model.get_analysed_board.return_value = board
+    model.get_lines.return_value = [
+        AnalysisLine(1, 14, PovScore(Cp(-35), BLACK), [Move.from_uci("c7c5"), Move.from_uci("g1f3")]),
+        AnalysisLine(2, 13, PovScore(Cp(-20), BLACK), [Move.from_uci("e7e5")]),
+        AnalysisLine(3, 13, PovScore(Cp(0), BLACK), [Move.from_uci("e2e4")]),  # Invalid lines are skipped
+    ]
+    assert presenter.get_formatted_lines() == [
+        "Fairy-Stockfish • Depth 14",
+        " +0.35  1...c5 2. Nf3",
+        " +0.20  1...e5",
+    ]
+
+    board.set_fen("7k/6Q1/6K1/8/8/8/8/8 b - - 0 1")
+    model.get_analysed_outcome.return_value = Outcome(Termination.CHECKMATE, WHITE)
+    assert presenter.get_formatted_lines() == ["Game over • No moves to analyse"]
+
+
+def test_get_formatted_lines_tablebase(presenter: AnalysisPresenter, model: Mock):
+    # Verify the tablebase result is shown from whites point of view
+    board = model.board_model.board.copy()
+    board.set_fen("8/8/8/8/8/2k5/8/K6q w - - 0 1")
+    model.get_analysed_board.return_value = board
+    model.get_tablebase_wdl.return_value = -2
+    assert presenter.get_formatted_lines() == ["Syzygy • Black wins", "Analysing..."]
+
+    board.turn = BLACK
+    model.get_tablebase_wdl.return_value = -1
+    model.get_lines.return_value = [AnalysisLine(1, 20, PovScore(Cp(0), BLACK), [Move.from_uci("h1h8")])]
+    assert presenter.get_formatted_lines() == [
+        "Syzygy • Draw by fifty-move rule (White cursed win)",
+        "Fairy-Stockfish • Depth 20",
+        " +0.00  1...Qh8",
+    ]
+
+
+def test_format_score():
+    assert AnalysisPresenter.format_score(Cp(35)) == "+0.35"
+    assert AnalysisPresenter.format_score(Cp(-120)) == "-1.20"
+    assert AnalysisPresenter.format_score(Cp(0)) == "+0.00"
+    assert AnalysisPresenter.format_score(Mate(3)) == "#3"
+    assert AnalysisPresenter.format_score(Mate(-2)) == "#-2"
+    assert AnalysisPresenter.format_score(PovScore(Mate(1), WHITE).black()) == "#-1"
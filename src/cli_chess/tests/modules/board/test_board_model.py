@@ -1,8 +1,11 @@
 from cli_chess.modules.board import BoardModel
+from cli_chess.modules.board.board_model import OutcomeTracker, MoveSyncResult
+from cli_chess.utils import EventTopics
 from unittest.mock import Mock
 import pytest
 import chess
 import chess.variant
+import random
 
 
 @pytest.fixture
@@ -99,6 +102,36 @@ def test_make_move(model: BoardModel, board_updated_listener: Mock):
     assert model.get_highlight_move() == model.board.peek()
 
 
+def test_legal_move_cache(model: BoardModel, monkeypatch):
+    model.set_fen("r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 2 4")
+
+    # Verify parsed moves are only cached until the position changes
+    parse_san = Mock(wraps=model.board.parse_san)
+    monkeypatch.setattr(model.board, "parse_san", parse_san)
+    model.verify_move("d3")
+    model.verify_move("d3")
+    assert parse_san.call_count == 1
+
+    # Verify alternative spellings map to the same legal move
+    for spelling in ["O-O", "0-0", "e1g1"]:
+        assert model.verify_move(spelling) == "e1g1"
+    for spelling in ["Nxe5", "Nf3xe5", "Nf3e5", "f3e5"]:
+        assert model.verify_move(spelling) == "f3e5"
+    assert model.get_move_completions("Nx") == ["Nxe5"]
+    assert model.get_move_completions("Ng") == ["Ng1", "Ng5"]
+
+    # Verify the cache follows position changes
+    model.make_move("d3")
+    assert model.get_move_completions("N") == ["Na5", "Nb4", "Nb8", "Nce7", "Nd4", "Nf6", "Nge7", "Nh6"]
+    assert model.verify_move("Bf8e7") == "f8e7"
+    with pytest.raises(ValueError):
+        model.verify_move("d3")
+
+    # Verify no moves are suggested once the game is over
+    model.set_fen("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+    assert model.get_move_completions("") == []
+
+
 def test_make_moves_from_list(model: BoardModel, board_updated_listener: Mock):
     # Test a valid move sequence
     moves = ["e4", "g6", "d4", "Bg7"]
@@ -117,6 +150,90 @@ def test_make_moves_from_list(model: BoardModel, board_updated_listener: Mock):
     board_updated_listener.assert_not_called()
 
 
+def test_tentative_move(model: BoardModel, board_updated_listener: Mock):
+    # Test the tentative move is played right away
+    model.sync_moves_from_uci_list(["e2e4", "e7e5"])
+    assert model.make_tentative_move("Nf3") == chess.Move.from_uci("g1f3")
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3"
+    board_updated_listener.assert_called_with(EventTopics.MOVE_MADE)
+
+    # Test it is kept while the synced list has not caught up yet, and confirmed once it has
+    board_updated_listener.reset_mock()
+    assert model.sync_moves_from_uci_list(["e2e4", "e7e5"]) == MoveSyncResult()
+    assert model.tentative_move == chess.Move.from_uci("g1f3")
+    assert model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3"]) == MoveSyncResult()
+    assert model.tentative_move is None
+    board_updated_listener.assert_not_called()
+    assert not model.rollback_tentative_move()
+
+    # Test a rollback takes back the move
+    model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3", "b8c6"])
+    model.make_tentative_move("Bb5")
+    assert model.rollback_tentative_move()
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3 b8c6"
+    assert model.get_highlight_move() == chess.Move.from_uci("b8c6")
+    assert not model.rollback_tentative_move()
+
+    # Test a differing synced list replaces the move
+    model.make_tentative_move("Bc4")
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3", "b8c6", "f1b5"])
+    assert (result.applied, result.popped) == (1, 1)
+    assert model.tentative_move is None
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3 b8c6 f1b5"
+
+
+def test_sync_moves_from_uci_list(model: BoardModel, board_updated_listener: Mock):
+    # Test syncing from an empty move stack
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3"])
+    assert (result.applied, result.popped, result.full_replay) == (3, 0, False)
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3"
+    assert model.get_highlight_move() == chess.Move.from_uci("g1f3")
+    board_updated_listener.assert_called()
+
+    # Test only the new suffix is applied
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3", "b8c6"])
+    assert (result.applied, result.popped, result.full_replay) == (1, 0, False)
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 g1f3 b8c6"
+
+    # Test an unchanged list doesn't notify listeners
+    board_updated_listener.reset_mock()
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "g1f3", "b8c6"])
+    assert (result.applied, result.popped) == (0, 0)
+    board_updated_listener.assert_not_called()
+
+    # Test takebacks only pop the divergent tail
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5"])
+    assert (result.applied, result.popped, result.full_replay) == (0, 2, False)
+    assert model.get_highlight_move() == chess.Move.from_uci("e7e5")
+
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "f1c4", "g8f6"])
+    assert (result.applied, result.popped, result.full_replay) == (2, 0, False)
+
+    result = model.sync_moves_from_uci_list(["e2e4", "e7e5", "d2d4"])
+    assert (result.applied, result.popped, result.full_replay) == (1, 2, False)
+    assert model.get_move_stack(as_string=True) == "e2e4 e7e5 d2d4"
+
+    # Test a list without a common prefix falls back to a full replay
+    result = model.sync_moves_from_uci_list(["d2d4", "d7d5"])
+    assert (result.applied, result.popped, result.full_replay) == (2, 3, True)
+    assert model.get_move_stack(as_string=True) == "d2d4 d7d5"
+
+    # Test a list sharing only the last ply is not mistaken for a common prefix
+    result = model.sync_moves_from_uci_list(["g1f3", "d7d5"])
+    assert (result.applied, result.popped, result.full_replay) == (2, 2, True)
+    assert model.get_move_stack(as_string=True) == "g1f3 d7d5"
+
+    # Test syncing to an empty list
+    result = model.sync_moves_from_uci_list([])
+    assert (result.applied, result.popped, result.full_replay) == (0, 2, False)
+    assert model.get_highlight_move() == chess.Move.null()
+    assert model.board.fen() == model.initial_fen
+
+    # Test an illegal move
+    with pytest.raises(ValueError):
+        model.sync_moves_from_uci_list(["e2e4", "e2e4"])
+
+
 def test_takeback(model: BoardModel, board_updated_listener: Mock):
     # Test empty move stack
     model.board.reset()
@@ -355,6 +472,61 @@ def test_is_game_over(model: BoardModel):
     assert model.is_game_over()
 
 
+def test_is_game_over_notifies_once(model: BoardModel, board_updated_listener: Mock):
+    model.make_moves_from_list(["f3", "e5", "g4"])
+    board_updated_listener.reset_mock()
+    model.make_move("Qh4")
+    board_updated_listener.assert_called_once_with(EventTopics.MOVE_MADE, EventTopics.GAME_END)
+
+    # Test further game over checks don't resend the game end
+    board_updated_listener.reset_mock()
+    assert model.is_game_over()
+    with pytest.raises(Warning):
+        model.verify_move("e4")
+    board_updated_listener.assert_not_called()
+
+    # Test the game end is sent again once the position is reset
+    model.reset()
+    assert not model.is_game_over()
+    model.set_fen("k7/8/8/8/8/8/8/K5Q1 w - - 0 1")
+    board_updated_listener.reset_mock()
+    assert not model.is_game_over()
+    model.make_move("Qb6")  # stalemate
+    board_updated_listener.assert_called_once_with(EventTopics.MOVE_MADE, EventTopics.GAME_END)
+
+
+def test_fivefold_repetition(model: BoardModel):
+    knight_shuffle = ["Nf3", "Nf6", "Ng1", "Ng8"]
+    model.make_moves_from_list(knight_shuffle * 3)
+    assert not model.is_game_over()
+
+    model.make_moves_from_list(knight_shuffle)
+    assert model.is_game_over()
+    assert model.get_game_over_result() == chess.Outcome(chess.Termination.FIVEFOLD_REPETITION, None)
+
+    # Test taking back a move clears the repetition
+    model.sync_moves_from_uci_list(model.get_move_stack(as_string=True).split()[:-1])
+    assert not model.is_game_over()
+
+
+@pytest.mark.parametrize("variant", ["standard", "crazyhouse", "3check", "atomic", "antichess", "kingofthehill", "racingkings", "horde"])
+def test_outcome_tracker_matches_board_outcome(variant: str):
+    rng = random.Random(variant)
+    tracker = OutcomeTracker()
+    board = chess.variant.find_variant(variant)()
+
+    for _ in range(300):
+        assert tracker.outcome(board) == board.outcome()
+        if board.outcome() is not None or (board.move_stack and rng.random() < 0.15):
+            for _ in range(rng.randint(1, min(4, len(board.move_stack)))):
+                board.pop()
+        else:
+            for _ in range(rng.choice([1, 1, 1, 3])):
+                legal_moves = list(board.legal_moves)
+                if legal_moves:
+                    board.push(rng.choice(legal_moves))
+
+
 def test_get_game_over_result(model: BoardModel):
     # Test game in progress
     model.set_fen("8/6q1/6k1/8/2K5/8/8/8 w - - 0 1")
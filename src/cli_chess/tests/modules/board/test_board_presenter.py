@@ -30,12 +30,12 @@ def test_update(model: BoardModel, presenter: BoardPresenter, game_config: GameC
     assert presenter.update in model.e_board_model_updated.listeners
 
     # Verify the board presenter update function is calling the board view
-    # update function and passing in the board output data
+    # update function and passing in the board output fragments
     model.make_move("Nf3")
     presenter.view.update = Mock()
     presenter.update()
-    board_output_data = presenter.get_board_display()
-    presenter.view.update.assert_called_with(board_output_data)
+    board_output_fragments = presenter.get_board_fragments()
+    presenter.view.update.assert_called_with(board_output_fragments)
 
 
 def test_update_cached_config_values(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
@@ -78,47 +78,60 @@ def test_make_move(model: BoardModel, presenter: BoardPresenter):
         presenter.make_move("O-O-O")
 
 
-def test_get_board_display(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
+def test_get_board_fragments(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
     game_config.set_value(game_config.Keys.BLINDFOLD_CHESS, "no")
     game_config.set_value(game_config.Keys.USE_UNICODE_PIECES, "no")
     game_config.set_value(game_config.Keys.SHOW_BOARD_COORDINATES, "yes")
-
-    model.set_fen("8/P2R2B1/4p3/5ppQ/1q1nP3/1P1P4/3K1kB1/b7 w - - 0 1")  # white in check
-    board_output = presenter.get_board_display()
-
-    for square_data in board_output:
-        # Test square in check
-        if square_data['square_number'] == chess.D2:
-            assert square_data == {
-                'square_number': chess.D2,
-                'piece_str': 'K',
-                'piece_display_color': 'light-piece',
-                'square_display_color': 'in-check',
-                'rank_label': '',
-                'is_end_of_rank': False
-            }
-
-        # Test start of rank with rank label
-        if square_data['square_number'] == chess.A1:
-            assert square_data == {
-                'square_number': chess.A1,
-                'piece_str': 'B',
-                'piece_display_color': 'dark-piece',
-                'square_display_color': 'dark-square',
-                'rank_label': '1',
-                'is_end_of_rank': False
-            }
-
-        # Test end of rank without piece
-        if square_data['square_number'] == chess.H7:
-            assert square_data == {
-                'square_number': chess.H7,
-                'piece_str': '',
-                'piece_display_color': '',
-                'square_display_color': 'light-square',
-                'rank_label': '',
-                'is_end_of_rank': True
-            }
+    game_config.set_value(game_config.Keys.SHOW_BOARD_HIGHLIGHTS, "yes")
+    render_listener = Mock()
+    presenter.e_board_rendered.add_listener(render_listener)
+
+    # Test the fragments match the board display data
+    board_fragments = presenter.get_board_fragments()
+    assert presenter.render_stats.squares_rendered == 0
+    assert board_fragments[0] == ("class:rank-label", "8")
+    assert board_fragments[1] == ("class:light-square.dark-piece", "R ")
+    assert ("class:dark-square.", "  ") in board_fragments
+    assert board_fragments[-1] == ("class:file-label", " a b c d e f g h ")
+    assert board_fragments.count(("", "\n")) == 8
+    render_listener.assert_called_with(render_stats=presenter.render_stats)
+
+    # Test only the squares touched by a move are recomputed
+    model.make_move("e4")
+    assert presenter.render_stats.squares_rendered == 2
+    assert ("class:last-move.light-piece", "P ") in presenter.get_board_fragments()
+
+    # Test en passant recomputes the captured pawn square
+    model.make_moves_from_list(["a6", "e5", "d5"])
+    model.make_move("exd6")
+    assert presenter.render_stats.squares_rendered == 4  # e5, d6, captured d5 pawn, previous d7 highlight
+
+    # Test castling and check highlights
+    model.set_board_position("r3k2r/pppq1ppp/8/8/1b6/8/PPPP1PPP/RNBQK2R w KQkq - 0 1")
+    full_render_count = presenter.render_stats.full_render_count
+    model.make_move("O-O")
+    assert presenter.render_stats.squares_rendered == 4
+    model.make_move("Bc5")
+    assert presenter.render_stats.squares_rendered == 4  # Moved bishop and removed the castling highlights
+    model.make_move("d4")
+    model.make_move("Qxd4")
+    assert presenter.render_stats.squares_rendered == 3
+    model.make_move("Qe2")  # Check
+    assert presenter.render_stats.squares_rendered == 5
+    assert ("class:in-check.dark-piece", "K ") in presenter.get_board_fragments()
+    assert presenter.render_stats.full_render_count == full_render_count
+
+    # Test premove highlights only recompute the highlighted squares
+    model.set_premove_highlight(chess.Move.from_uci("a2a3"))
+    assert presenter.render_stats.squares_rendered == 2
+
+    # Test orientation and configuration changes recompute all squares
+    model.set_board_orientation(chess.BLACK)
+    assert presenter.render_stats.squares_rendered == 64
+    assert presenter.get_board_fragments()[-1] == ("class:file-label", " h g f e d c b a ")
+    game_config.set_value(game_config.Keys.USE_UNICODE_PIECES, "yes")
+    assert presenter.render_stats.squares_rendered == 64
+    assert presenter.render_stats.full_render_count == full_render_count + 2
 
 
 def test_get_file_labels(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
@@ -233,37 +246,15 @@ def test_get_piece_display_color(model: BoardModel, presenter: BoardPresenter, g
             assert presenter.get_piece_display_color(piece) == ""
 
 
-def test_get_square_display_color(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
+def test_get_square_highlights(model: BoardModel, presenter: BoardPresenter, game_config: GameConfig):
     game_config.set_value(game_config.Keys.SHOW_BOARD_HIGHLIGHTS, "yes")
 
     model.set_fen("rnbqkbnr/ppppp1pp/8/5p2/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 1")
     presenter.make_move("Qh5")  # black in check
-    last_move = model.board.peek()
-
-    for square in chess.SQUARES:
-        # Test in check square
-        if model.is_square_in_check(square):
-            assert presenter.get_square_display_color(square) == "in-check"
+    model.set_premove_highlight(chess.Move.from_uci("g7g6"))
+    assert presenter._get_square_highlights() == {chess.D1: "last-move", chess.H5: "last-move", chess.G7: "pre-move",
+                                                  chess.G6: "pre-move", chess.E8: "in-check"}
 
-        # Test last move squares
-        elif square == last_move.to_square or square == last_move.from_square:
-            assert presenter.get_square_display_color(square) == "last-move"
-
-        # Test light square
-        elif model.is_light_square(square):
-            assert presenter.get_square_display_color(square) == "light-square"
-
-        # Test dark square
-        elif not model.is_light_square(square):
-            assert presenter.get_square_display_color(square) == "dark-square"
-
-    # Test board highlights disabled (no last move color)
+    # Test board highlights disabled
     game_config.set_value(game_config.Keys.SHOW_BOARD_HIGHLIGHTS, "no")
-    presenter.make_move("g6")
-    last_move = model.board.peek()
-
-    if chess.BB_SQUARES[last_move.to_square] & chess.BB_LIGHT_SQUARES:
-        assert presenter.get_square_display_color(last_move.to_square) == "light-square"
-
-    if chess.BB_SQUARES[last_move.from_square] & chess.BB_DARK_SQUARES:
-        assert presenter.get_square_display_color(last_move.from_square) == "dark-square"
+    assert presenter._get_square_highlights() == {}
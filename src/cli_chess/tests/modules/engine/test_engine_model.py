@@ -0,0 +1,182 @@
+from cli_chess.core.game.game_options import GameOption
+from cli_chess.modules.engine import EngineModel, EvaluationCache
+from cli_chess.modules.engine.engine_time_manager import LevelSearchCap
+from cli_chess.modules.board import BoardModel
+from chess.engine import PlayResult, PovScore, Cp, INFO_NONE
+from chess import Move
+import chess
+from concurrent.futures import CancelledError
+from unittest.mock import Mock, patch
+import pytest
+
+
+class MockEngineSearch:
+    """Runs the search synchronously using the mocked engines play method"""
+    def __init__(self, engine, board, limit, **kwargs):
+        self.engine = engine
+        self.args = (board, limit)
+        self.kwargs = kwargs
+
+    def wait(self):
+        return self.engine.play(*self.args, **self.kwargs)
+
+    def stop(self):
+        pass
+
+    def is_running(self):
+        return False
+
+
+@pytest.fixture
+def opening_book():
+    with patch("cli_chess.modules.engine.engine_model.opening_book") as opening_book:
+        opening_book.get_move.return_value = None
+        yield opening_book
+
+
+@pytest.fixture
+def tablebase():
+    with patch("cli_chess.modules.engine.engine_model.tablebase") as tablebase:
+        tablebase.get_best_move.return_value = None
+        yield tablebase
+
+
+@pytest.fixture
+def evaluation_cache(tmp_path):
+    with patch("cli_chess.modules.engine.engine_model.evaluation_cache", EvaluationCache(lambda: str(tmp_path / "cache.bin"))) as evaluation_cache:
+        yield evaluation_cache
+
+
+@pytest.fixture
+def model(opening_book: Mock, tablebase: Mock, evaluation_cache: EvaluationCache):
+    with patch("cli_chess.modules.engine.engine_model.EngineSearch", MockEngineSearch):
+        model = EngineModel(BoardModel(), {GameOption.COMPUTER_SKILL_LEVEL: 1})
+        model.engine = Mock()
+        model.engine.play.return_value = PlayResult(Move.from_uci("e2e4"), Move.from_uci("e7e5"))
+        yield model
+
+
+def test_get_best_move_ponders(model: EngineModel):
+    result = model.get_best_move()
+    assert result.move == Move.from_uci("e2e4")
+    assert model.engine.play.call_args.kwargs['ponder']
+    assert model.engine.play.call_args.kwargs['game'] is model
+    assert model.ponder_move == Move.from_uci("e7e5")
+
+    # Verify playing the expected reply is counted as a ponderhit
+    model.board_model.make_moves_from_list(["e4", "e5"])
+    model.engine.play.return_value = PlayResult(Move.from_uci("g1f3"), None)
+    model.get_best_move()
+    assert model.ponder_hits == 1
+    assert model.ponder_move is None
+
+    # Verify the board passed to the engine is a copy
+    assert model.engine.play.call_args.args[0] is not model.board_model.board
+    assert model.engine.play.call_args.args[0] == model.board_model.board
+
+
+def test_stop_pondering(model: EngineModel):
+    model.stop_pondering()
+    model.engine.ping.assert_not_called()
+
+    model.get_best_move()
+    model.stop_pondering()
+    model.engine.ping.assert_called_once()
+    assert model.ponder_move is None
+
+    # Verify a voided move stops the ponder search
+    model.engine.ping.reset_mock()
+    model.engine.play.side_effect = lambda *args, **kwargs: (model.board_model.make_move("d4"),
+                                                             PlayResult(Move.from_uci("d7d5"), Move.from_uci("c2c4")))[1]
+    assert model.get_best_move().move is None
+    model.engine.ping.assert_called_once()
+    assert model.ponder_move is None
+
+
+def test_get_best_move_cancelled(model: EngineModel):
+    model.engine.play.side_effect = CancelledError()
+    assert model.get_best_move().move is None
+
+
+def test_get_best_move_from_book(model: EngineModel, opening_book: Mock):
+    opening_book.get_move.return_value = Move.from_uci("d2d4")
+    result = model.get_best_move()
+    assert result.move == Move.from_uci("d2d4")
+    assert opening_book.get_move.call_args.args[1] == 1
+    model.engine.play.assert_not_called()
+
+    # Verify the engine is used once out of book, and that the
+    # book is not probed again unless a takeback leaves the book
+    model.board_model.make_moves_from_list(["d4", "d5"])
+    opening_book.get_move.return_value = None
+    assert model.get_best_move().move == Move.from_uci("e2e4")
+    model.board_model.make_moves_from_list(["c4", "e6"])
+    model.get_best_move()
+    assert opening_book.get_move.call_count == 2
+    assert model.engine.play.call_count == 2
+
+    model.board_model.takeback(chess.WHITE)
+    model.board_model.takeback(chess.WHITE)
+    model.get_best_move()
+    assert opening_book.get_move.call_count == 3
+
+
+def test_get_best_move_from_tablebase(model: EngineModel, tablebase: Mock):
+    model.board_model.set_fen("8/8/8/8/8/2k5/8/K6q b - - 0 1")
+    tablebase.get_best_move.return_value = (Move.from_uci("h1b1"), 2)
+    assert model.get_best_move().move == Move.from_uci("h1b1")
+    model.engine.play.assert_not_called()
+
+
+def test_evaluation_cache(model: EngineModel, evaluation_cache: EvaluationCache):
+    # Verify weakened searches are not cached
+    model.get_best_move()
+    assert model.engine.play.call_args.kwargs['info'] == INFO_NONE
+    assert len(evaluation_cache) == 0
+
+    # Verify full strength searches are cached
+    model.game_parameters[GameOption.COMPUTER_SKILL_LEVEL] = 8
+    model.time_manager.search_cap = LevelSearchCap(depth=10, move_time=1.0)
+    model.engine.play.return_value = PlayResult(Move.from_uci("e2e4"), None, {"depth": 10, "score": PovScore(Cp(30), chess.WHITE)})
+    model.get_best_move()
+    assert model.engine.play.call_args.kwargs['info']
+    assert evaluation_cache.get(model.board_model.board).depth == 10
+
+    # Verify cached evaluations which are deep enough are played without searching
+    model.engine.play.reset_mock()
+    assert model.get_best_move().move == Move.from_uci("e2e4")
+    model.engine.play.assert_not_called()
+
+    evaluation_cache.put(model.board_model.board, 12, PovScore(Cp(30), chess.WHITE), Move.from_uci("d2d4"))
+    model.game_parameters[GameOption.COMPUTER_SKILL_LEVEL] = 7
+    assert model.get_best_move().move == Move.from_uci("e2e4")
+    model.engine.play.assert_called_once()
+
+
+def test_stop_search(model: EngineModel):
+    search = Mock()
+    search.is_running.return_value = True
+    model._search = search
+    model.stop_search()
+    search.stop.assert_called_once()
+    assert model._search is None
+
+    # Verify a stop is only sent to running searches
+    search.reset_mock()
+    search.is_running.return_value = False
+    model._search = search
+    model.stop_search()
+    search.stop.assert_not_called()
+
+
+@patch("cli_chess.modules.engine.engine_model.engine_pool")
+def test_quit_engine(engine_pool: Mock, model: EngineModel):
+    engine = model.engine
+    search = Mock()
+    model.get_best_move()
+    model._search = search
+    model.quit_engine()
+    search.stop.assert_called_once()
+    engine.ping.assert_called_once()
+    engine_pool.release.assert_called_once_with(engine)
+    assert model.engine is None
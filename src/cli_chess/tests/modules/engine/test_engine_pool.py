@@ -0,0 +1,100 @@
+from cli_chess.modules.engine import EnginePool
+from unittest.mock import Mock, patch
+import pytest
+import time
+
+
+@pytest.fixture
+def popen_uci():
+    with patch("chess.engine.SimpleEngine.popen_uci", side_effect=lambda _: Mock()) as popen_uci:
+        yield popen_uci
+
+
+@pytest.fixture
+def pool(popen_uci):
+    pool = EnginePool(lambda: "fairy-stockfish", max_idle_engines=1, idle_timeout=60)
+    yield pool
+    pool.shutdown()
+
+
+def test_checkout(pool: EnginePool, popen_uci: Mock):
+    engine = pool.checkout({'Skill Level': 3})
+    popen_uci.assert_called_once_with("fairy-stockfish")
+    engine.configure.assert_called_once_with({'Skill Level': 3})
+    assert pool.stats.engines_started == 1
+
+    # Verify a released engine is reused and reconfigured
+    pool.release(engine)
+    reused_engine = pool.checkout({'Skill Level': 7})
+    assert reused_engine is engine
+    popen_uci.assert_called_once()
+    reused_engine.ping.assert_called_once()
+    reused_engine.configure.assert_called_with({'Skill Level': 7})
+    assert pool.stats.engines_reused == 1
+    assert pool.stats.startup_time_saved == pool.stats.average_startup_time
+
+    # Verify a new engine is started when no idle engines are available
+    assert pool.checkout({}) is not engine
+    assert pool.stats.engines_started == 2
+
+
+def test_checkout_discards_unresponsive_engine(pool: EnginePool, popen_uci: Mock):
+    engine = pool.checkout({})
+    engine.ping.side_effect = Exception("engine process died")
+    pool.release(engine)
+
+    assert pool.checkout({}) is not engine
+    engine.quit.assert_called_once()
+    assert pool.stats.engines_started == 2
+
+
+def test_release(pool: EnginePool):
+    engine_a = pool.checkout({})
+    engine_b = pool.checkout({})
+    pool.release(engine_a)
+    pool.release(engine_b)
+
+    # Verify engines over the max idle count are quit
+    engine_a.quit.assert_not_called()
+    engine_b.quit.assert_called_once()
+    pool.release(None)
+
+
+def test_evict_idle_engines(pool: EnginePool):
+    engine = pool.checkout({})
+    pool.release(engine)
+    pool.evict_idle_engines()
+    engine.quit.assert_not_called()
+
+    pool.idle_timeout = 0
+    pool.evict_idle_engines()
+    engine.quit.assert_called_once()
+    assert pool.stats.engines_evicted == 1
+    assert pool.checkout({}) is not engine
+
+
+def test_eviction_timer(pool: EnginePool):
+    pool.max_idle_engines = 2
+    pool.idle_timeout = 0.2
+    engine_a = pool.checkout({})
+    engine_b = pool.checkout({})
+
+    # Verify engines released at different times are both evicted by the timer
+    pool.release(engine_a)
+    time.sleep(0.1)
+    pool.release(engine_b)
+    deadline = time.monotonic() + 2
+    while pool.stats.engines_evicted < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    engine_a.quit.assert_called_once()
+    engine_b.quit.assert_called_once()
+    assert not pool._eviction_pending
+
+
+def test_shutdown(pool: EnginePool):
+    engine = pool.checkout({})
+    pool.release(engine)
+    pool.shutdown()
+    engine.quit.assert_called_once()
+    assert pool._eviction_timer is None
@@ -0,0 +1,50 @@
+from cli_chess.modules.engine.engine_time_manager import EngineTimeManager, fairy_stockfish_level_search_caps, DEFAULT_MOVE_TIME, MIN_MOVE_TIME
+from cli_chess.core.game.game_metadata import ClockMetadata
+from cli_chess.core.game.game_options import GameOption
+from time import monotonic
+import chess
+import pytest
+
+
+@pytest.mark.parametrize("level", fairy_stockfish_level_search_caps)
+def test_get_limit_without_clock(level: int):
+    limit = EngineTimeManager({GameOption.COMPUTER_SKILL_LEVEL: level}).get_limit(chess.Board())
+    assert limit.time == fairy_stockfish_level_search_caps[level].move_time
+    assert limit.depth == fairy_stockfish_level_search_caps[level].depth
+
+
+def test_get_limit_with_specified_elo():
+    time_manager = EngineTimeManager({GameOption.COMPUTER_SKILL_LEVEL: 1, GameOption.SPECIFY_ELO: True, GameOption.COMPUTER_ELO: 1500})
+    limit = time_manager.get_limit(chess.Board())
+    assert limit.time == DEFAULT_MOVE_TIME
+    assert limit.depth is None
+
+    # Verify the think time is budgeted from the clock
+    limit = time_manager.get_limit(chess.Board(), ClockMetadata(units="ms", time=60000, increment=0))
+    assert limit.time == pytest.approx(60 / 39 - 0.05)
+
+
+def test_get_limit_with_clock():
+    time_manager = EngineTimeManager({GameOption.COMPUTER_SKILL_LEVEL: 8})
+    board = chess.Board()
+
+    # Verify the level cap is honoured when there is plenty of time on the clock
+    assert time_manager.get_limit(board, ClockMetadata(units="ms", time=600000, increment=5000)).time == 1.0
+
+    # Verify the think time is reduced when low on time
+    low_time_limit = time_manager.get_limit(board, ClockMetadata(units="ms", time=5000, increment=0))
+    assert low_time_limit.time == pytest.approx(5 / 39 - 0.05)
+    assert low_time_limit.depth == 22
+    assert time_manager.get_limit(board, ClockMetadata(units="ms", time=0, increment=0)).time == MIN_MOVE_TIME
+
+    # Verify the increment is accounted for
+    assert time_manager.get_limit(board, ClockMetadata(units="ms", time=5000, increment=1000)).time == pytest.approx(5 / 39 + 0.8 - 0.05)
+
+
+def test_get_clock_time():
+    assert EngineTimeManager.get_clock_time(ClockMetadata()) is None
+    assert EngineTimeManager.get_clock_time(ClockMetadata(units="ms", time=90000, increment=2000)) == (90, 2)
+    assert EngineTimeManager.get_clock_time(ClockMetadata(units="sec", time=90, increment=None)) == (90, 0)
+
+    remaining, _ = EngineTimeManager.get_clock_time(ClockMetadata(units="sec", time=90, ticking=True, tick_started_at=monotonic() - 30))
+    assert remaining == pytest.approx(60, abs=1)
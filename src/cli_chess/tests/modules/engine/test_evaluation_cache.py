@@ -0,0 +1,95 @@
+from cli_chess.modules.engine.evaluation_cache import EvaluationCache, RECORD
+from chess.engine import PovScore, Cp, Mate
+from os import path, makedirs
+import chess.variant
+import pytest
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "cache" / "evaluation_cache.bin")
+
+
+@pytest.fixture
+def cache(filename):
+    return EvaluationCache(lambda: filename, max_entries=3)
+
+
+def test_get_and_put(cache: EvaluationCache):
+    board = chess.Board()
+    assert cache.get(board) is None
+
+    cache.put(board, 10, PovScore(Cp(30), chess.WHITE), chess.Move.from_uci("e2e4"))
+    assert cache.get(board).depth == 10
+    assert cache.get(board, min_depth=11) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert cache.stats.hit_rate == pytest.approx(1 / 3)
+
+    # Verify deeper evaluations are preferred
+    cache.put(board, 8, PovScore(Cp(50), chess.WHITE), chess.Move.from_uci("d2d4"))
+    assert cache.get(board).best_move == chess.Move.from_uci("e2e4")
+    cache.put(board, 12, PovScore(Cp(20), chess.WHITE), chess.Move.from_uci("c2c4"))
+    assert cache.get(board).best_move == chess.Move.from_uci("c2c4")
+
+    # Verify the same position in another variant is a different entry
+    assert cache.get(chess.variant.AtomicBoard()) is None
+    assert cache.get(chess.variant.CrazyhouseBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[] w KQkq - 0 1")) is None
+
+
+def test_keys():
+    # Verify crazyhouse pockets and remaining 3check checks are part of the key
+    crazyhouse_board = chess.variant.CrazyhouseBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[P] w KQkq - 0 1")
+    assert EvaluationCache.get_key(chess.variant.CrazyhouseBoard()) != EvaluationCache.get_key(crazyhouse_board)
+    three_check_board = chess.variant.ThreeCheckBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 2+3 0 1")
+    assert EvaluationCache.get_key(chess.variant.ThreeCheckBoard()) != EvaluationCache.get_key(three_check_board)
+    assert EvaluationCache.get_key(chess.Board())[0] == EvaluationCache.get_key(chess.variant.AtomicBoard())[0]
+    assert EvaluationCache.get_key(chess.Board())[1] != EvaluationCache.get_key(chess.variant.AtomicBoard())[1]
+
+
+def test_lru_eviction(cache: EvaluationCache):
+    boards = []
+    for fen in ["8/8/8/8/8/2k5/7q/K7 b - - 0 1", "8/8/8/8/8/2k5/7q/K7 w - - 0 1", "k7/8/8/8/8/8/8/K6Q w - - 0 1"]:
+        boards.append(chess.Board(fen))
+        cache.put(boards[-1], 5, PovScore(Cp(0), chess.WHITE))
+
+    # Verify the least recently used entry is evicted when the cache is full
+    cache.get(boards[0])
+    cache.put(chess.Board(), 5, PovScore(Cp(0), chess.WHITE))
+    assert len(cache) == 3
+    assert cache.get(boards[1]) is None
+    assert cache.get(boards[0]) is not None
+
+
+def test_save_and_load(cache: EvaluationCache, filename: str):
+    crazyhouse_board = chess.variant.CrazyhouseBoard("4k3/1P6/8/8/8/8/8/4K3[Q] w - - 0 1")
+    cache.put(chess.Board(), 20, PovScore(Cp(-15), chess.BLACK), chess.Move.from_uci("e2e4"))
+    cache.put(crazyhouse_board, 7, PovScore(Mate(2), chess.WHITE), chess.Move.from_uci("Q@e7"))
+    crazyhouse_board.push_uci("e1d1")
+    cache.put(crazyhouse_board, 300, PovScore(Mate(-3), chess.WHITE), chess.Move.from_uci("b7b8n"))
+    cache.save()
+    assert path.getsize(filename) == 3 * RECORD.size
+
+    # Verify a trailing partial record is ignored
+    with open(filename, "ab") as cache_file:
+        cache_file.write(b"\x00\x01")
+
+    loaded_cache = EvaluationCache(lambda: filename)
+    entry = loaded_cache.get(chess.Board())
+    assert (entry.depth, entry.score.white(), entry.best_move) == (20, Cp(15), chess.Move.from_uci("e2e4"))
+    entry = loaded_cache.get(crazyhouse_board)
+    assert (entry.depth, entry.score.white(), entry.best_move) == (255, Mate(-3), chess.Move.from_uci("b7b8n"))
+    crazyhouse_board.pop()
+    entry = loaded_cache.get(crazyhouse_board)
+    assert (entry.depth, entry.score.white(), entry.best_move) == (7, Mate(2), chess.Move.from_uci("Q@e7"))
+
+
+def test_load_missing_or_invalid_file(filename: str):
+    assert len(EvaluationCache(lambda: filename)) == 0
+
+    # Verify errors reading and writing the file are handled
+    makedirs(filename)
+    cache = EvaluationCache(lambda: filename)
+    cache.put(chess.Board(), 1, PovScore(Cp(0), chess.WHITE))
+    cache.save()
+    assert len(cache) == 1
@@ -0,0 +1,113 @@
+from cli_chess.modules.engine import EvaluationCache
+from cli_chess.modules.engine.game_analysis import (annotate_game, analyse_pgn_file, get_pgn_files, get_annotated_filename, get_position,
+                                                    is_analysed, run_pgn_analysis, _analyse_positions, _init_analysis_worker)
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from chess.engine import PovScore, Cp
+from unittest.mock import patch
+import chess.pgn
+import io
+import multiprocessing
+import pytest
+
+FOOLS_MATE_PGN = '[White "a"]\n[Black "b"]\n[Result "0-1"]\n\n1. f3 e5 2. g4 Qh4# 0-1\n'
+FOOLS_MATE_EVALS = {
+    chess.STARTING_FEN: (20, "e2e4"),
+    "rnbqkbnr/pppppppp/8/8/8/5P2/PPPPP1PP/RNBQKBNR b KQkq - 0 1": (-100, "e7e5"),
+    "rnbqkbnr/pppp1ppp/8/4p3/8/5P2/PPPPP1PP/RNBQKBNR w KQkq - 0 2": (-50, "e2e4"),
+    "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2": (-2000, "d8h4"),
+}
+
+
+def get_evaluations() -> dict:
+    return {("chess", False, fen): (PovScore(Cp(cp), chess.WHITE), chess.Move.from_uci(move)) for fen, (cp, move) in FOOLS_MATE_EVALS.items()}
+
+
+def mock_analyse_positions(positions, depth):
+    evaluations = get_evaluations()
+    return [evaluations[position] for position in positions]
+
+
+@pytest.fixture
+def evaluation_cache(tmp_path):
+    evaluation_cache = EvaluationCache(lambda: str(tmp_path / "cache.bin"))
+    with patch("cli_chess.modules.engine.game_analysis.evaluation_cache", evaluation_cache):
+        yield evaluation_cache
+
+
+@pytest.fixture
+def pgn_file(tmp_path):
+    pgn_file = tmp_path / "game.pgn"
+    pgn_file.write_text(FOOLS_MATE_PGN)
+    return str(pgn_file)
+
+
+def test_annotate_game():
+    game = chess.pgn.read_game(io.StringIO(FOOLS_MATE_PGN))
+    stats = annotate_game(game, get_evaluations(), 12)
+    moves = list(game.mainline())
+
+    # Verify mistakes and blunders are annotated with the best move, and mates are capped
+    assert moves[0].nags == {chess.pgn.NAG_MISTAKE}
+    assert moves[0].comment == "Mistake. e4 was best. [%eval -1.00,12]"
+    assert moves[1].nags == set()
+    assert moves[1].comment == "[%eval -0.50,12]"
+    assert moves[2].nags == {chess.pgn.NAG_BLUNDER}
+    assert moves[2].eval().white() == Cp(-2000)
+    assert moves[3].comment == ""
+    assert stats.centipawn_loss == {chess.WHITE: [120, 950], chess.BLACK: [50, 0]}
+    assert game.headers["WhiteACPL"] == "535"
+    assert game.headers["BlackACPL"] == "25"
+    assert game.headers["AnalysisDepth"] == "12"
+
+
+def test_get_pgn_files(tmp_path, pgn_file):
+    (tmp_path / "game.annotated.pgn").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    assert get_pgn_files(str(tmp_path)) == [pgn_file]
+    assert get_pgn_files(pgn_file) == [pgn_file]
+    assert get_annotated_filename(pgn_file) == str(tmp_path / "game.annotated.pgn")
+
+
+def test_analyse_pgn_file(pgn_file, evaluation_cache: EvaluationCache):
+    # Verify cached evaluations are not analysed again
+    start_board = chess.Board()
+    evaluation_cache.put(start_board, 20, PovScore(Cp(20), chess.WHITE), chess.Move.from_uci("e2e4"))
+    analysed_positions = []
+
+    def analyse_positions(positions, depth):
+        analysed_positions.extend(positions)
+        return mock_analyse_positions(positions, depth)
+
+    with patch("cli_chess.modules.engine.game_analysis._analyse_positions", analyse_positions), ThreadPoolExecutor() as executor:
+        assert not is_analysed(pgn_file, 12)
+        stats = analyse_pgn_file(pgn_file, executor, 12)
+
+    assert len(stats) == 1
+    assert get_position(start_board) not in analysed_positions
+    assert len(analysed_positions) == 3
+    assert evaluation_cache.get(chess.Board(list(FOOLS_MATE_EVALS)[1]), min_depth=12) is not None
+
+    # Verify files are only analysed again at a greater depth
+    assert is_analysed(pgn_file, 12)
+    assert not is_analysed(pgn_file, 14)
+    with open(get_annotated_filename(pgn_file)) as annotated_file:
+        assert chess.pgn.read_game(annotated_file).headers["BlackACPL"] == "25"
+
+
+def test_run_pgn_analysis(tmp_path, pgn_file, evaluation_cache: EvaluationCache, capsys):
+    (tmp_path / "invalid.pgn").write_text("1. e4 e5 2. Ke3 *")
+    with patch("cli_chess.modules.engine.game_analysis.ProcessPoolExecutor", ThreadPoolExecutor), \
+         patch("cli_chess.modules.engine.game_analysis._analyse_positions", mock_analyse_positions):
+        run_pgn_analysis(str(tmp_path), depth=12, workers=2)
+        assert "Analysed" in capsys.readouterr().out
+        run_pgn_analysis(str(tmp_path), depth=12, workers=2)
+
+    output = capsys.readouterr().out
+    assert "Skipping" in output
+    assert "Error analysing" in output
+    assert (tmp_path / "cache.bin").exists()
+
+
+def test_analyse_positions_spawned_worker():
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"), initializer=_init_analysis_worker) as executor:
+        assert executor.submit(_analyse_positions, [], 1).result(timeout=60) == []
@@ -0,0 +1,81 @@
+from cli_chess.modules.engine.opening_book import OpeningBook
+import chess.polyglot
+import struct
+import pytest
+
+
+def write_book(path, positions: dict) -> str:
+    """Writes a Polyglot book from a {fen: {uci_move: weight}} dictionary"""
+    entries = []
+    for fen, moves in positions.items():
+        key = chess.polyglot.zobrist_hash(chess.Board(fen))
+        for uci, weight in moves.items():
+            move = chess.Move.from_uci(uci)
+            raw_move = move.to_square | move.from_square << 6
+            entries.append(struct.pack(">QHHI", key, raw_move, weight, 0))
+
+    # Polyglot books must be sorted by key for the binary search
+    entries.sort(key=lambda entry: entry[:8])
+    with open(path, "wb") as book_file:
+        book_file.write(b"".join(entries))
+    return str(path)
+
+
+@pytest.fixture
+def book_path(tmp_path):
+    board = chess.Board()
+    board.push_uci("e2e4")
+    return write_book(tmp_path / "book.bin", {
+        chess.STARTING_FEN: {"e2e4": 100, "d2d4": 1, "a2a3": 0},
+        board.fen(): {"c7c5": 10},
+    })
+
+
+def test_get_move(book_path):
+    book = OpeningBook(lambda: book_path)
+    board = chess.Board()
+    assert book.get_move(board, 8) in [chess.Move.from_uci("e2e4"), chess.Move.from_uci("d2d4")]
+
+    board.push_uci("e2e4")
+    assert book.get_move(board, 8) == chess.Move.from_uci("c7c5")
+    assert book.stats.hits == 2
+
+    # Verify positions not in the book are counted as misses
+    board.push_uci("c7c5")
+    assert book.get_move(board, 8) is None
+    assert book.stats.misses == 1
+
+    # Verify other variants are not probed
+    assert book.get_move(chess.variant.AtomicBoard(), 8) is None
+    assert book.stats.misses == 1
+    book.close()
+
+
+def test_get_move_weighting(book_path):
+    book = OpeningBook(lambda: book_path)
+    board = chess.Board()
+
+    # Verify zero weight entries are never picked and that higher
+    # levels favour the higher weighted moves more strongly
+    level_1_moves = [book.get_move(board, 1).uci() for _ in range(200)]
+    level_8_moves = [book.get_move(board, 8).uci() for _ in range(200)]
+    assert "a2a3" not in level_1_moves + level_8_moves
+    assert level_1_moves.count("d2d4") > level_8_moves.count("d2d4")
+    assert level_8_moves.count("e2e4") > 190
+    book.close()
+
+
+def test_book_path(book_path, tmp_path):
+    path = ""
+    book = OpeningBook(lambda: path)
+
+    # Verify no book is used if the path is not set or is invalid
+    assert book.get_move(chess.Board()) is None
+    path = str(tmp_path / "missing.bin")
+    assert book.get_move(chess.Board()) is None
+    assert book.stats.misses == 0
+
+    # Verify the book is opened when the configured path changes
+    path = book_path
+    assert book.get_move(chess.Board()) is not None
+    book.close()
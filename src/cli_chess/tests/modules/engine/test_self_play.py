@@ -0,0 +1,102 @@
+from cli_chess.core.game.game_options import GameOption
+from cli_chess.modules.engine.self_play import (SelfPlayEngine, SelfPlayGame, SelfPlayScore, play_self_play_game, get_self_play_games,
+                                                estimate_elo_difference, run_self_play)
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from chess.engine import PlayResult
+from unittest.mock import patch
+import chess
+import multiprocessing
+import pytest
+
+LEVEL_1 = SelfPlayEngine(skill_level=1)
+ELO_1800 = SelfPlayEngine(elo=1800)
+
+
+class MockEngineModel:
+    """Plays the fools mate as white or black"""
+    moves = {chess.WHITE: ["f2f3", "g2g4"], chess.BLACK: ["e7e5", "d8h4"]}
+
+    def __init__(self, board_model, game_parameters, game_metadata=None, ponder=True):
+        self.board_model = board_model
+        self.game_parameters = game_parameters
+        self.ponder = ponder
+        self.started = False
+
+    def start_engine(self):
+        self.started = True
+
+    def get_best_move(self):
+        board = self.board_model.board
+        return PlayResult(chess.Move.from_uci(self.moves[board.turn][len(board.move_stack) // 2]), None)
+
+    def quit_engine(self):
+        self.started = False
+
+
+@pytest.fixture(autouse=True)
+def engine_model():
+    with patch("cli_chess.modules.engine.self_play.EngineModel", MockEngineModel), patch("cli_chess.modules.engine.self_play.engine_pool"):
+        yield
+
+
+def test_self_play_engine():
+    assert SelfPlayEngine.from_string("level:3") == SelfPlayEngine(skill_level=3)
+    assert SelfPlayEngine.from_string("ELO:1800") == ELO_1800
+    for value in ["level:9", "level:", "elo:-5", "1800", "depth:5"]:
+        with pytest.raises(ValueError):
+            SelfPlayEngine.from_string(value)
+
+    assert LEVEL_1.name == "Fairy-Stockfish Lvl 1"
+    assert ELO_1800.name == "Fairy-Stockfish Elo 1800"
+    assert LEVEL_1.get_game_parameters("atomic") == {GameOption.VARIANT: "atomic", GameOption.COMPUTER_SKILL_LEVEL: 1}
+    assert ELO_1800.get_game_parameters("standard")[GameOption.COMPUTER_ELO] == 1800
+
+
+def test_play_self_play_game():
+    result = play_self_play_game(SelfPlayGame(LEVEL_1, ELO_1800))
+    assert result.winner == chess.BLACK
+    assert '[White "Fairy-Stockfish Lvl 1"]' in result.pgn
+    assert '[Black "Fairy-Stockfish Elo 1800"]' in result.pgn
+    assert '[BlackElo "1800"]' in result.pgn
+    assert "1. f3 e5 2. g4 Qh4# 0-1" in result.pgn
+
+
+def test_get_self_play_games():
+    games = get_self_play_games(LEVEL_1, ELO_1800, 3)
+    assert [(game.white, game.black, game.engine_a_color) for game in games] == [(LEVEL_1, ELO_1800, chess.WHITE),
+                                                                                 (ELO_1800, LEVEL_1, chess.BLACK),
+                                                                                 (LEVEL_1, ELO_1800, chess.WHITE)]
+
+    # Verify each pair of chess960 games is played from the same position
+    games = get_self_play_games(LEVEL_1, ELO_1800, 4, variant="chess960")
+    assert games[0].fen == games[1].fen and games[2].fen == games[3].fen
+    assert all(chess.Board(game.fen, chess960=True).is_valid() for game in games)
+
+
+def test_estimate_elo_difference():
+    assert estimate_elo_difference(SelfPlayScore()) == (0.0, 0.0)
+    assert estimate_elo_difference(SelfPlayScore(wins=5, draws=10, losses=5))[0] == pytest.approx(0.0)
+
+    elo_difference, margin = estimate_elo_difference(SelfPlayScore(wins=60, draws=30, losses=10))
+    assert elo_difference == pytest.approx(190.85, abs=0.01)
+    assert 0 < margin < elo_difference
+    assert estimate_elo_difference(SelfPlayScore(wins=10))[0] > 1000
+
+
+def test_run_self_play(tmp_path, capsys):
+    output_path = tmp_path / "self-play.pgn"
+    with patch("cli_chess.modules.engine.self_play.ProcessPoolExecutor", ThreadPoolExecutor):
+        score = run_self_play(LEVEL_1, ELO_1800, 4, output_path=str(output_path), workers=2)
+
+    # Black wins each game, so each engine wins the games played as black
+    assert (score.wins, score.draws, score.losses) == (2, 0, 2)
+    assert output_path.read_text().count("[Event") == 4
+    assert "Fairy-Stockfish Lvl 1" in capsys.readouterr().out
+
+
+def test_play_self_play_game_spawned_worker():
+    # The patches above don't apply in a spawned process. The game is already over, so no engine moves are made
+    fen = "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3"
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        result = executor.submit(play_self_play_game, SelfPlayGame(LEVEL_1, ELO_1800, fen=fen)).result(timeout=60)
+    assert result.winner is False
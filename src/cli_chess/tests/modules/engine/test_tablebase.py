@@ -0,0 +1,116 @@
+from cli_chess.modules.engine.tablebase import SyzygyTablebase
+from unittest.mock import Mock, patch
+import chess.syzygy
+import chess.variant
+import pytest
+
+
+class MockTablebase:
+    """Tablebase for king and queen versus king (and pawn). The side with
+       the queen wins, and a smaller distance to zeroing is given the
+       fewer moves the losing side has
+    """
+    def __init__(self):
+        self.wdl = {"KQvKP": None, "KQvK": None, "KvK": None}
+        self.closed = False
+
+    def probe_wdl(self, board: chess.Board) -> int:
+        if chess.popcount(board.occupied) > 4 or board.rooks or board.castling_rights:
+            raise chess.syzygy.MissingTableError()
+        if board.is_stalemate() or not board.queens:
+            return 0
+        return 2 if board.queens & board.occupied_co[board.turn] else -2
+
+    def probe_dtz(self, board: chess.Board) -> int:
+        wdl = self.probe_wdl(board)
+        return 0 if wdl == 0 else wdl // 2 * board.legal_moves.count()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def mock_tablebase():
+    mock_tablebase = MockTablebase()
+    with patch("chess.syzygy.open_tablebase", return_value=mock_tablebase) as open_tablebase:
+        mock_tablebase.open_tablebase = open_tablebase
+        yield mock_tablebase
+
+
+@pytest.fixture
+def tablebase(mock_tablebase: MockTablebase):
+    tablebase = SyzygyTablebase(lambda: "/syzygy")
+    yield tablebase
+    tablebase.close()
+
+
+def test_probe_wdl(tablebase: SyzygyTablebase, mock_tablebase: MockTablebase):
+    assert tablebase.probe_wdl(chess.Board("8/8/8/8/8/2k5/7q/K7 b - - 0 1")) == 2
+    assert tablebase.probe_wdl(chess.Board("8/8/8/8/8/2k5/7q/K7 w - - 0 1")) == -2
+
+    # Verify positions with too many pieces, castling rights, or variants are not probed
+    assert tablebase.probe_wdl(chess.Board()) is None
+    assert tablebase.probe_wdl(chess.Board("4k3/8/8/8/8/8/8/R3K3 w Q - 0 1")) is None
+    assert tablebase.probe_wdl(chess.variant.AtomicBoard("8/8/8/8/8/2k5/7q/K7 b - - 0 1")) is None
+    assert tablebase.probe_wdl(chess.variant.AntichessBoard("8/8/8/8/8/2k5/7q/K7 b - - 0 1")) is None
+
+    # Verify the tablebase is opened lazily, only once
+    mock_tablebase.open_tablebase.assert_called_once_with("/syzygy")
+
+
+def test_get_best_move(tablebase: SyzygyTablebase):
+    # Verify mates are preferred
+    board = chess.Board("8/8/8/8/8/2k5/7q/K7 b - - 0 1")
+    assert tablebase.get_best_move(board) == (chess.Move.from_uci("h2b2"), 2)
+    assert board.fen() == "8/8/8/8/8/2k5/7q/K7 b - - 0 1"
+
+    assert tablebase.get_best_move(chess.Board("k7/8/1K6/8/8/8/8/2Q5 w - - 0 1")) == (chess.Move.from_uci("c1c8"), 2)
+
+    # Verify the winning move with the smallest distance to zeroing is preferred over stalemating
+    board = chess.Board("k7/8/8/8/8/8/8/K6Q w - - 0 1")
+    move, wdl = tablebase.get_best_move(board)
+    board.push(move)
+    assert wdl == 2
+    assert board.legal_moves.count() == 1
+
+    # Verify mate is preferred over a winning capture (which resets the distance to zeroing)
+    assert tablebase.get_best_move(chess.Board("8/8/8/8/1p6/k7/8/KQ6 w - - 0 1")) == (chess.Move.from_uci("b1a2"), 2)
+
+    # Verify the losing side captures the queen if able to
+    assert tablebase.get_best_move(chess.Board("k7/1Q6/8/8/8/8/8/7K b - - 0 1"))[0] == chess.Move.from_uci("a8b7")
+
+    # Verify a missing table returns None
+    assert tablebase.get_best_move(chess.Board("k7/1Q6/8/8/8/8/8/6RK b - - 0 1")) is None
+
+
+def test_get_move_rank_cursed_win():
+    # A win prevented by the fifty-move rule is ranked as a draw
+    board = chess.Board("k7/8/8/8/8/8/8/K6Q w - - 0 1")
+    mock_tablebase = Mock()
+    mock_tablebase.probe_wdl.return_value = -1
+    assert SyzygyTablebase._get_move_rank(mock_tablebase, board, chess.Move.from_uci("h1h2")) == (1, 0)
+
+    mock_tablebase.probe_wdl.return_value = 0
+    assert SyzygyTablebase._get_move_rank(mock_tablebase, board, chess.Move.from_uci("h1h2")) == (1, 0)
+
+
+def test_tablebase_directory(mock_tablebase: MockTablebase):
+    directory = ""
+    tablebase = SyzygyTablebase(lambda: directory)
+    board = chess.Board("8/8/8/8/8/2k5/7q/K7 b - - 0 1")
+    assert tablebase.probe_wdl(board) is None
+    mock_tablebase.open_tablebase.assert_not_called()
+
+    # Verify errors opening the tablebase are handled
+    directory = "/missing"
+    mock_tablebase.open_tablebase.side_effect = FileNotFoundError()
+    assert tablebase.probe_wdl(board) is None
+    assert tablebase.probe_wdl(board) is None
+    mock_tablebase.open_tablebase.assert_called_once()
+
+    # Verify the tablebase is reopened when the directory changes
+    directory = "/syzygy"
+    mock_tablebase.open_tablebase.side_effect = None
+    assert tablebase.probe_wdl(board) == 2
+    tablebase.close()
+    assert mock_tablebase.closed
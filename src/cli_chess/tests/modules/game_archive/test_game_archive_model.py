@@ -0,0 +1,89 @@
+from cli_chess.modules.game_archive import GameArchiveModel
+from unittest.mock import Mock
+import os
+import pytest
+
+ONLINE_GAME = ('[Event "cli-chess online"]\n[Site "lichess.org/AbCd1234"]\n[Date "2024.03.01"]\n[White "alice"]\n[Black "bob"]\n'
+               '[Result "1-0"]\n[WhiteElo "1850"]\n[TimeControl "300+3"]\n\n1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0\n\n')
+OFFLINE_GAME = ('[Event "cli-chess offline"]\n[Date "2024.02.01"]\n[White "alice"]\n[Black "Fairy-Stockfish Lvl 3"]\n'
+                '[Result "0-1"]\n[Variant "Atomic"]\n\n1. e4 e5 0-1\n\n')
+SELF_PLAY_GAMES = '[Event "self-play"]\n[Date "2024.01.01"]\n[Result "*"]\n\n*\n\n[Event "self-play"]\n[Date "2024.01.02"]\n\n1. d4 *\n'
+
+
+@pytest.fixture
+def model_listener():
+    return Mock()
+
+
+@pytest.fixture
+def model(tmp_path, model_listener: Mock):
+    model = GameArchiveModel(lambda: str(tmp_path / "games"), lambda: str(tmp_path / "config" / "game_archive.db"))
+    model.e_game_archive_model_updated.add_listener(model_listener)
+    return model
+
+
+@pytest.fixture
+def games_dir(tmp_path):
+    games_dir = tmp_path / "games"
+    games_dir.mkdir()
+    (games_dir / "online.pgn").write_text(ONLINE_GAME)
+    (games_dir / "offline.pgn").write_text(OFFLINE_GAME)
+    (games_dir / "self-play.pgn").write_text(SELF_PLAY_GAMES)
+    (games_dir / "online.annotated.pgn").write_text(ONLINE_GAME)
+    return games_dir
+
+
+def test_update_index(model: GameArchiveModel, games_dir, model_listener: Mock):
+    assert model.update_index() == 3
+    model_listener.assert_called()
+    assert model.count() == 4
+
+    # Verify games are listed newest first with their indexed headers
+    games = model.search()
+    assert [game.date for game in games] == ["2024.03.01", "2024.02.01", "2024.01.02", "2024.01.01"]
+    assert (games[0].white, games[0].white_elo, games[0].black_elo, games[0].game_id) == ("alice", "1850", "", "AbCd1234")
+    assert (games[0].time_control, games[1].variant, games[2].white) == ("300+3", "Atomic", "?")
+
+    # Verify only modified, new and deleted files are indexed again
+    assert model.update_index() == 0
+    (games_dir / "offline.pgn").write_text(OFFLINE_GAME + OFFLINE_GAME)
+    (games_dir / "new.pgn").write_text(ONLINE_GAME)
+    os.remove(games_dir / "self-play.pgn")
+    assert model.update_index() == 2
+    assert model.count() == 4
+    assert model.update_index(rebuild=True) == 3
+
+
+def test_add_file(model: GameArchiveModel, games_dir, model_listener: Mock):
+    model.add_file(str(games_dir / "online.pgn"))
+    model_listener.assert_called_once()
+    assert [game.game_id for game in model.search()] == ["AbCd1234"]
+
+    # Verify files added on save are not indexed again
+    assert model.update_index() == 2
+
+
+def test_search(model: GameArchiveModel, games_dir):
+    model.update_index()
+    assert [game.black for game in model.search("ALICE stockfish")] == ["Fairy-Stockfish Lvl 3"]
+    assert [game.white for game in model.search("abcd1234")] == ["alice"]
+    assert model.count("self-play") == 2
+    assert model.count("alice 2024.03") == 1
+    assert model.search("100%") == []
+    assert len(model.search(limit=1)) == 1
+
+
+def test_read_game(model: GameArchiveModel, games_dir):
+    model.update_index()
+    game = model.read_game(model.search("2024.01.02")[0])
+    assert game.headers["Date"] == "2024.01.02"
+    assert [move.uci() for move in game.mainline_moves()] == ["d2d4"]
+
+
+def test_invalid_index(tmp_path, games_dir):
+    # Verify errors opening the index are handled
+    (tmp_path / "index").mkdir()
+    model = GameArchiveModel(lambda: str(games_dir), lambda: str(tmp_path / "index"))
+    assert model.update_index() == 0
+    assert model.search() == []
+    assert model.count() == 0
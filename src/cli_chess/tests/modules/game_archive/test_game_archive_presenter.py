@@ -0,0 +1,80 @@
+from cli_chess.modules.game_archive import GameArchiveModel, GameArchivePresenter, ArchivedGame
+from unittest.mock import Mock
+import pytest
+
+
+@pytest.fixture
+def model():
+    model = Mock(spec=GameArchiveModel)
+    model.e_game_archive_model_updated = Mock()
+    model.search.return_value = [ArchivedGame("game.pgn", 0, "alice", "bob", "1850", "", "2024.03.01", "1-0", "Standard", "300+3")]
+    model.count.return_value = 1
+    return model
+
+
+@pytest.fixture
+def presenter(model: Mock):
+    return GameArchivePresenter(model)
+
+
+def test_init(model: Mock, presenter: GameArchivePresenter):
+    model.e_game_archive_model_updated.add_listener.assert_called_once_with(presenter.update)
+    model.update_index_async.assert_called_once()
+
+
+def test_filter_games(model: Mock, presenter: GameArchivePresenter):
+    presenter.filter_games("alice")
+    model.search.assert_called_with("alice")
+    model.count.assert_called_with("alice")
+    assert presenter.view.game_rows == [presenter.format_game(model.search.return_value[0])]
+    assert presenter.view.summary == "1 game"
+
+    model.count.return_value = 500
+    presenter.filter_games("")
+    assert presenter.view.summary == "Showing 1 of 500 games"
+
+
+def test_format_game(presenter: GameArchivePresenter):
+    row = presenter.format_game(ArchivedGame("game.pgn", 0, "alice", "a-very-long-player-name", "1850", "", "2024.03.01", "1-0", "Standard", "300+3"))
+    assert row.startswith("2024.03.01 alice (1850)")
+    assert "a-very-long-player-" in row and "a-very-long-player-name" not in row
+    assert row.endswith("1-0      Standard     300+3  ")
+
+
+def test_rebuild_index(model: Mock, presenter: GameArchivePresenter):
+    presenter.rebuild_index()
+    model.update_index_async.assert_called_with(rebuild=True)
+
+
+def test_select(model: Mock, presenter: GameArchivePresenter):
+    model.search.return_value = model.search.return_value * 3
+    presenter.filter_games("")
+    presenter.select(1)
+    presenter.select(5)
+    assert presenter.selected_index == 2
+    presenter.select(-10)
+    assert presenter.selected_index == 0
+
+    # Verify the selection is reset when filtering
+    presenter.select(1)
+    presenter.filter_games("alice")
+    assert presenter.selected_index == 0
+
+
+def test_review_selected_game(model: Mock, presenter: GameArchivePresenter, monkeypatch):
+    from cli_chess.core.game import game_review
+    start_game_review = Mock()
+    monkeypatch.setattr(game_review, "start_game_review", start_game_review)
+    presenter.review_selected_game()
+    start_game_review.assert_not_called()
+
+    presenter.update()
+    presenter.review_selected_game()
+    model.read_game.assert_called_once_with(model.search.return_value[0])
+    start_game_review.assert_called_once_with(model.read_game.return_value)
+
+    # Verify unreadable games refresh the index instead of starting a review
+    model.read_game.side_effect = OSError("No such file")
+    presenter.review_selected_game()
+    assert start_game_review.call_count == 1
+    model.update_index_async.assert_called_with()
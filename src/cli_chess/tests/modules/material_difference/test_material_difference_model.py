@@ -1,8 +1,10 @@
 from cli_chess.modules.material_difference.material_difference_model import MaterialDifferenceModel, PIECE_VALUE
 from cli_chess.modules.board import BoardModel
-from chess import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+from chess import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, PIECE_SYMBOLS
 from unittest.mock import Mock
 import pytest
+import timeit
+import re
 
 
 @pytest.fixture
@@ -34,12 +36,18 @@ def test_default_score(model: MaterialDifferenceModel):
     assert model.score == existing_score  # Ensure score wasn't changed
 
 
-def test_generate_pieces_fen(model: MaterialDifferenceModel):
-    assert model.generate_pieces_fen(model.board_model.board.board_fen()) == "rkPKRR"
+def test_get_material_counts(model: MaterialDifferenceModel):
+    assert model._get_material_counts("standard") == ((1, 0, 0, 2, 0, 1), (0, 0, 0, 1, 0, 1))
     model.board_model.set_fen("8/3P1k2/3K4/8/8/8/8/8 w - - 0 1")
-    assert model.generate_pieces_fen(model.board_model.board.board_fen()) == "PkK"
+    assert model._get_material_counts("standard") == ((1, 0, 0, 0, 0, 1), (0, 0, 0, 0, 0, 1))
     model.board_model.make_move("d8=Q")
-    assert model.generate_pieces_fen(model.board_model.board.board_fen()) == "QkK"
+    assert model._get_material_counts("standard") == ((0, 0, 0, 0, 1, 1), (0, 0, 0, 0, 0, 1))
+
+    # Test crazyhouse pocket counts and 3check remaining checks
+    model = MaterialDifferenceModel(BoardModel(fen="4k3/8/8/8/8/8/8/4K3[QPpp] w - - 0 1", variant="crazyhouse"))
+    assert model._get_material_counts("crazyhouse") == ((1, 0, 0, 0, 1, 0), (2, 0, 0, 0, 0, 0))
+    model = MaterialDifferenceModel(BoardModel(fen="4k3/8/8/8/8/8/8/4K3 w - - 2+3 0 1", variant="3check"))
+    assert model._get_material_counts("3check")[2] == (3, 2)
 
 
 def test_reset_all(model: MaterialDifferenceModel):
@@ -57,12 +65,22 @@ def test_update(model: MaterialDifferenceModel, model_listener: Mock):
     }
     assert model.score == {WHITE: 6, BLACK: 0}
 
-    # Verify listener was called on material difference model update
+    # Verify listener is only called on material difference model updates that change material
     model.update()
-    model_listener.assert_called()
+    model_listener.assert_not_called()
+    model.board_model.make_moves_from_list(["Kf5", "Kd4", "Rh4+", "Kd5"])
+    model_listener.assert_not_called()
+    model.board_model.make_move("Rxc4")
+    model_listener.assert_called_once()
+
+    # Verify listener is called on board orientation changes
+    model_listener.reset_mock()
+    model.board_model.set_board_orientation(BLACK)
+    model_listener.assert_called_once()
 
     # Verify material difference update method is listening to general board_model update events
     assert model.update in model.board_model.e_board_model_updated.listeners
+    model_listener.reset_mock()
     model.board_model.set_fen("2q5/8/3q4/2Bk4/1P3Pb1/4K3/8/8 w - - 0 1")
     assert model.material_difference == {
         WHITE: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 2},
@@ -91,24 +109,35 @@ def test_update(model: MaterialDifferenceModel, model_listener: Mock):
     }
 
 
-def test_update_material_difference(model: MaterialDifferenceModel):
+def test_update_from_material_counts(model: MaterialDifferenceModel):
+    model._update_from_material_counts("standard", ((1, 0, 1, 0, 0, 1), (3, 1, 0, 1, 1, 1)))
     assert model.material_difference == {
-        WHITE: {KING: 0, QUEEN: 0, ROOK: 1, BISHOP: 0, KNIGHT: 0, PAWN: 1},
-        BLACK: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 0}
+        WHITE: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 1, KNIGHT: 0, PAWN: 0},
+        BLACK: {KING: 0, QUEEN: 1, ROOK: 1, BISHOP: 0, KNIGHT: 1, PAWN: 2}
     }
+    assert model.score == {WHITE: 0, BLACK: 16}
 
-    model._update_material_difference(BLACK, ROOK)
-    model._update_material_difference(WHITE, QUEEN)
-    model._update_material_difference(BLACK, PAWN)
-
+    model._update_from_material_counts("standard", ((0, 0, 0, 0, 1, 1), (2, 0, 0, 0, 0, 1)))
     assert model.material_difference == {
         WHITE: {KING: 0, QUEEN: 1, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 0},
-        BLACK: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 0}
+        BLACK: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 2}
     }
+    assert model.score == {WHITE: 7, BLACK: 0}
+
+    # Test equal material
+    model._update_from_material_counts("standard", ((0, 1, 0, 0, 0, 1), (0, 0, 1, 0, 0, 1)))
+    assert model.score == model.default_score()
 
+    # Test crazyhouse pockets are shown as is
+    model._update_from_material_counts("crazyhouse", ((1, 0, 0, 0, 1, 0), (2, 0, 0, 0, 0, 0)))
+    assert model.material_difference == {
+        WHITE: {KING: 0, QUEEN: 1, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 1},
+        BLACK: {KING: 0, QUEEN: 0, ROOK: 0, BISHOP: 0, KNIGHT: 0, PAWN: 2}
+    }
+    assert model.score == model.default_score()
 
-def test_update_score(model: MaterialDifferenceModel):
-    # Verify piece values are correct
+
+def test_piece_values():
     assert PIECE_VALUE == {
         KING: 0,
         QUEEN: 9,
@@ -118,15 +147,6 @@ def test_update_score(model: MaterialDifferenceModel):
         PAWN: 1,
     }
 
-    # Verify score updates correctly
-    assert model.score == {WHITE: 6, BLACK: 0}
-    model._update_score(BLACK, QUEEN)
-    assert model.get_score(BLACK) == 3
-    assert model.score == {WHITE: 0, BLACK: 3}
-    model._update_score(WHITE, KNIGHT)
-    assert model.get_score(WHITE) == 0
-    assert model.score == {WHITE: 0, BLACK: 0}
-
 
 def test_get_material_difference(model: MaterialDifferenceModel):
     assert model.get_material_difference(WHITE) == {KING: 0, QUEEN: 0, ROOK: 1, BISHOP: 0, KNIGHT: 0, PAWN: 1}
@@ -153,3 +173,50 @@ def test_notify_material_difference_model_updated(model: MaterialDifferenceModel
     model.e_material_difference_model_updated.remove_listener(model_listener)
     model._notify_material_difference_model_updated()
     model_listener.assert_not_called()
+
+
+def fen_parsing_update(board_model: BoardModel) -> tuple:
+    """The previous implementation of the update, which parsed the board FEN"""
+    difference = MaterialDifferenceModel.default_material_difference()
+    score = MaterialDifferenceModel.default_score()
+    for piece in re.compile('[^a-zA-Z]').sub('', board_model.board.board_fen()):
+        color = WHITE if piece.isupper() else BLACK
+        piece_type = PIECE_SYMBOLS.index(piece.lower())
+        if difference[not color][piece_type] > 0:
+            difference[not color][piece_type] -= 1
+        else:
+            difference[color][piece_type] += 1
+        score[color] += PIECE_VALUE[piece_type]
+        advantage_color = WHITE if score[WHITE] > score[BLACK] else BLACK
+        score[advantage_color] = abs(score[WHITE] - score[BLACK])
+        score[not advantage_color] = 0
+    return difference, score
+
+
+def get_benchmark_board_model() -> BoardModel:
+    board_model = BoardModel()
+    board_model.make_moves_from_list(["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O", "Be7", "Re1", "b5",
+                                      "Bb3", "d6", "c3", "O-O", "h3", "Nb8", "d4", "Nbd7", "c4", "c6", "cxb5", "axb5",
+                                      "Nc3", "Bb7", "Bg5", "b4", "Nb1", "h6", "Bh4", "c5", "dxe5", "Nxe4", "Bxe7", "Qxe7"])
+    return board_model
+
+
+@pytest.mark.parametrize("fen", [None, "7r/8/4k3/8/2P5/2K5/8/3RR3 b - - 0 1", "3Q4/q7/5k2/8/8/8/8/2K1Q3 b - - 0 1",
+                                 "rnbqkbnr/pppppppp/8/8/8/8/8/4K3 w kq - 0 1"])
+def test_update_matches_fen_parsing(fen):
+    board_model = BoardModel(fen=fen) if fen else get_benchmark_board_model()
+    model = MaterialDifferenceModel(board_model)
+    assert (model.material_difference, model.score) == fen_parsing_update(board_model)
+
+
+@pytest.mark.benchmark
+def test_update_benchmark():
+    """Micro-benchmark comparing board updates against the previous
+       implementation which parsed the board FEN. Run with `pytest -m benchmark`
+    """
+    board_model = get_benchmark_board_model()
+    model = MaterialDifferenceModel(board_model)
+
+    fen_parsing_time = min(timeit.repeat(lambda: fen_parsing_update(board_model), number=1000, repeat=5))
+    update_time = min(timeit.repeat(model.update, number=1000, repeat=5))
+    assert fen_parsing_time / update_time >= 10
@@ -1,6 +1,6 @@
 from cli_chess.modules.move_list import MoveListModel
 from cli_chess.modules.board import BoardModel
-from chess import WHITE, BLACK, PIECE_SYMBOLS, KING, QUEEN, BISHOP, PAWN
+from chess import WHITE, BLACK, PIECE_SYMBOLS, KING, QUEEN, BISHOP, PAWN, Move
 from unittest.mock import Mock
 import pytest
 
@@ -92,6 +92,46 @@ def test_update(model: MoveListModel, model_listener: Mock):
     model_listener.assert_called()
 
 
+def test_update_is_incremental(model: MoveListModel, model_listener: Mock):
+    model.board_model.make_moves_from_list(["e4", "e5", "Nf3", "Nc6"])
+    cached_entries = list(model.move_list_data)
+    assert [entry['move'] for entry in cached_entries] == ["e4", "e5", "Nf3", "Nc6"]
+
+    # Test new plies are appended without regenerating the cached plies
+    model.board_model.make_move("Bb5")
+    assert model.move_list_data[:4] == cached_entries
+    assert all(a is b for a, b in zip(model.move_list_data, cached_entries))
+    assert model.move_list_data[-1]['move'] == "Bb5"
+
+    # Test takebacks truncate the move list
+    model.board_model.takeback(WHITE)
+    assert [entry['move'] for entry in model.move_list_data] == ["e4", "e5", "Nf3", "Nc6"]
+    model.board_model.make_move("Bc4")
+    assert model.move_list_data[-1]['move'] == "Bc4"
+
+    # Test updates which don't change the move stack don't notify listeners
+    model_listener.reset_mock()
+    model.board_model.set_premove_highlight(Move.from_uci("g8f6"))
+    model.board_model.set_board_orientation(BLACK)
+    model_listener.assert_not_called()
+
+    # Test the move list is rebuilt after setting the FEN
+    model.board_model.set_fen("2bqkbnr/P2ppppp/8/8/8/8/1PPPPPPP/RNBQK2R w KQk - 0 1")
+    assert model.move_list_data == []
+    model.board_model.make_move("O-O")
+    assert [entry['move'] for entry in model.move_list_data] == ["O-O"]
+
+    # Test the move list is rebuilt after reinitializing the board
+    model.board_model.reinitialize_board("crazyhouse", WHITE)
+    assert model.move_list_data == []
+    model.board_model.make_moves_from_list(["e4", "d5", "exd5", "Qxd5"])
+    assert [entry['move'] for entry in model.move_list_data] == ["e4", "d5", "exd5", "Qxd5"]
+
+    # Test a full resync of a different move order
+    model.board_model.sync_moves_from_uci_list(["d2d4", "d7d5"])
+    assert [entry['move'] for entry in model.move_list_data] == ["d4", "d5"]
+
+
 def test_get_move_list_data(model: MoveListModel):
     assert len(model.get_move_list_data()) == 0
     model.board_model.set_fen("1n6/NpP5/1P1PP1b1/k2pR3/2pK4/6r1/1p3P2/8 b - - 0 1")
@@ -0,0 +1,70 @@
+from cli_chess.modules.opening_explorer import OpeningExplorerIndex
+from cli_chess.modules.opening_explorer.opening_explorer_builder import count_pgn, get_chunks, get_explorer_pgn_files, build_opening_explorer
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import chess
+import io
+import pytest
+
+GAMES = ('[Event "a"]\n[Result "1-0"]\n\n1. e4 (1. d4 d5) e5 {comment} 2. Nf3 1-0\n\n'
+         '[Event "b"]\n[Result "0-1"]\n\n1. e4 c5 0-1\n\n'
+         '[Event "c"]\n[Result "*"]\n\n1. e4 e5 *\n\n'
+         '[Event "d"]\n[Variant "Atomic"]\n[Result "1-0"]\n\n1. e4 e5 1-0\n\n'
+         '[Event "e"]\n[Result "1/2-1/2"]\n\n1. e4 e5 2. Ke3 Nc6 1/2-1/2\n\n')
+
+
+@pytest.fixture(autouse=True)
+def pgn_save_dir(tmp_path):
+    saved_games = tmp_path / "games"
+    saved_games.mkdir()
+    (saved_games / "saved.pgn").write_text(GAMES)
+    (saved_games / "saved.annotated.pgn").write_text(GAMES)
+    with patch("cli_chess.modules.opening_explorer.opening_explorer_builder.get_pgn_save_dir", lambda: str(saved_games)):
+        yield saved_games
+
+
+def test_count_pgn():
+    counts = Counter()
+    assert count_pgn(io.StringIO(GAMES), counts) == 3
+
+    # Verify unfinished and variant games, variations and moves after an illegal move are skipped
+    assert sum(counts.values()) == 7
+    assert counts[(chess.polyglot.zobrist_hash(chess.Board()), chess.Move.from_uci("e2e4").to_square | 12 << 6, 0)] == 1
+
+
+def test_count_pgn_max_plies():
+    counts = Counter()
+    with patch("cli_chess.modules.opening_explorer.opening_explorer_builder.MAX_EXPLORER_PLIES", 1):
+        count_pgn(io.StringIO(GAMES), counts)
+    assert sum(counts.values()) == 3
+
+
+def test_get_chunks(tmp_path):
+    pgn_file = tmp_path / "games.pgn"
+    pgn_file.write_text(GAMES)
+    chunks = get_chunks(str(pgn_file), chunk_size=40)
+    assert chunks[0][1] == 0 and chunks[-1][2] == len(GAMES)
+    assert all(GAMES[start:].startswith("[Event ") for _, start, _ in chunks)
+    assert sum(count_pgn(io.StringIO(GAMES[start:end]), Counter()) for _, start, end in chunks) == 3
+
+
+def test_get_explorer_pgn_files(tmp_path, pgn_save_dir, capsys):
+    pgn_file = tmp_path / "database.pgn"
+    pgn_file.write_text(GAMES)
+    assert get_explorer_pgn_files([str(pgn_file), str(pgn_save_dir), "missing.pgn"]) == [str(pgn_save_dir / "saved.pgn"), str(pgn_file)]
+    assert "Skipping missing.pgn" in capsys.readouterr().out
+
+
+def test_build_opening_explorer(tmp_path, capsys):
+    pgn_file = tmp_path / "database.pgn"
+    pgn_file.write_text(GAMES * 20)
+    index = OpeningExplorerIndex(lambda: str(tmp_path / "opening_explorer.bin"))
+
+    with patch("cli_chess.modules.opening_explorer.opening_explorer_builder.ProcessPoolExecutor", ThreadPoolExecutor), \
+         patch("cli_chess.modules.opening_explorer.opening_explorer_builder.CHUNK_SIZE", 100):
+        assert build_opening_explorer(index, [str(pgn_file)], workers=2) == 63
+
+    assert [(m.move.uci(), m.games) for m in index.get_moves(chess.Board())] == [("e2e4", 63)]
+    assert len(OpeningExplorerIndex(lambda: str(tmp_path / "opening_explorer.bin"))) == len(index)
+    assert "Indexed 63 games" in capsys.readouterr().out
@@ -0,0 +1,73 @@
+from cli_chess.modules.opening_explorer import OpeningExplorerIndex
+from cli_chess.modules.opening_explorer.opening_explorer_index import encode_move, decode_move
+from collections import Counter
+import chess.polyglot
+import chess.variant
+import pytest
+
+WHITE_WINS, DRAW, BLACK_WINS = range(3)
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "explorer" / "opening_explorer.bin")
+
+
+def get_counts(*games) -> Counter:
+    counts = Counter()
+    for moves, result in games:
+        board = chess.Board()
+        for uci in moves:
+            move = chess.Move.from_uci(uci)
+            counts[(chess.polyglot.zobrist_hash(board), encode_move(move), result)] += 1
+            board.push(move)
+    return counts
+
+
+def test_encode_move():
+    for uci in ["e2e4", "a7a8q", "h2h1n", "a1h8"]:
+        assert decode_move(encode_move(chess.Move.from_uci(uci))) == chess.Move.from_uci(uci)
+
+
+def test_get_moves(filename: str):
+    index = OpeningExplorerIndex(lambda: filename)
+    assert index.get_moves(chess.Board()) == []
+
+    index.set_counts(get_counts((["e2e4", "e7e5"], WHITE_WINS), (["e2e4", "c7c5"], BLACK_WINS), (["d2d4"], DRAW), (["e2e4"], DRAW)))
+    moves = index.get_moves(chess.Board())
+    assert [(m.move.uci(), m.white_wins, m.draws, m.black_wins, m.games) for m in moves] == [("e2e4", 1, 1, 1, 3), ("d2d4", 0, 1, 0, 1)]
+
+    board = chess.Board()
+    board.push_uci("e2e4")
+    assert sorted(m.move.uci() for m in index.get_moves(board)) == ["c7c5", "e7e5"]
+    board.push_uci("e7e5")
+    assert index.get_moves(board) == []
+
+    # Verify variants aren't looked up, as positions are only indexed from standard games
+    assert index.get_moves(chess.variant.AtomicBoard()) == []
+    assert len(index) == 4
+
+
+def test_hash_collisions(filename: str):
+    # Verify positions sharing a hash table slot are found by probing
+    index = OpeningExplorerIndex(lambda: filename)
+    index.set_counts(Counter({(8, 1, DRAW): 1, (16, 2, DRAW): 1, (8 + 16 * 2, 3, WHITE_WINS): 2, (9, 4, BLACK_WINS): 1}))
+    assert index._find_slot(8) != index._find_slot(16) != index._find_slot(40)
+    assert [index._moves[index._slot_starts[index._find_slot(key)]] for key in [8, 16, 40, 9]] == [1, 2, 3, 4]
+    assert index._find_slot(24) is None
+
+
+def test_save_and_load(filename: str):
+    index = OpeningExplorerIndex(lambda: filename)
+    index.set_counts(get_counts((["e2e4", "e7e5"], WHITE_WINS), (["g1f3"], DRAW)))
+    index.save()
+
+    loaded_index = OpeningExplorerIndex(lambda: filename)
+    assert loaded_index.get_moves(chess.Board()) == index.get_moves(chess.Board())
+    assert len(loaded_index) == 3
+
+    # Verify invalid index files are ignored
+    with open(filename, "r+b") as index_file:
+        index_file.write(b"XXXX")
+    loaded_index.reload()
+    assert loaded_index.get_moves(chess.Board()) == []
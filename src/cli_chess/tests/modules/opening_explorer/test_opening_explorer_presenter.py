@@ -0,0 +1,52 @@
+from cli_chess.modules.opening_explorer import OpeningExplorerModel, OpeningExplorerPresenter, ExplorerMove
+from cli_chess.modules.board import BoardModel
+from unittest.mock import Mock, patch
+import chess
+import pytest
+
+
+@pytest.fixture
+def opening_explorer_index():
+    index = Mock()
+    index.get_moves.return_value = [ExplorerMove(chess.Move.from_uci("e2e4"), 60, 20, 20), ExplorerMove(chess.Move.from_uci("d2d4"), 0, 100, 0)]
+    with patch("cli_chess.modules.opening_explorer.opening_explorer_model.opening_explorer_index", index):
+        yield index
+
+
+@pytest.fixture
+def model(opening_explorer_index):
+    return OpeningExplorerModel(BoardModel())
+
+
+@pytest.fixture
+def presenter(model: OpeningExplorerModel):
+    with patch("cli_chess.modules.opening_explorer.opening_explorer_presenter.repaint_ui"):
+        yield OpeningExplorerPresenter(model)
+
+
+def test_toggle_opening_explorer(model: OpeningExplorerModel, presenter: OpeningExplorerPresenter, opening_explorer_index: Mock):
+    # Verify the position is only looked up while the explorer is enabled
+    model.board_model.make_move("e4")
+    opening_explorer_index.get_moves.assert_not_called()
+
+    presenter.toggle_opening_explorer()
+    assert model.is_enabled() and presenter.view.visible
+    model.board_model.make_move("e5")
+    assert opening_explorer_index.get_moves.call_count == 2
+    assert opening_explorer_index.get_moves.call_args.args[0].fen() == model.board_model.board.fen()
+
+    presenter.toggle_opening_explorer()
+    assert not model.is_enabled() and not presenter.view.visible
+
+
+def test_get_formatted_lines(model: OpeningExplorerModel, presenter: OpeningExplorerPresenter, opening_explorer_index: Mock):
+    model.enable()
+    assert presenter.get_formatted_lines() == [
+        "Opening explorer • 200 games",
+        "e4            100   50%   60% / 20% / 20%",
+        "d4            100   50%   0% / 100% / 0%",
+    ]
+
+    opening_explorer_index.get_moves.return_value = []
+    model.update()
+    assert presenter.get_formatted_lines() == ["Opening explorer • No games in this position"]
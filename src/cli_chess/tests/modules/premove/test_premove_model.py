@@ -0,0 +1,89 @@
+from cli_chess.modules.premove import PremoveModel
+from cli_chess.modules.premove.premove_model import MAX_PREMOVES
+from cli_chess.modules.board import BoardModel
+from cli_chess.utils import EventTopics
+from chess import Move
+from unittest.mock import Mock
+import pytest
+
+
+@pytest.fixture
+def model_listener():
+    return Mock()
+
+
+@pytest.fixture()
+def model(model_listener: Mock):
+    board_model = BoardModel()
+    board_model.make_move("e4")
+    model = PremoveModel(board_model)
+    model.e_premove_model_updated.add_listener(model_listener)
+    return model
+
+
+def test_set_premove(model: PremoveModel, model_listener: Mock):
+    # Test premoves are queued and validated against the position after the premoves before them
+    model.set_premove("Nf3")
+    model.set_premove("Bc4")
+    model.set_premove("O-O")
+    assert model.premoves == ["Nf3", "Bc4", "O-O"]
+    assert model.premove == "Nf3"
+    assert model.board_model.premove_highlights == [Move.from_uci("g1f3"), Move.from_uci("f1c4"), Move.from_uci("e1g1")]
+    model_listener.assert_called()
+
+    # Test invalid premoves are refused
+    with pytest.raises(ValueError, match="Invalid premove"):
+        model.set_premove("Zz9")
+    with pytest.raises(Warning):
+        model.set_premove("")
+    assert model.premoves == ["Nf3", "Bc4", "O-O"]
+
+    # Test premoves which depend on the opponents reply are allowed, but end the validated chain
+    model.set_premove("Nd5")
+    model.set_premove("Qh5")
+    assert model.premoves[-2:] == ["Nd5", "Qh5"]
+    assert len(model.board_model.premove_highlights) == 3
+
+    # Test the queue size is limited
+    model.clear_premove()
+    for _ in range(MAX_PREMOVES):
+        model.set_premove("a3")
+    with pytest.raises(Warning):
+        model.set_premove("a3")
+
+
+def test_pop_premove(model: PremoveModel, model_listener: Mock):
+    model.set_premove("Nf3")
+    model.set_premove("Bc4")
+    model_listener.reset_mock()
+
+    # Test popping returns the next premove and revalidates the rest in the new position
+    model.board_model.make_move("e5")
+    model.board_model.make_move(model.premove)
+    assert model.pop_premove() == "Nf3"
+    assert model.premoves == ["Bc4"]
+    assert model.board_model.premove_highlights == [Move.from_uci("f1c4")]
+    model_listener.assert_called()
+
+    # Test the highlights follow the new position
+    model.board_model.make_move("Nc6")
+    model.set_premove("Nxe5")
+    model.board_model.make_move(model.premove)
+    assert model.pop_premove() == "Bc4"
+    assert model.premoves == ["Nxe5"]
+    assert model.board_model.premove_highlights == [Move.from_uci("f3e5")]
+    model.clear_premove()
+    assert model.pop_premove() == ""
+
+
+def test_clear_premove(model: PremoveModel):
+    model.set_premove("Nf3")
+    model.set_premove("Nc3")
+    model.clear_premove()
+    assert model.premoves == [] and model.premove == ""
+    assert model.board_model.premove_highlights == []
+
+    # Test the queue is cleared when the game ends
+    model.set_premove("Nf3")
+    model.update(EventTopics.GAME_END)
+    assert model.premoves == []
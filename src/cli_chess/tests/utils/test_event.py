@@ -1,4 +1,5 @@
-from cli_chess.utils import Event, EventManager
+from cli_chess.utils import Event, EventManager, EventTopics
+from cli_chess.utils.event import event_stats
 from unittest.mock import Mock
 import pytest
 
@@ -77,6 +78,68 @@ class TestEvent:
         listener1.assert_not_called()
         listener2.assert_not_called()
 
+    def test_topic_filtered_listener(self, event: Event, listener1: Mock, listener2: Mock):
+        event.add_listener(listener2, topics=[EventTopics.GAME_END])
+
+        event.notify(EventTopics.MOVE_MADE)
+        listener1.assert_called_with(EventTopics.MOVE_MADE)
+        listener2.assert_not_called()
+
+        event.notify()
+        listener2.assert_not_called()
+
+        event.notify(EventTopics.MOVE_MADE, EventTopics.GAME_END, data={})
+        listener2.assert_called_once_with(EventTopics.MOVE_MADE, EventTopics.GAME_END, data={})
+
+        # Test re-adding the listener without topics removes the filter
+        listener2.reset_mock()
+        event.add_listener(listener2)
+        event.notify()
+        listener2.assert_called_once()
+        assert event.listeners.count(listener2) == 1
+
+    def test_coalesced_notify(self, listener1: Mock, monkeypatch):
+        # Test notifications are dispatched immediately while the UI isn't running
+        event = Event(coalesce=True)
+        event.add_listener(listener1)
+        event.notify(EventTopics.MOVE_MADE)
+        listener1.assert_called_once_with(EventTopics.MOVE_MADE)
+
+        # Test a burst of notifications is merged into a single dispatch per frame
+        app = Mock(is_running=True)
+        monkeypatch.setattr("cli_chess.utils.event.get_app_or_none", lambda: app)
+        listener1.reset_mock()
+        coalesced = event_stats.notifications_coalesced
+        event.notify(EventTopics.MOVE_MADE, msg="first")
+        event.notify(EventTopics.GAME_END, msg="second")
+        event.notify(EventTopics.MOVE_MADE)
+        listener1.assert_not_called()
+        app.loop.call_soon_threadsafe.assert_called_once_with(event.flush)
+        assert event_stats.notifications_coalesced - coalesced == 2
+
+        event.flush()
+        listener1.assert_called_once_with(EventTopics.MOVE_MADE, EventTopics.GAME_END, msg="second")
+
+        # Test flushing without a pending notification
+        listener1.reset_mock()
+        event.flush()
+        listener1.assert_not_called()
+
+    def test_event_stats(self, event: Event, listener2: Mock):
+        event.add_listener(listener2, topics=[EventTopics.GAME_END])
+        event_stats.end_frame()
+
+        event.notify(EventTopics.MOVE_MADE)
+        event.notify(EventTopics.GAME_END)
+        assert event_stats.frame_events_fired == 2
+        assert event_stats.frame_listeners_invoked == 3
+
+        event_stats.end_frame()
+        assert event_stats.last_frame_events_fired == 2
+        assert event_stats.last_frame_listeners_invoked == 3
+        assert event_stats.frame_events_fired == 0
+        assert event_stats.frame_listeners_invoked == 0
+
 
 class TestEventManager:
     def test_create_event(self, event_manager: EventManager, listener1: Mock):
@@ -86,6 +149,10 @@ class TestEventManager:
         assert len(event_manager._event_list) - initial_len == 1
         assert isinstance(event_manager._event_list[-1], Event)
 
+    def test_create_coalescing_event(self, event_manager: EventManager):
+        assert not event_manager.create_event().coalesce
+        assert event_manager.create_event(coalesce=True).coalesce
+
     def test_purge_all_event_listeners(self, event_manager: EventManager, listener2: Mock):
         event_manager.create_event().add_listener(listener2)
         assert len(event_manager._event_list) == 2
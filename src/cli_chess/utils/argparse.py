@@ -1,6 +1,7 @@
 import argparse
 from cli_chess.utils.logging import log, redact_from_logs
 from cli_chess.utils.config import get_config_path
+from cli_chess.utils.pgn import get_pgn_save_dir
 from cli_chess.core.api import required_token_scopes
 from importlib.metadata import metadata
 
@@ -62,5 +63,92 @@ def setup_argparse() -> ArgumentParser:
         help="Prints the cli-chess configuration file to the terminal and exits.",
         action="store_true"
     )
+    debug_group.add_argument(
+        "--benchmark-engine",
+        help="Prints the average engine think time for each computer level and exits.",
+        action="store_true"
+    )
+
+    analysis_group = parser.add_argument_group("analysis")
+    analysis_group.description = "Annotates saved games with engine evaluations and mistakes, then exits."
+    analysis_group.add_argument(
+        "--analyze",
+        metavar="PATH",
+        help=f"The PGN file or directory of PGN files to analyze. Defaults to the saved games directory ({get_pgn_save_dir()}).",
+        nargs="?",
+        const=get_pgn_save_dir(),
+        type=str
+    )
+    analysis_group.add_argument(
+        "--analyze-depth",
+        metavar="DEPTH",
+        help="The engine search depth for each position.",
+        type=int
+    )
+    analysis_group.add_argument(
+        "--analyze-workers",
+        metavar="WORKERS",
+        help="The number of engine processes to analyze with. Defaults to the CPU count.",
+        type=int
+    )
+
+    self_play_group = parser.add_argument_group("self-play")
+    self_play_group.description = "Plays engine vs engine games without the user interface, saves the games as PGN and exits."
+    self_play_group.add_argument(
+        "--self-play",
+        metavar="GAMES",
+        help="The number of games to play between the two self-play engines.",
+        type=int
+    )
+    self_play_group.add_argument(
+        "--self-play-engines",
+        metavar="ENGINE",
+        help="The two engine configurations to play (e.g. level:3 elo:1800).",
+        nargs=2,
+        default=["level:1", "level:8"],
+        type=str
+    )
+    self_play_group.add_argument(
+        "--self-play-variant",
+        metavar="VARIANT",
+        help="The variant to play (e.g. standard, crazyhouse, chess960).",
+        default="standard",
+        type=str
+    )
+    self_play_group.add_argument(
+        "--self-play-fen",
+        metavar="FEN",
+        help="The FEN of the position to start each game from.",
+        default="",
+        type=str
+    )
+    self_play_group.add_argument(
+        "--self-play-output",
+        metavar="PGN_FILE",
+        help="The file to save the games to. Defaults to a new file in the saved games directory.",
+        type=str
+    )
+    self_play_group.add_argument(
+        "--self-play-workers",
+        metavar="WORKERS",
+        help="The number of games to play in parallel. Defaults to the CPU count.",
+        type=int
+    )
+
+    explorer_group = parser.add_argument_group("opening explorer")
+    explorer_group.description = "Builds the opening explorer from the saved games and any other PGN files, then exits."
+    explorer_group.add_argument(
+        "--build-explorer",
+        metavar="PATH",
+        help="Additional PGN files or directories of PGN files (e.g. a database download) to include.",
+        nargs="*",
+        type=str
+    )
+    explorer_group.add_argument(
+        "--explorer-workers",
+        metavar="WORKERS",
+        help="The number of processes to parse large PGN files with. Defaults to the CPU count.",
+        type=int
+    )
 
     return parser
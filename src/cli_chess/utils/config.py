@@ -305,6 +305,35 @@ class TerminalConfig(SectionBase):
         self.e_program_config_updated.notify()
 
 
+class EngineConfig(SectionBase):
+    """Creates and manages the "engine" configuration. This configuration can
+       either live in its own file, or be appended as a section by using a
+       configuration filename that already exists (such as DEFAULT_CONFIG_FILENAME).
+       By default, this will be appended to the default configuration.
+    """
+    class Keys(Enum):
+        OPENING_BOOK_PATH = "opening_book_path"
+        SYZYGY_PATH = "syzygy_path"
+
+        @property
+        def default_value(self):
+            """Returns the default value for the key"""
+            default_lookup = {
+                self.OPENING_BOOK_PATH: "",
+                self.SYZYGY_PATH: "",
+            }
+            return default_lookup[self]
+
+    def __init__(self, filename: str = DEFAULT_CONFIG_FILENAME):
+        self.e_engine_config_updated = Event()
+        super().__init__(section_name="engine", section_keys=self.Keys, filename=filename)
+
+    def write_config(self) -> None:
+        """Writes to the configuration file"""
+        super().write_config()
+        self.e_engine_config_updated.notify()
+
+
 class LichessConfig(SectionBase):
     """Creates and manages the "lichess" configuration. This configuration can
        either live in its own file, or be appended as a section by using a
@@ -345,4 +374,5 @@ class LichessConfig(SectionBase):
 player_info_config = PlayerInfoConfig()
 game_config = GameConfig()
 terminal_config = TerminalConfig()
+engine_config = EngineConfig()
 lichess_config = LichessConfig()
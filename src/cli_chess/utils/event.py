@@ -1,6 +1,9 @@
 from __future__ import annotations
+from prompt_toolkit.application.current import get_app_or_none
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, List
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+import threading
 
 
 class EventTopics(Enum):
@@ -14,33 +17,121 @@ class EventTopics(Enum):
     ERROR = auto()
 
 
+@dataclass
+class EventStats:
+    """Event dispatch counters. The frame counters are rolled over
+       into the last frame counters each time a UI frame is rendered
+    """
+    events_fired: int = 0
+    listeners_invoked: int = 0
+    notifications_coalesced: int = 0
+    frame_events_fired: int = 0
+    frame_listeners_invoked: int = 0
+    last_frame_events_fired: int = 0
+    last_frame_listeners_invoked: int = 0
+
+    def end_frame(self) -> None:
+        """Marks the end of a UI frame by rolling over the frame counters"""
+        self.last_frame_events_fired = self.frame_events_fired
+        self.last_frame_listeners_invoked = self.frame_listeners_invoked
+        self.frame_events_fired = 0
+        self.frame_listeners_invoked = 0
+
+
+event_stats = EventStats()
+
+
 class Event:
     """Event notification class. This class creates a singular event instance
        which listeners can subscribe to with a callable. The callable will be
        notified when the event is triggered (using notify()). Generally, this
        class should not be instantiated directly, but rather from the EventManager class.
+       A coalescing event merges a burst of notifications sent while the UI is running
+       into a single notification which is dispatched once per UI frame. Coalescing
+       should only be used for events whose listeners pull the latest state when notified.
     """
-    def __init__(self):
+    def __init__(self, coalesce: bool = False):
         self.listeners = []
+        self.coalesce = coalesce
+        self._listener_topics: Dict[Callable, FrozenSet[Enum]] = {}
+        self._pending_notification: Optional[Tuple[List, Dict]] = None
+        self._pending_lock = threading.Lock()
 
-    def add_listener(self, listener: Callable) -> None:
-        """Adds the passed in listener to the notification list"""
+    def add_listener(self, listener: Callable, topics: Optional[Iterable[Enum]] = None) -> None:
+        """Adds the passed in listener to the notification list. If topics are passed
+           in, the listener is only notified of events containing at least one of them
+        """
         if listener not in self.listeners:
             self.listeners.append(listener)
 
+        if topics:
+            self._listener_topics[listener] = frozenset(topics)
+        else:
+            self._listener_topics.pop(listener, None)
+
     def remove_listener(self, listener: Callable) -> None:
         """Removes the passed in listener from the notification list"""
         if listener in self.listeners:
             self.listeners.remove(listener)
+        self._listener_topics.pop(listener, None)
 
     def remove_all_listeners(self) -> None:
         """Removes all listeners associated to this event"""
         self.listeners.clear()
+        self._listener_topics.clear()
 
     def notify(self, *args, **kwargs) -> None:
         """Notifies all listeners of the event"""
+        event_stats.events_fired += 1
+        event_stats.frame_events_fired += 1
+
+        if self.coalesce and self._queue_coalesced_notification(args, kwargs):
+            return
+
+        self._dispatch(*args, **kwargs)
+
+    def flush(self) -> None:
+        """Dispatches the pending coalesced notification (if any)"""
+        with self._pending_lock:
+            pending_notification = self._pending_notification
+            self._pending_notification = None
+
+        if pending_notification:
+            args, kwargs = pending_notification
+            self._dispatch(*args, **kwargs)
+
+    def _dispatch(self, *args, **kwargs) -> None:
+        """Calls each listener subscribed to the passed in topics"""
         for listener in self.listeners:
-            listener(*args, **kwargs)
+            topics = self._listener_topics.get(listener)
+            if topics is None or not topics.isdisjoint(args):
+                event_stats.listeners_invoked += 1
+                event_stats.frame_listeners_invoked += 1
+                listener(*args, **kwargs)
+
+    def _queue_coalesced_notification(self, args: tuple, kwargs: dict) -> bool:
+        """Merges the notification into the pending notification and schedules it to be
+           dispatched on the UI event loop. Returns False if the UI is not running, in which
+           case the notification must be dispatched immediately.
+        """
+        app = get_app_or_none()
+        if app is None or not app.is_running or app.loop is None:
+            return False
+
+        with self._pending_lock:
+            schedule_flush = self._pending_notification is None
+            if schedule_flush:
+                self._pending_notification = ([], {})
+            else:
+                event_stats.notifications_coalesced += 1
+
+            pending_args, pending_kwargs = self._pending_notification
+            pending_args.extend(arg for arg in args if arg not in pending_args)
+            pending_kwargs.update(kwargs)
+
+        if schedule_flush:
+            app.loop.call_soon_threadsafe(self.flush)
+        return True
 
 
 class EventManager:
@@ -50,9 +141,11 @@ class EventManager:
     def __init__(self):
         self._event_list: List[Event] = []
 
-    def create_event(self) -> Event:
-        """Creates and returns a new event for listeners to subscribe to"""
-        e = Event()
+    def create_event(self, coalesce: bool = False) -> Event:
+        """Creates and returns a new event for listeners to subscribe to.
+           See the Event class for details on coalescing events.
+        """
+        e = Event(coalesce)
         self._event_list.append(e)
         return e
 
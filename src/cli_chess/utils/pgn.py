@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 _STANDARD_START_FEN = chess.STARTING_FEN
 _FILENAME_SAFE = re.compile(r"[^A-Za-z0-9._-]+")
+ANNOTATED_SUFFIX = ".annotated.pgn"
 
 
 def get_pgn_save_dir() -> str: